@@ -46,26 +46,42 @@ for dependency, reason in soft_dependencies.items():
 del util
 del dependency, hard_dependencies, soft_dependencies, missing_dependencies
 
-# Data
+# Data, loaded when first accessed
 from pygaps.data import DATABASE
 from pygaps.data import ADSORBATE_LIST
 from pygaps.data import MATERIAL_LIST
-from pygaps.data import load_data
 
 # Thermodynamic backend
 from pygaps.utilities.coolprop_utilities import thermodynamic_backend
 from pygaps.utilities.coolprop_utilities import backend_use_coolprop
 from pygaps.utilities.coolprop_utilities import backend_use_refprop
+from pygaps.utilities.coolprop_utilities import backend_use_tables
 
 # Core classes
 from pygaps.core.adsorbate import Adsorbate
 from pygaps.core.material import Material
-from pygaps.core.pointisotherm import PointIsotherm
-from pygaps.core.modelisotherm import ModelIsotherm
 
-# Data load
-load_data()
-del load_data
+# Isotherm classes require pandas and scipy, so are imported when first used
+_lazy_imports = {
+    'PointIsotherm': 'pygaps.core.pointisotherm',
+    'ModelIsotherm': 'pygaps.core.modelisotherm',
+    'IsothermCollection': 'pygaps.core.isothermcollection',
+}
+
+
+def __getattr__(name):
+    """Import isotherm classes on first access."""
+    module = _lazy_imports.get(name)
+    if module is None:
+        raise AttributeError(f"module 'pygaps' has no attribute '{name}'")
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
 
 # Other user-facing functions
 # from .api import *
@@ -18,6 +18,7 @@ from .enth_sorp_whittaker import enthalpy_sorption_whittaker_raw
 from .initial_henry import initial_henry_slope
 from .initial_henry import initial_henry_virial
 from .psd_kernel import psd_dft
+from .psd_kernel import psd_dft_batch
 from .psd_meso import psd_mesoporous
 from .psd_micro import psd_microporous
 from .t_plots import t_plot
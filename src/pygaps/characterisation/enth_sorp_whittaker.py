@@ -288,7 +288,7 @@ def vaporisation_enthalpy(
     ----------
     adsorbate: Adsorbate,
         Adsorbate for which to determine the vaporisiation enthalpy
-    pressure: float,
+    pressure: float or array,
         Pressure, in Pa at which to determine vaporisation enthalpy
     p_c: float,
         Critical pressure of the adsorbate, in Pa.
@@ -299,10 +299,19 @@ def vaporisation_enthalpy(
     ------
     adsorbate.enthalpy_vaporisation() in J/mol if possible, np.nan if not
     """
-    if np.isnan(pressure) or pressure <= 0 or pressure > p_c or pressure > p_sat:
-        return np.nan
-    # return in J/mol
-    return adsorbate.enthalpy_vaporisation(press=pressure) * 1000
+    pressure = np.asarray(pressure, dtype=float)
+    valid = _valid_pressure(pressure, p_c, p_sat)
+    if not pressure.ndim:
+        if not valid:
+            return np.nan
+        # return in J/mol
+        return adsorbate.enthalpy_vaporisation(press=pressure) * 1000
+
+    # All state points are calculated in a single call
+    hvap = np.full(pressure.shape, np.nan)
+    if valid.any():
+        hvap[valid] = adsorbate.enthalpy_vaporisation(press=pressure[valid]) * 1000
+    return hvap
 
 
 def compressibility(
@@ -320,7 +329,7 @@ def compressibility(
     ----------
     adsorbate: Adsorbate,
         Adsorbate for which to determine the compressibility.
-    pressure: float,
+    pressure: float or array,
         Pressure, in Pa at which to determine compressibility.
     temperature: float,
         Isotherm temperature in K.
@@ -333,9 +342,24 @@ def compressibility(
     ------
     `adsorbate.compressibility()` if possible, np.nan if not
     """
-    if np.isnan(pressure) or pressure <= 0 or pressure > p_c or pressure > p_sat:
-        return np.nan
-    return adsorbate.compressibility(temp=temperature, pressure=pressure)
+    pressure = np.asarray(pressure, dtype=float)
+    valid = _valid_pressure(pressure, p_c, p_sat)
+    if not pressure.ndim:
+        if not valid:
+            return np.nan
+        return adsorbate.compressibility(temp=temperature, pressure=pressure)
+
+    # All state points are calculated in a single call
+    z_factor = np.full(pressure.shape, np.nan)
+    if valid.any():
+        z_factor[valid] = adsorbate.compressibility(temp=temperature, pressure=pressure[valid])
+    return z_factor
+
+
+def _valid_pressure(pressure, p_c: float, p_sat: float):
+    """Pressures at which vaporisation enthalpy and compressibility can be calculated."""
+    with np.errstate(invalid='ignore'):
+        return ~np.isnan(pressure) & (pressure > 0) & (pressure <= p_c) & (pressure <= p_sat)
 
 
 def stderr_estimate(
@@ -414,8 +438,9 @@ def enthalpy_sorption_whittaker_raw(
     pressure = [pressure_at(model_isotherm, n) for n in loading]
 
     epsilon = [toth_adsorption_potential(model_isotherm, p, p_sat, RT) for p in pressure]
-    hvap = [vaporisation_enthalpy(adsorbate, max(p, p_t), p_c, p_sat) for p in pressure]
-    Zfactor = [compressibility(adsorbate, p, T, p_c, p_sat) for p in pressure]
+    pressure = np.asarray(pressure, dtype=float)
+    hvap = vaporisation_enthalpy(adsorbate, np.maximum(pressure, p_t), p_c, p_sat)
+    Zfactor = compressibility(adsorbate, pressure, T, p_c, p_sat)
 
     # Sum adsorption potential, vaporisation enthalpy, ZRT
     return [
@@ -7,21 +7,19 @@ scope of this program.
 from typing import TYPE_CHECKING
 
 import numpy
-import pandas
-from scipy import interpolate
 from scipy import optimize
 
 if TYPE_CHECKING:
     from pygaps.core.modelisotherm import ModelIsotherm
     from pygaps.core.pointisotherm import PointIsotherm
 
-from pygaps.data import KERNELS
+from pygaps.utilities.dft_kernels import get_kernel
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.math_utilities import bspline
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
 
-_LOADED = {}  # We will keep loaded kernels here
+_REGULARISATION_METHODS = ['gcv', 'l-curve']
 
 
 def psd_dft(
@@ -31,7 +29,8 @@ def psd_dft(
     p_limits: "tuple[float, float]" = None,
     kernel_units: dict = None,
     bspline_order: int = 2,
-    verbose: bool = False
+    verbose: bool = False,
+    regularisation: "float | str" = None,
 ):
     """
     Calculate the pore size distribution using a DFT kernel from an Isotherm.
@@ -41,7 +40,8 @@ def psd_dft(
     isotherm : PointIsotherm, ModelIsotherm
         The isotherm for which the pore size distribution will be calculated.
     kernel : str
-        The name of the kernel, or the path where it can be found.
+        The name of the kernel, or the path where it can be found, in .csv or
+        binary .npz format.
     branch : {'ads', 'des'}, optional
         Branch of the isotherm to use. It defaults to adsorption.
     p_limits : [float, float]
@@ -55,6 +55,10 @@ def psd_dft(
         and "pressure_unit". Defaults to mmol/g vs. relative pressure.
     verbose : bool
         Prints out extra information on the calculation and graphs the results.
+    regularisation : float or str, optional
+        Tikhonov regularisation of the fit, either a value or the method used to
+        select it, 'gcv' or 'l-curve'. Defaults to no regularisation. See
+        :func:`~pygaps.characterisation.psd_kernel.psd_dft_kernel_fit`.
 
     Raises
     ------
@@ -108,6 +112,12 @@ def psd_dft(
         ...,...,...,...,...
         px,l1x,l2x,...,lyz
 
+    Large kernels are faster to load in a binary format, to which they can be
+    converted with :func:`~pygaps.utilities.dft_kernels.convert_kernel`.
+    Kernels are found by name in ``pygaps.data.KERNELS``, or as files in the
+    directories of ``pygaps.data.KERNEL_DIRECTORIES``, which include those
+    in the ``PYGAPS_KERNELS`` environment variable.
+
     The kernel should have sufficient points for a good interpolation as well as
     have a range of pressures that is wide enough to cover possible experimental
     values.
@@ -125,6 +135,7 @@ def psd_dft(
     See Also
     --------
     pygaps.characterisation.psd_kernel.psd_dft_kernel_fit : backend function for DFT kernel fitting
+    pygaps.characterisation.psd_kernel.psd_dft_batch : pore size distributions of many isotherms
 
     References
     ----------
@@ -141,53 +152,11 @@ def psd_dft(
             "An existing kernel name or a path to a user kernel to be used must be specified."
         )
 
-    # Get an internal kernel, otherwise assume it is a path
-    kernel_path = KERNELS.get(kernel, kernel)
-
-    # Get units
-    if kernel_units is None:
-        kernel_units = {}
-
-    loading_basis = kernel_units.get('loading_basis', 'molar')
-    loading_unit = kernel_units.get('loading_unit', 'mmol')
-    material_basis = kernel_units.get('material_basis', 'mass')
-    material_unit = kernel_units.get('material_unit', 'g')
-    pressure_mode = kernel_units.get('pressure_mode', 'relative')
-    pressure_unit = kernel_units.get('pressure_unit', None)
-
     # Read data in
-    pressure, loading = get_iso_loading_and_pressure_ordered(
-        isotherm, branch, {
-            "loading_basis": loading_basis,
-            "loading_unit": loading_unit,
-            "material_basis": material_basis,
-            "material_unit": material_unit,
-        }, {
-            "pressure_mode": pressure_mode,
-            "pressure_unit": pressure_unit,
-        }
+    pressure, loading, (minimum, maximum), units = _kernel_isotherm_data(
+        isotherm, branch, p_limits, kernel_units
     )
 
-    # select the maximum and minimum of the points and the pressure associated
-    minimum = 0
-    maximum = len(pressure) - 1  # As we want absolute position
-
-    # Set default values
-    if p_limits is None:
-        p_limits = (None, None)
-
-    if p_limits[0]:
-        minimum = numpy.searchsorted(pressure, p_limits[0])
-    if p_limits[1]:
-        maximum = numpy.searchsorted(pressure, p_limits[1]) - 1
-    if maximum - minimum < 2:  # (for 3 point minimum)
-        raise CalculationError(
-            "The isotherm does not have enough points (at least 3) "
-            "in the selected region."
-        )
-    pressure = pressure[minimum:maximum + 1]
-    loading = loading[minimum:maximum + 1]
-
     # Call the DFT function
     (
         pore_widths,
@@ -197,8 +166,9 @@ def psd_dft(
     ) = psd_dft_kernel_fit(
         pressure,
         loading,
-        kernel_path,
+        kernel,
         bspline_order,
+        regularisation,
     )  # mmol/g
 
     if verbose:
@@ -206,12 +176,7 @@ def psd_dft(
             'branch': branch,
             'logx': True,
             'lgd_keys': ['material'],
-            'loading_basis': loading_basis,
-            'loading_unit': loading_unit,
-            'material_basis': material_basis,
-            'material_unit': material_unit,
-            'pressure_mode': pressure_mode,
-            'pressure_unit': pressure_unit,
+            **units,
         }
         from pygaps.graphing.isotherm_graphs import plot_iso
         ax = plot_iso(isotherm, **params)
@@ -234,11 +199,124 @@ def psd_dft(
     }
 
 
+def psd_dft_batch(
+    isotherms: "list[PointIsotherm | ModelIsotherm]",
+    kernel: str = 'DFT-N2-77K-carbon-slit',
+    branch: str = 'ads',
+    p_limits: "tuple[float, float]" = None,
+    kernel_units: dict = None,
+    bspline_order: int = 2,
+    regularisation: "float | str" = None,
+):
+    """
+    Calculate the pore size distributions of several isotherms using a DFT kernel.
+
+    Isotherms measured at the same pressures, such as on the same instrument
+    pressure table, are fit together: the kernel is only interpolated and
+    factorised once for each set of pressures.
+
+    Parameters
+    ----------
+    isotherms : list[PointIsotherm, ModelIsotherm]
+        The isotherms for which the pore size distributions will be calculated.
+    kernel : str
+        The name of the kernel, or the path where it can be found.
+    branch : {'ads', 'des'}, optional
+        Branch of the isotherms to use. It defaults to adsorption.
+    p_limits : [float, float]
+        Pressure range in which to calculate PSD, defaults to entire isotherm.
+    kernel_units : dict
+        A dictionary specifying kernel basis and units, see
+        :func:`~pygaps.characterisation.psd_kernel.psd_dft`.
+    bspline_order : int
+        The smoothing order of the b-splines fit to the data.
+        If set to 0, data will be returned as-is.
+    regularisation : float or str, optional
+        Tikhonov regularisation of the fit, either a value or the method used to
+        select it for each isotherm, 'gcv' or 'l-curve'.
+
+    Returns
+    -------
+    dict
+        A dictionary with the pore widths and the pore distributions, of the form:
+
+        - ``pore_widths`` (array) : the widths of the pores, common to all isotherms
+        - ``pore_distribution`` (array) : the pore distribution of each
+          isotherm, one per row
+        - ``pore_volume_cumulative`` (array) : the cumulative pore volume of
+          each isotherm, one per row
+        - ``kernel_loading`` (list[array]) : the loading of the fitted kernel
+          at the pressures of each isotherm
+        - ``limits`` (list[tuple]) : the indices of the selected points of each isotherm
+
+    Raises
+    ------
+    ParameterError
+        When something is wrong with the function parameters.
+    CalculationError
+        When the calculation itself fails.
+
+    See Also
+    --------
+    pygaps.characterisation.psd_kernel.psd_dft : pore size distribution of a single isotherm
+
+    """
+    # Check kernel
+    if kernel is None:
+        raise ParameterError(
+            "An existing kernel name or a path to a user kernel to be used must be specified."
+        )
+    if not isotherms:
+        raise ParameterError("No isotherms were passed.")
+
+    # Read data in
+    data = [
+        _kernel_isotherm_data(isotherm, branch, p_limits, kernel_units) for isotherm in isotherms
+    ]
+
+    # Group the isotherms measured at the same pressures
+    groups = {}
+    for index, (pressure, *_) in enumerate(data):
+        key = numpy.ascontiguousarray(pressure, dtype='float64').tobytes()
+        groups.setdefault(key, []).append(index)
+
+    pore_dist = [None] * len(data)
+    pore_vol_cum = [None] * len(data)
+    kernel_loading = [None] * len(data)
+
+    for indices in groups.values():
+        (
+            pore_widths,
+            group_dist,
+            group_vol_cum,
+            group_loading,
+        ) = psd_dft_kernel_fit_batch(
+            data[indices[0]][0],
+            [data[index][1] for index in indices],
+            kernel,
+            bspline_order,
+            regularisation,
+        )  # mmol/g
+        for row, index in enumerate(indices):
+            pore_dist[index] = group_dist[row]
+            pore_vol_cum[index] = group_vol_cum[row]
+            kernel_loading[index] = group_loading[row]
+
+    return {
+        'pore_widths': pore_widths,
+        'pore_distribution': numpy.array(pore_dist),
+        'pore_volume_cumulative': numpy.array(pore_vol_cum),
+        'kernel_loading': kernel_loading,
+        'limits': [limits for _, _, limits, _ in data],
+    }
+
+
 def psd_dft_kernel_fit(
     pressure: "list[float]",
     loading: "list[float]",
     kernel_path: str,
     bspline_order: int = 2,
+    regularisation: "float | str" = None,
 ):
     r"""
     Fit a DFT kernel on experimental adsorption data.
@@ -250,10 +328,14 @@ def psd_dft_kernel_fit(
     pressure : array
         Relative pressure.
     kernel_path : str
-        The location of the kernel to use.
+        The name or location of the kernel to use.
     bspline_order : int
         The smoothing order of the b-splines fit to the data.
         If set to 0, data will be returned as-is.
+    regularisation : float or str, optional
+        The Tikhonov regularisation parameter, or the method used to select
+        it: generalised cross-validation ('gcv') or the L-curve ('l-curve').
+        Defaults to no regularisation.
 
     Returns
     -------
@@ -275,118 +357,245 @@ def psd_dft_kernel_fit(
 
         f(x) = \sum_{p=p_0}^{p=p_x} (n_{p,exp} - \sum_{w=w_0}^{w=w_y} n_{p, kernel} X_w )^2
 
-    The function is then minimised using the `scipy.optimise.minimise` module, with the
-    constraint that the contribution of each kernel isotherm cannot be negative.
+    Since the contribution of each kernel isotherm cannot be negative, this is a
+    non-negative least squares problem, solved with `scipy.optimize.nnls`.
+
+    Kernel isotherms of similar pores are nearly identical, so the fit can be
+    unstable and result in spiky distributions. Optionally, a Tikhonov term
+    :math:`\lambda^2 \sum_w X_w^2` can be added to the function, which penalises
+    large contributions. The fit remains a non-negative least squares problem of
+    the kernel matrix augmented by :math:`\lambda I`. The regularisation
+    parameter :math:`\lambda` can either be given, or selected among values
+    spanning the singular values of the kernel matrix, by minimising the
+    generalised cross-validation function ('gcv') or as the point of maximum
+    curvature of the L-curve of the solution norm versus the residual norm
+    ('l-curve').
 
     """
+    (
+        pore_widths,
+        pore_dist,
+        pore_vol_cum,
+        kernel_final_loading,
+    ) = psd_dft_kernel_fit_batch(
+        pressure,
+        [loading],
+        kernel_path,
+        bspline_order,
+        regularisation,
+    )
+
+    return pore_widths, pore_dist[0], pore_vol_cum[0], kernel_final_loading[0]
+
+
+def psd_dft_kernel_fit_batch(
+    pressure: "list[float]",
+    loadings: "list[list[float]]",
+    kernel_path: str,
+    bspline_order: int = 2,
+    regularisation: "float | str" = None,
+):
+    r"""
+    Fit a DFT kernel on several isotherms measured at the same pressures.
+
+    The kernel is interpolated and factorised only once, after which each
+    isotherm is fit as a small non-negative least squares problem, see
+    :func:`~pygaps.characterisation.psd_kernel.psd_dft_kernel_fit`.
+
+    Parameters
+    ----------
+    pressure : array
+        Relative pressure, common to all isotherms.
+    loadings : array
+        Adsorbed amount in mmol/g, with one row per isotherm.
+    kernel_path : str
+        The name or location of the kernel to use.
+    bspline_order : int
+        The smoothing order of the b-splines fit to the data.
+        If set to 0, data will be returned as-is.
+    regularisation : float or str, optional
+        The Tikhonov regularisation parameter, or the method used to select
+        it for each isotherm, 'gcv' or 'l-curve'.
+
+    Returns
+    -------
+    pore widths : array
+        The widths of the pores.
+    pore_dist : array
+        The distributions for each width (dV/dw), one row per isotherm.
+    pore_load_cum : array
+        Cumulative pore loading, one row per isotherm.
+    kernel_loading : array
+        The loading of the fitted kernel, one row per isotherm.
+
+    """
+    loadings = numpy.atleast_2d(numpy.asarray(loadings, dtype='float64'))
+
     # Check lengths
     if len(pressure) == 0:
         raise ParameterError("Empty input values!")
-    if len(pressure) != len(loading):
+    if loadings.shape[1] != len(pressure):
         raise ParameterError("The length of the pressure and loading arrays do not match.")
+    if isinstance(regularisation, str):
+        if regularisation not in _REGULARISATION_METHODS:
+            raise ParameterError(
+                f"Regularisation method {regularisation} not an option. "
+                f"Available methods are {_REGULARISATION_METHODS}"
+            )
+    elif regularisation is not None and regularisation < 0:
+        raise ParameterError("The regularisation parameter cannot be negative.")
 
     # get the interpolation kernel
-    kernel = _load_kernel(kernel_path)
+    kernel = get_kernel(kernel_path)
 
-    # generate the numpy arrays
+    # kernel matrix at the isotherm pressures, cached by the kernel
     try:
-        kernel_points = numpy.asarray([kernel[size](pressure) for size in kernel])
+        projection = kernel.projection(pressure)
     except ValueError as err:
         raise CalculationError(
             "Could not get kernel values at isotherm points. "
             "Does your kernel pressure range apply to this isotherm?"
         ) from err
-    pore_widths = numpy.asarray(list(kernel.keys()), dtype='float64')
-
-    # define the minimization function
-    def kernel_loading(pore_dist):
-        return numpy.multiply(
-            kernel_points,
-            pore_dist[:, numpy.newaxis]  # -> multiply each loading with its contribution
-        ).sum(axis=0)  # -> add the contributions together at each pressure
-
-    def sum_squares(pore_dist):
-        return numpy.square(  # -> square the difference
-            numpy.subtract(  # -> between calculated and isotherm
-                kernel_loading(pore_dist),
-                loading)).sum(axis=0)  # -> then sum the squares together
-
-    # define the constraints (x>0)
-    cons = [{
-        'type': 'ineq',
-        'fun': lambda x: x,
-    }]
-
-    # # run the optimisation algorithm
-    guess = numpy.array([0 for pore in pore_widths])
-    bounds = [(0, None) for pore in pore_widths]
-    result = optimize.minimize(
-        sum_squares,
-        guess,
-        method='SLSQP',
-        bounds=bounds,
-        constraints=cons,
-        options={'ftol': 1e-04}
-    )
 
-    if not result.success:
-        raise CalculationError(f"Minimization of DFT failed with error: {result.message}")
+    pore_load = numpy.array([
+        _kernel_fit(projection, loading, regularisation) for loading in loadings
+    ])
 
     # convert from preponderance to distribution
     # TODO double check variable naming
-    kernel_final_loading = kernel_loading(result.x)
-    pore_dist = result.x / numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
-    pore_widths, pore_dist = bspline(pore_widths, pore_dist, degree=bspline_order)
+    kernel_final_loading = pore_load @ projection.matrix.T
+    pore_widths = kernel.pore_widths
+    pore_dist = pore_load / numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
+
+    # smoothed widths only depend on the kernel widths
+    smoothed = [bspline(pore_widths, dist, degree=bspline_order) for dist in pore_dist]
+    pore_widths = smoothed[0][0]
+    pore_dist = numpy.array([dist for _, dist in smoothed])
     dpore_widths = numpy.ediff1d(pore_widths, to_begin=pore_widths[0])
-    pore_vol_cum = numpy.cumsum(pore_dist * dpore_widths)
+    pore_vol_cum = numpy.cumsum(pore_dist * dpore_widths, axis=1)
 
     return pore_widths, pore_dist, pore_vol_cum, kernel_final_loading
 
 
-def _load_kernel(path: str):
+def _kernel_isotherm_data(isotherm, branch, p_limits, kernel_units):
+    """Get the isotherm points to fit, in the kernel units and pressure range."""
+    # Get units
+    if kernel_units is None:
+        kernel_units = {}
+
+    units = {
+        'loading_basis': kernel_units.get('loading_basis', 'molar'),
+        'loading_unit': kernel_units.get('loading_unit', 'mmol'),
+        'material_basis': kernel_units.get('material_basis', 'mass'),
+        'material_unit': kernel_units.get('material_unit', 'g'),
+        'pressure_mode': kernel_units.get('pressure_mode', 'relative'),
+        'pressure_unit': kernel_units.get('pressure_unit', None),
+    }
+
+    # Read data in
+    pressure, loading = get_iso_loading_and_pressure_ordered(
+        isotherm, branch, {
+            "loading_basis": units['loading_basis'],
+            "loading_unit": units['loading_unit'],
+            "material_basis": units['material_basis'],
+            "material_unit": units['material_unit'],
+        }, {
+            "pressure_mode": units['pressure_mode'],
+            "pressure_unit": units['pressure_unit'],
+        }
+    )
+
+    # select the maximum and minimum of the points and the pressure associated
+    minimum = 0
+    maximum = len(pressure) - 1  # As we want absolute position
+
+    # Set default values
+    if p_limits is None:
+        p_limits = (None, None)
+
+    if p_limits[0]:
+        minimum = numpy.searchsorted(pressure, p_limits[0])
+    if p_limits[1]:
+        maximum = numpy.searchsorted(pressure, p_limits[1]) - 1
+    if maximum - minimum < 2:  # (for 3 point minimum)
+        raise CalculationError(
+            "The isotherm does not have enough points (at least 3) "
+            "in the selected region."
+        )
+    pressure = pressure[minimum:maximum + 1]
+    loading = loading[minimum:maximum + 1]
+
+    return pressure, loading, (minimum, maximum), units
+
+
+def _kernel_fit(projection, loading, regularisation=None):
+    """
+    Fit the kernel to an isotherm, as the least squares problem
+    reduced by the QR factorisation of the kernel matrix.
     """
-    Load a kernel from disk or from memory.
+    if isinstance(regularisation, str):
+        regularisation = _select_regularisation(projection, loading, regularisation)
 
-    Essentially takes a kernel stored as a pressure-loading
-    table, creates an interpolator for each
-    isotherm, then stores them as a dictionary of
-    pore-size keys to interpolator values.
+    return _kernel_nnls(projection.r, projection.q.T @ loading, regularisation)
 
-    Parameters
-    ----------
-    path : str
-        Path to the kernel to load in .csv form.
 
-    Returns
-    -------
-    dict
-        The kernel with its pore size components as keys.
+def _kernel_nnls(kernel_matrix, loading, regularisation=None):
     """
-    if path in _LOADED:
-        return _LOADED[path]
-
-    with open(path, encoding="utf8") as fp:
-        raw_kernel = pandas.read_csv(fp, index_col=0)
-
-    # add a 0 in the dataframe for interpolation between lowest values
-    raw_kernel = pandas.concat([
-        pandas.DataFrame(
-            [[0 for col in raw_kernel.columns]],
-            index=[0],
-            columns=raw_kernel.columns,
-        ),
-        raw_kernel,
-    ])
+    Find the non-negative contributions of each kernel isotherm.
 
-    kernel = {}
-    for pore_size in raw_kernel:
-        interpolator = interpolate.interp1d(
-            raw_kernel[pore_size].index, raw_kernel[pore_size].values, kind='cubic'
-        )
+    The Tikhonov regularisation is applied by augmenting
+    the kernel matrix with a scaled identity matrix.
+    """
+    if regularisation:
+        n_widths = kernel_matrix.shape[1]
+        kernel_matrix = numpy.vstack((kernel_matrix, regularisation * numpy.identity(n_widths)))
+        loading = numpy.concatenate((loading, numpy.zeros(n_widths)))
 
-        kernel.update({pore_size: interpolator})
+    try:
+        pore_load, _ = optimize.nnls(kernel_matrix, loading)
+    except RuntimeError as err:
+        raise CalculationError(f"Fitting of the DFT kernel failed with error: {err}") from err
+
+    return pore_load
 
-    # Save the kernel in memory
-    _LOADED[path] = kernel
 
-    return kernel
+def _select_regularisation(projection, loading, method, n_values=30):
+    """
+    Select the Tikhonov regularisation parameter of a kernel fit.
+
+    Candidate values span the singular values of the kernel matrix.
+    For generalised cross-validation, the effective number of fitted
+    parameters is estimated from the kernel isotherms which
+    contribute to each fit.
+    """
+    singular = projection.singular
+    candidates = numpy.geomspace(singular[0] * 1e-6, singular[0], n_values)
+
+    projected = projection.q.T @ loading
+    fits = [_kernel_nnls(projection.r, projected, value) for value in candidates]
+    residuals = numpy.array([numpy.linalg.norm(projection.matrix @ fit - loading) for fit in fits])
+
+    if method == 'gcv':
+        scores = []
+        for value, fit, residual in zip(candidates, fits, residuals):
+            singular = numpy.linalg.svd(projection.r[:, fit > 0], compute_uv=False)
+            dof = len(loading) - numpy.sum(singular**2 / (singular**2 + value**2))
+            scores.append(residual**2 / dof**2 if dof > 0 else numpy.inf)
+        return candidates[numpy.argmin(scores)]
+
+    # L-curve corner as the point of largest (Menger) curvature
+    tiny = numpy.finfo(float).tiny
+    norms = numpy.array([numpy.linalg.norm(fit) for fit in fits])
+    points = numpy.log(numpy.maximum(numpy.stack((residuals, norms), axis=1), tiny))
+
+    side_a = numpy.linalg.norm(points[1:-1] - points[:-2], axis=1)
+    side_b = numpy.linalg.norm(points[2:] - points[1:-1], axis=1)
+    side_c = numpy.linalg.norm(points[2:] - points[:-2], axis=1)
+    first, second = points[1:-1] - points[:-2], points[2:] - points[:-2]
+    area = first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        curvature = numpy.nan_to_num(2 * area / (side_a * side_b * side_c))
+
+    # residuals increase and norms decrease with regularisation,
+    # so the corner of the curve has a positive curvature
+    return candidates[numpy.argmax(curvature) + 1]
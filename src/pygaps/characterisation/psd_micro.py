@@ -3,25 +3,33 @@ This module contains 'classical' methods of calculating a pore size distribution
 pores in the micropore range (<2 nm). These are derived from the Horvath-Kawazoe models.
 """
 
-import math
+import hashlib
+import json
 from typing import TYPE_CHECKING
 
 import numpy
 from scipy import constants
-from scipy import optimize
+from scipy import interpolate
 
 if TYPE_CHECKING:
     from pygaps.core.modelisotherm import ModelIsotherm
     from pygaps.core.pointisotherm import PointIsotherm
 
+from pygaps import logger
 from pygaps.characterisation.models_hk import HK_KEYS
 from pygaps.characterisation.models_hk import get_hk_model
+from pygaps.data import HK_CURVES
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
 
 _MICRO_PSD_MODELS = ['HK', 'HK-CY', 'RY', 'RY-CY']
 _PORE_GEOMETRIES = ['slit', 'cylinder', 'sphere']
+_SF_COEFFICIENTS = None  # cached Saito-Foley series coefficients
+_CURVE_POINTS = 1000  # pore sizes at which the potential is tabulated
+_CURVE_VERSION = 1  # changes invalidate pore filling curves saved on disk
+_CURVE_CACHE_SIZE = 64  # pore filling curves kept in memory
+_CURVES = {}
 
 
 def psd_microporous(
@@ -32,7 +40,8 @@ def psd_microporous(
     material_model: "str | dict[str, float]" = 'Carbon(HK)',
     adsorbate_model: "str | dict[str, float]" = None,
     p_limits: "tuple[float, float]" = None,
-    verbose: bool = False
+    verbose: bool = False,
+    cache_curve: bool = False,
 ) -> "dict[str, list[float]]":
     r"""
     Calculate the microporous size distribution using a Horvath-Kawazoe type model.
@@ -60,6 +69,9 @@ def psd_microporous(
         Pressure range in which to calculate PSD, defaults to [0, 0.2].
     verbose : bool
         Print out extra information on the calculation and graphs the results.
+    cache_curve : bool, optional
+        Whether to also save the pore filling curve in the user cache
+        (``pygaps.data.HK_CURVES``), to be reused in later sessions.
 
     Returns
     -------
@@ -118,6 +130,12 @@ def psd_microporous(
     cylindrical pores and spherical pores, as described in the related papers
     [#hk1]_ [#sf1]_ [#cy1]_ [#ry1]_.
 
+    The relationship between pore size and filling pressure does not depend on
+    the isotherm, only on the model, geometry, temperature and the material and
+    adsorbate properties. It is calculated once and kept in memory, such that
+    processing further isotherms recorded in the same conditions only requires
+    an interpolation. With ``cache_curve=True`` it is also stored on disk.
+
     .. caution::
 
         A common mantra of data processing is: **garbage in = garbage out**. Only use
@@ -221,6 +239,7 @@ def psd_microporous(
             adsorbate_model,
             material_properties,
             use_cy=False if psd_model == 'HK' else True,
+            cache_curve=cache_curve,
         )
     elif psd_model in ['RY', 'RY-CY']:
         pore_widths, pore_dist, pore_vol_cum = psd_horvath_kawazoe_ry(
@@ -231,6 +250,7 @@ def psd_microporous(
             adsorbate_model,
             material_properties,
             use_cy=False if psd_model == 'RY' else True,
+            cache_curve=cache_curve,
         )
 
     if verbose:
@@ -260,6 +280,7 @@ def psd_horvath_kawazoe(
     adsorbate_properties: "dict[str, float]",
     material_properties: "dict[str, float]",
     use_cy: bool = False,
+    cache_curve: bool = False,
 ):
     r"""
     Calculate the pore size distribution using the Horvath-Kawazoe method.
@@ -294,6 +315,10 @@ def psd_horvath_kawazoe(
         can be found in .characterisation.models_hk.
     use_cy : bool:
         Whether to use the Cheng-Yang nonlinear Langmuir term.
+    cache_curve : bool, optional
+        Whether to also save the pore filling curve on disk, to be reused
+        in later sessions. See
+        :func:`~pygaps.characterisation.psd_micro.psd_microporous`.
 
     Returns
     -------
@@ -507,6 +532,9 @@ def psd_horvath_kawazoe(
 
     d_eff = (d_ads + d_mat) / 2  # effective diameter
     N_over_RT = _N_over_RT(temperature)  # N_av / RT
+    curve_key = _curve_key(
+        'HK', pore_geometry, temperature, adsorbate_properties, material_properties
+    )
 
     ###################################################################
     if pore_geometry == 'slit':
@@ -529,9 +557,11 @@ def psd_horvath_kawazoe(
             )
 
         if use_cy:
-            pore_widths = _solve_hk_cy(pressure, loading, potential, 2 * d_eff, 1)
+            pore_widths = _solve_hk_cy(
+                pressure, loading, potential, 2 * d_eff, 1, curve_key, cache_curve
+            )
         else:
-            pore_widths = _solve_hk(pressure, potential, 2 * d_eff, 1)
+            pore_widths = _solve_hk(pressure, potential, 2 * d_eff, 1, curve_key, cache_curve)
 
         # width = distance between infinite slabs - 2 * surface molecule radius (=d_mat)
         pore_widths = numpy.asarray(pore_widths) - d_mat
@@ -542,11 +572,9 @@ def psd_horvath_kawazoe(
         const_coeff = 0.75 * constants.pi * N_over_RT * \
             (n_ads * a_ads + n_mat * a_mat) / (d_eff * 1e-9)**4  # d_eff must be in SI
 
-        # to avoid unnecessary recalculations, we cache a_k and b_k values
-        a_ks, b_ks = [1], [1]
-        for k in range(1, 2000):
-            a_ks.append(((-4.5 - k) / k)**2 * a_ks[k - 1])
-            b_ks.append(((-1.5 - k) / k)**2 * b_ks[k - 1])
+        # the series coefficients include the 1 / (k + 1) factor
+        a_ks, b_ks = _sf_coefficients()
+        k_coeffs = numpy.stack((a_ks, b_ks), axis=1) / numpy.arange(1, len(a_ks) + 1)[:, None]
 
         def potential(l_pore):
 
@@ -554,19 +582,17 @@ def psd_horvath_kawazoe(
             d_over_r_p4 = d_over_r**4  # d/L ^ 4
             d_over_r_p10_k = 0.65625 * d_over_r**10  # 21/32 * d/L ^ 4
 
-            k_sum = d_over_r_p10_k - d_over_r_p4  # first value at K=0
-
             # 25 * pore radius ensures that layer convergence is achieved
-            for k in range(1, int(l_pore * 25)):
-                k_sum = k_sum + ((1 / (k + 1) * (1 - d_over_r)**(2 * k)) *
-                                 (a_ks[k] * d_over_r_p10_k - b_ks[k] * d_over_r_p4))
+            a_sum, b_sum = _sf_series((1 - d_over_r)**2, l_pore * 25, k_coeffs)
 
-            return const_coeff * k_sum
+            return const_coeff * (d_over_r_p10_k * a_sum - d_over_r_p4 * b_sum)
 
         if use_cy:
-            pore_widths = _solve_hk_cy(pressure, loading, potential, d_eff, 2)
+            pore_widths = _solve_hk_cy(
+                pressure, loading, potential, d_eff, 2, curve_key, cache_curve
+            )
         else:
-            pore_widths = _solve_hk(pressure, potential, d_eff, 2)
+            pore_widths = _solve_hk(pressure, potential, d_eff, 2, curve_key, cache_curve)
 
         # width = 2 * cylinder radius - 2 * surface molecule radius (=d_mat)
         pore_widths = 2 * numpy.asarray(pore_widths) - d_mat
@@ -595,9 +621,11 @@ def psd_horvath_kawazoe(
             )
 
         if use_cy:
-            pore_widths = _solve_hk_cy(pressure, loading, potential, d_eff, 2)
+            pore_widths = _solve_hk_cy(
+                pressure, loading, potential, d_eff, 2, curve_key, cache_curve
+            )
         else:
-            pore_widths = _solve_hk(pressure, potential, d_eff, 2)
+            pore_widths = _solve_hk(pressure, potential, d_eff, 2, curve_key, cache_curve)
 
         # width = 2 * sphere radius - 2 * surface molecule radius (=d_mat)
         pore_widths = 2 * numpy.asarray(pore_widths) - d_mat
@@ -627,6 +655,7 @@ def psd_horvath_kawazoe_ry(
     adsorbate_properties: "dict[str, float]",
     material_properties: "dict[str, float]",
     use_cy: bool = False,
+    cache_curve: bool = False,
 ):
     r"""
     Calculate the microporous size distribution using a Rege-Yang (R-Y) type model.
@@ -661,6 +690,10 @@ def psd_horvath_kawazoe_ry(
         can be found in .characterisation.models_hk.
     use_cy : bool:
         Whether to use the Cheng-Yang nonlinear Langmuir term.
+    cache_curve : bool, optional
+        Whether to also save the pore filling curve on disk, to be reused
+        in later sessions. See
+        :func:`~pygaps.characterisation.psd_micro.psd_microporous`.
 
     Returns
     -------
@@ -873,6 +906,9 @@ def psd_horvath_kawazoe_ry(
 
     d_eff = (d_ads + d_mat) / 2  # effective diameter
     N_over_RT = _N_over_RT(temperature)  # N_av / RT
+    curve_key = _curve_key(
+        'RY', pore_geometry, temperature, adsorbate_properties, material_properties
+    )
 
     ###################################################################
     if pore_geometry == 'slit':
@@ -909,15 +945,19 @@ def psd_horvath_kawazoe_ry(
 
         def potential(l_pore):
             n_layer = (l_pore - d_mat) / d_ads
-            if n_layer < 2:
-                return N_over_RT * potential_twosurface(l_pore)
-            else:
-                return N_over_RT * potential_average(n_layer)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                return N_over_RT * numpy.where(
+                    n_layer < 2,
+                    potential_twosurface(l_pore),
+                    potential_average(n_layer),
+                )
 
         if use_cy:
-            pore_widths = _solve_hk_cy(pressure, loading, potential, 2 * d_eff, 1)
+            pore_widths = _solve_hk_cy(
+                pressure, loading, potential, 2 * d_eff, 1, curve_key, cache_curve
+            )
         else:
-            pore_widths = _solve_hk(pressure, potential, 2 * d_eff, 1)
+            pore_widths = _solve_hk(pressure, potential, 2 * d_eff, 1, curve_key, cache_curve)
 
         # width = distance between infinite slabs - 2 * surface molecule radius (=d_mat)
         pore_widths = numpy.asarray(pore_widths) - d_mat
@@ -926,71 +966,55 @@ def psd_horvath_kawazoe_ry(
     elif pore_geometry == 'cylinder':
 
         max_k = 25  # Maximum K summed
-        cached_k = 2000  # Maximum K's cached
-        # to avoid unnecessary recalculations, we cache a_k and b_k values
-        a_ks, b_ks = [1], [1]
-        for k in range(1, cached_k):
-            a_ks.append(((-4.5 - k) / k)**2 * a_ks[k - 1])
-            b_ks.append(((-1.5 - k) / k)**2 * b_ks[k - 1])
-
-        def a_k_sum(r2, max_k_pore):
-            k_sum_t = 1
-            for k in range(1, max_k_pore):
-                k_sum_t = k_sum_t + (a_ks[k] * r2**(2 * k))
-            return k_sum_t
-
-        def b_k_sum(r2, max_k_pore):
-            k_sum_t = 1
-            for k in range(1, max_k_pore):
-                k_sum_t = k_sum_t + (b_ks[k] * r2**(2 * k))
-            return k_sum_t
+        a_ks, b_ks = _sf_coefficients()
+        k_coeffs = numpy.stack((a_ks, b_ks), axis=1)
 
         def potential_general(l_pore, d_x, n_x, a_x, r1):
             # determine maximum summation as a function of pore length
-            max_k_pore = int(l_pore * max_k)
-            max_k_pore = max_k_pore if max_k_pore < 2000 else 2000
+            max_k_pore = l_pore * max_k
             # the b constant is 1-a
             r2 = 1 - r1
+            a_k_sum, b_k_sum = _sf_series(r2**2, max_k_pore, k_coeffs)
             # 0.65625 is (21 / 32), constant
             return (
                 0.75 * constants.pi * n_x * a_x / ((d_x * 1e-9)**4) *
-                (0.65625 * r1**10 * a_k_sum(r2, max_k_pore) - r1**4 * b_k_sum(r2, max_k_pore))
+                (0.65625 * r1**10 * a_k_sum - r1**4 * b_k_sum)
             )
 
         def potential(l_pore):
-            n_layers = int(((2 * l_pore - d_mat) / d_ads - 1) / 2) + 1
-            layer_populations = []
-            layer_potentials = []
+            l_pore = numpy.asarray(l_pore, dtype=float)
+            n_layers = numpy.trunc(((2 * l_pore - d_mat) / d_ads - 1) / 2) + 1
+            layer_populations = numpy.zeros_like(l_pore)
+            layer_potentials = numpy.zeros_like(l_pore)
+
+            # each layer is calculated for all pores which can hold it
+            for layer in range(1, int(numpy.max(n_layers)) + 1):
+                in_pore = n_layers >= layer
+                l_layer = l_pore[in_pore]
 
-            for layer in range(1, n_layers + 1):
-                width = 2 * (l_pore - d_eff - (layer - 1) * d_ads)
-                if d_ads <= width:
-                    layer_population = constants.pi / math.asin(d_ads / width)
-                else:
-                    layer_population = 1
+                width = 2 * (l_layer - d_eff - (layer - 1) * d_ads)
+                layer_population = numpy.ones_like(l_layer)
+                fits = d_ads <= width
+                layer_population[fits] = constants.pi / numpy.arcsin(d_ads / width[fits])
 
                 if layer == 1:  # potential with surface (first layer)
-                    r1 = d_eff / l_pore
-                    layer_potential = potential_general(l_pore, d_eff, n_mat, a_mat, r1)
+                    r1 = d_eff / l_layer
+                    layer_potential = potential_general(l_layer, d_eff, n_mat, a_mat, r1)
                 else:  # inter-adsorbate potential (subsequent layers)
-                    r1 = d_ads / (l_pore - d_eff - (layer - 2) * d_ads)
-                    layer_potential = potential_general(l_pore, d_ads, n_ads, a_ads, r1)
+                    r1 = d_ads / (l_layer - d_eff - (layer - 2) * d_ads)
+                    layer_potential = potential_general(l_layer, d_ads, n_ads, a_ads, r1)
 
-                layer_populations.append(layer_population)
-                layer_potentials.append(layer_potential)
+                layer_populations[in_pore] += layer_population
+                layer_potentials[in_pore] += layer_population * layer_potential
 
-            layer_populations = numpy.asarray(layer_populations)
-            layer_potentials = numpy.asarray(layer_potentials)
-
-            return (
-                N_over_RT * numpy.sum(layer_populations * layer_potentials) /
-                numpy.sum(layer_populations)
-            )
+            return N_over_RT * layer_potentials / layer_populations
 
         if use_cy:
-            pore_widths = _solve_hk_cy(pressure, loading, potential, d_eff, 1)
+            pore_widths = _solve_hk_cy(
+                pressure, loading, potential, d_eff, 1, curve_key, cache_curve
+            )
         else:
-            pore_widths = _solve_hk(pressure, potential, d_eff, 1)
+            pore_widths = _solve_hk(pressure, potential, d_eff, 1, curve_key, cache_curve)
 
         # width = 2 * cylinder radius - 2 * surface molecule radius (=d_mat)
         pore_widths = 2 * numpy.asarray(pore_widths) - d_mat
@@ -1010,39 +1034,41 @@ def psd_horvath_kawazoe_ry(
             )
 
         def potential(l_pore):
-            n_layers = int(((2 * l_pore - d_mat) / d_ads - 1) / 2) + 1
-            layer_populations = []
-            layer_potentials = []
-
-            # potential with surface (first layer)
-            layer_population = 4 * constants.pi * (l_pore * 1e-9)**2 * n_mat
-            r1 = d_eff / l_pore
-            layer_potential = potential_general(layer_population, p_12, r1)
-            layer_potentials.append(layer_potential)  # add E1
-
-            # inter-adsorbate potential (subsequent layers)
-            layer_populations = [
-                (4 * constants.pi * ((l_pore - d_eff - (layer - 1) * d_ads) * 1e-9)**2 * n_ads)
-                for layer in range(1, n_layers + 1)
-            ]  # [N1...Nm]
-
-            for layer, layer_population in zip(range(2, n_layers + 1), layer_populations):
-                r1 = d_ads / (l_pore - d_eff - (layer - 2) * d_ads)
-                layer_potential = potential_general(layer_population, p_22, r1)
-                layer_potentials.append(layer_potential)  # add [E2...Em]
-
-            layer_populations = numpy.asarray(layer_populations)
-            layer_potentials = numpy.asarray(layer_potentials)
+            l_pore = numpy.asarray(l_pore, dtype=float)
+            n_layers = numpy.trunc(((2 * l_pore - d_mat) / d_ads - 1) / 2) + 1
+            layer_populations = numpy.zeros_like(l_pore)
+            layer_potentials = numpy.zeros_like(l_pore)
 
-            return (
-                N_over_RT * numpy.sum(layer_populations * layer_potentials) /
-                numpy.sum(layer_populations)
-            )
+            # each layer is calculated for all pores which can hold it
+            for layer in range(1, int(numpy.max(n_layers)) + 1):
+                in_pore = n_layers >= layer
+                l_layer = l_pore[in_pore]
+
+                if layer == 1:  # potential with surface (first layer)
+                    n_m = 4 * constants.pi * (l_layer * 1e-9)**2 * n_mat
+                    r1 = d_eff / l_layer
+                    layer_potential = potential_general(n_m, p_12, r1)  # E1
+                else:  # inter-adsorbate potential (subsequent layers)
+                    n_m = 4 * constants.pi * ((l_layer - d_eff - (layer - 2) * d_ads) * 1e-9)**2 * n_ads
+                    r1 = d_ads / (l_layer - d_eff - (layer - 2) * d_ads)
+                    layer_potential = potential_general(n_m, p_22, r1)  # [E2...Em]
+
+                # layer population [N1...Nm]
+                layer_population = (
+                    4 * constants.pi * ((l_layer - d_eff - (layer - 1) * d_ads) * 1e-9)**2 * n_ads
+                )
+
+                layer_populations[in_pore] += layer_population
+                layer_potentials[in_pore] += layer_population * layer_potential
+
+            return N_over_RT * layer_potentials / layer_populations
 
         if use_cy:
-            pore_widths = _solve_hk_cy(pressure, loading, potential, d_eff, 1)
+            pore_widths = _solve_hk_cy(
+                pressure, loading, potential, d_eff, 1, curve_key, cache_curve
+            )
         else:
-            pore_widths = _solve_hk(pressure, potential, d_eff, 1)
+            pore_widths = _solve_hk(pressure, potential, d_eff, 1, curve_key, cache_curve)
 
         # width = 2 * sphere radius - 2 * surface molecule radius (=d_mat)
         pore_widths = 2 * numpy.asarray(pore_widths) - d_mat
@@ -1064,61 +1090,167 @@ def psd_horvath_kawazoe_ry(
     return avg_pore_widths, pore_dist, volume_adsorbed[1:]
 
 
-def _solve_hk(pressure, hk_fun, bound, geo):
+def _solve_hk(pressure, hk_fun, bound, geo, key=None, persist=False):
     """
-    I personally found that simple Brent minimization
-    gives good results. There may be other, more efficient
-    algorithms, like conjugate gradient, but optimization is a moot point
-    as long as average total runtime is short.
-    The minimisation runs with bounds of [d_eff < x < 50].
+    Rather than minimising the residual at each pressure point,
+    the potential is tabulated once over [d_eff < x < 50] and
+    inverted by monotone interpolation, see `_potential_curve`.
     Maximum determinable pore size is limited at ~2.5 nm anyway.
     """
+    with numpy.errstate(divide='ignore'):
+        target = numpy.log(numpy.asarray(pressure, dtype=float))
 
-    p_w = []
-    p_w_max = 10 / geo
+    curve = _potential_curve(hk_fun, bound, key, persist)
+    return _truncate_widths(_invert_potential(curve, target), 10 / geo)
 
-    for p_point in pressure:
 
-        def fun(l_pore):
-            return (numpy.exp(hk_fun(l_pore)) - p_point)**2
+def _solve_hk_cy(pressure, loading, hk_fun, bound, geo, key=None, persist=False):
+    """
+    In this case, the SF correction factor is subtracted
+    from the original function.
+    """
+    pressure = numpy.asarray(pressure, dtype=float)
+    loading = numpy.asarray(loading, dtype=float)
+    coverage = loading[:len(pressure)] / (max(loading) * 1.01)
+    pressure = pressure[:len(coverage)]
+
+    with numpy.errstate(divide='ignore'):
+        sf_corr = 1 + 1 / coverage * numpy.log(1 - coverage)
+        target = numpy.log(pressure) + sf_corr
+
+    curve = _potential_curve(hk_fun, bound, key, persist)
+    return _truncate_widths(_invert_potential(curve, target), 10 / geo)
+
+
+def _curve_key(psd_model, pore_geometry, temperature, adsorbate_properties, material_properties):
+    """Unique hash of everything a pore filling curve depends on."""
+    inputs = {
+        'version': _CURVE_VERSION,
+        'points': _CURVE_POINTS,
+        'model': psd_model,
+        'geometry': pore_geometry,
+        'temperature': float(temperature),
+        'adsorbate': {key: float(adsorbate_properties[key]) for key in HK_KEYS},
+        'material': {key: float(material_properties[key]) for key in HK_KEYS},
+    }
+    return hashlib.md5(json.dumps(inputs, sort_keys=True).encode('utf-8')).hexdigest()
 
-        res = optimize.minimize_scalar(fun, method='bounded', bounds=(bound, 50))
-        p_w.append(res.x)
 
-        # we will stop if reaching unrealistic pore sizes
-        if res.x > p_w_max:
-            break
+def _potential_curve(hk_fun, bound, key=None, persist=False):
+    """
+    Get the potential as an increasing function of pore size.
 
-    return p_w
+    Curves with a key are kept in memory and, if persist is set,
+    in the ``pygaps.data.HK_CURVES`` directory, such that the
+    potential is only ever tabulated once for the same inputs.
+    """
+    if key is None:
+        return _tabulate_potential(hk_fun, bound)
+
+    curve = _CURVES.pop(key, None)  # reinserted as the most recently used
+    path = HK_CURVES / f"{key}.npz"
 
+    if curve is None and persist and path.is_file():
+        with numpy.load(path, allow_pickle=False) as data:
+            curve = data['potential'], data['pore_size']
 
-def _solve_hk_cy(pressure, loading, hk_fun, bound, geo):
+    if curve is None:
+        curve = _tabulate_potential(hk_fun, bound)
+        if persist:
+            try:
+                HK_CURVES.mkdir(parents=True, exist_ok=True)
+                numpy.savez(path, potential=curve[0], pore_size=curve[1])
+            except OSError as err:
+                logger.warning(f"Could not save pore filling curve: {err}")
+
+    _CURVES[key] = curve
+    if len(_CURVES) > _CURVE_CACHE_SIZE:
+        del _CURVES[next(iter(_CURVES))]
+    return curve
+
+
+def _tabulate_potential(hk_fun, bound, upper=50):
     """
-    In this case, the SF correction factor is subtracted
-    from the original function.
+    Evaluate the potential function on a logarithmic grid of pore sizes.
+
+    Past its minimum, the potential increases with pore size. Only
+    this branch is kept, such that it can be inverted.
     """
+    l_pore = numpy.geomspace(bound, upper, _CURVE_POINTS)
+    with numpy.errstate(all='ignore'):
+        potential = numpy.asarray(hk_fun(l_pore), dtype=float)
 
-    p_w = []
-    p_w_max = 10 / geo
-    coverage = loading / (max(loading) * 1.01)
+    # the potential diverges at the lower bound
+    valid = numpy.isfinite(potential)
+    l_pore, potential = l_pore[valid], potential[valid]
 
-    for p_point, c_point in zip(pressure, coverage):
+    # only keep the rising branch, strictly increasing
+    start = numpy.argmin(potential)
+    l_pore, potential = l_pore[start:], potential[start:]
+    rising = numpy.ones_like(potential, dtype=bool)
+    rising[1:] = potential[1:] > numpy.maximum.accumulate(potential)[:-1]
 
-        sf_corr = 1 + 1 / c_point * numpy.log(1 - c_point)
+    return potential[rising], l_pore[rising]
 
-        def fun(l_pore):
-            return (numpy.exp(hk_fun(l_pore) - sf_corr) - p_point)**2
 
-        res = optimize.minimize_scalar(fun, method='bounded', bounds=(bound, 50))
-        p_w.append(res.x)
+def _invert_potential(curve, target):
+    """
+    Find the pore sizes at which the potential equals the targets.
+
+    The pore size is interpolated as a monotone function of the
+    potential. Targets outside the tabulated range are assigned
+    the closest pore size.
+    """
+    potential, l_pore = curve
+    if len(potential) < 2:
+        return numpy.full_like(target, l_pore[0])
 
-        # we will stop if reaching unrealistic pore sizes
-        if res.x > p_w_max:
-            break
+    inverse = interpolate.PchipInterpolator(potential, l_pore, extrapolate=False)
+    return inverse(numpy.clip(target, potential[0], potential[-1]))
 
+
+def _truncate_widths(p_w, p_w_max):
+    """Stop after the first unrealistic pore size."""
+    too_large = numpy.flatnonzero(p_w > p_w_max)
+    if too_large.size:
+        return p_w[:too_large[0] + 1]
     return p_w
 
 
+def _sf_coefficients():
+    """Coefficients of the Saito-Foley cylindrical series, a_k and b_k."""
+    global _SF_COEFFICIENTS
+    if _SF_COEFFICIENTS is None:
+        k = numpy.arange(1, 2000)
+        _SF_COEFFICIENTS = (
+            numpy.concatenate(([1], numpy.cumprod(((-4.5 - k) / k)**2))),
+            numpy.concatenate(([1], numpy.cumprod(((-1.5 - k) / k)**2))),
+        )
+    return _SF_COEFFICIENTS
+
+
+def _sf_series(x, terms, coeffs):
+    """
+    Sum the series sum(coeffs[k] * x**k) over the first `terms` values of k.
+
+    The number of terms can differ for each x, and several series
+    can be summed at once by passing a coefficient matrix with one
+    column per series. Sums are returned for each column.
+    """
+    x = numpy.asarray(x, dtype=float)
+    terms = numpy.clip(numpy.trunc(terms), 1, len(coeffs)).astype(int)
+    x, terms = numpy.broadcast_arrays(x, terms)
+
+    k_max = int(numpy.max(terms, initial=1))
+    powers = numpy.empty(x.shape + (k_max, ))
+    powers[..., 0] = 1
+    powers[..., 1:] = x[..., None]
+    numpy.cumprod(powers, axis=-1, out=powers)
+    powers[numpy.arange(k_max) >= terms[..., None]] = 0
+
+    return numpy.moveaxis(powers @ coeffs[:k_max], -1, 0)
+
+
 def _dispersion_from_dict(ads_dict, mat_dict):
 
     p_ads = ads_dict['polarizability'] * 1e-27  # to m3
@@ -1,13 +1,19 @@
 """Contains the adsorbate class."""
 
+import numpy
+
 from pygaps import logger
 from pygaps.data import ADSORBATE_LIST
 from pygaps.units.converter_unit import _PRESSURE_UNITS
 from pygaps.units.converter_unit import c_unit
-from pygaps.utilities.coolprop_utilities import CP
+from pygaps.utilities.coolprop_utilities import TABLES_BACKEND
+from pygaps.utilities.coolprop_utilities import calculate_property
+from pygaps.utilities.coolprop_utilities import coolprop
 from pygaps.utilities.coolprop_utilities import thermodynamic_backend
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.property_tables import TABLE_PROPERTIES
+from pygaps.utilities.property_tables import property_table
 
 # TODO: units in the prop dictionary and from coolprop do not always match (e.g. p_critical)
 
@@ -95,6 +101,11 @@ class Adsorbate():
 
         adsorbate.backend.p_critical()
 
+    Properties calculated at a temperature or pressure are cached, until
+    the thermodynamic backend is changed. The cache hits and misses can be
+    inspected with ``property_cache_info()``. Saturation properties can also
+    be interpolated in precomputed tables, see ``backend_use_tables()``.
+
     """
     # special reserved parameters
     _reserved_params = [
@@ -102,8 +113,12 @@ class Adsorbate():
         "alias",
         "_state",
         "_backend_mode",
+        "_property_cache",
     ]
 
+    # Number of calculated properties kept per adsorbate.
+    _property_cache_size = 1024
+
     def __init__(
         self,
         name: str,
@@ -138,6 +153,12 @@ class Adsorbate():
         self._state = None
         self._backend_mode = None
 
+        # Calculated properties, per property, temperature, pressure and backend
+        self._property_cache = {}
+        self._property_cache_backend = None
+        self._property_cache_hits = 0
+        self._property_cache_misses = 0
+
         # Store reference in internal list
         if store:
             if self not in ADSORBATE_LIST:
@@ -161,6 +182,13 @@ class Adsorbate():
             return self.name == other.name
         return other.lower() in self.alias
 
+    def __getstate__(self):
+        """Do not pickle the CoolProp state, it is regenerated when needed."""
+        state = self.__dict__.copy()
+        state['_state'] = None
+        state['_backend_mode'] = None
+        return state
+
     def __add__(self, other):
         """Overload addition operator to use name."""
         return self.name + other
@@ -207,13 +235,13 @@ class Adsorbate():
             raise ParameterError("Pass a string as an adsorbate name.")
 
         # See if adsorbate exists in master list
-        try:
-            return next(ads for ads in ADSORBATE_LIST if ads == name)
-        except StopIteration:
+        adsorbate = ADSORBATE_LIST.find(name)
+        if adsorbate is None:
             raise ParameterError(
                 f"Adsorbate '{name}' does not exist in list of adsorbates. "
                 "First populate pygaps.ADSORBATE_LIST with required adsorbate class."
-            ) from None
+            )
+        return adsorbate
 
     @property
     def backend(self):
@@ -223,10 +251,105 @@ class Adsorbate():
             self._backend_mode != thermodynamic_backend()
         ):
             self._backend_mode = thermodynamic_backend()
-            self._state = CP.AbstractState(self._backend_mode, self.backend_name)
+            # Properties not in tables are calculated with HEOS
+            state_mode = self._backend_mode
+            if state_mode == TABLES_BACKEND:
+                state_mode = 'HEOS'
+            self._state = coolprop().AbstractState(state_mode, self.backend_name)
 
         return self._state
 
+    def _state_property(self, prop: str, temp: float = None, pressure: float = None) -> float:
+        """
+        Calculate a property through the thermodynamic backend, using
+        a cached value if it was previously calculated.
+
+        Arrays of temperatures and/or pressures are evaluated point by
+        point on the same state object, and an array is returned.
+        """
+        backend = thermodynamic_backend()
+        if backend == TABLES_BACKEND and prop in TABLE_PROPERTIES:
+            # Interpolation in tables is as fast as the cache
+            return self.property_table()(prop, temp, pressure)
+
+        if backend != self._property_cache_backend:
+            self._property_cache = {}
+            self._property_cache_backend = backend
+
+        if numpy.ndim(temp) or numpy.ndim(pressure):
+            temps, pressures = numpy.broadcast_arrays(
+                numpy.nan if temp is None else numpy.asarray(temp, dtype=float),
+                numpy.nan if pressure is None else numpy.asarray(pressure, dtype=float),
+            )
+            values = numpy.full(temps.shape, numpy.nan)
+            for index, (t_point, p_point) in enumerate(zip(temps.flat, pressures.flat)):
+                if temp is not None and numpy.isnan(t_point):
+                    continue
+                if pressure is not None and numpy.isnan(p_point):
+                    continue
+                values.flat[index] = self._state_property(
+                    prop,
+                    None if temp is None else t_point,
+                    None if pressure is None else p_point,
+                )
+            return values
+
+        if temp is not None:
+            temp = float(temp)
+        if pressure is not None:
+            pressure = float(pressure)
+        key = (prop, temp, pressure, backend)
+
+        value = self._property_cache.pop(key, None)
+        if value is None:
+            self._property_cache_misses += 1
+            value = calculate_property(self.backend, prop, temp, pressure)
+            if len(self._property_cache) >= self._property_cache_size:
+                del self._property_cache[next(iter(self._property_cache))]
+        else:
+            self._property_cache_hits += 1
+
+        # Most recently used properties are last
+        self._property_cache[key] = value
+        return value
+
+    def property_table(self):
+        """
+        Return the table of precomputed saturation properties of the fluid.
+
+        The table is read from the user cache or package data, or
+        generated through CoolProp and stored if it does not exist.
+
+        Returns
+        -------
+        PropertyTable
+            The property table of the adsorbate.
+        """
+        return property_table(self.backend_name)
+
+    def property_cache_info(self) -> dict:
+        """
+        Return statistics on the cache of calculated properties.
+
+        Returns
+        -------
+        dict
+            The number of cache ``hits`` and ``misses``, the current
+            ``size`` of the cache and the ``backend`` it was calculated with.
+        """
+        return {
+            'hits': self._property_cache_hits,
+            'misses': self._property_cache_misses,
+            'size': len(self._property_cache),
+            'backend': self._property_cache_backend,
+        }
+
+    def property_cache_clear(self):
+        """Clear the cache of calculated properties and its statistics."""
+        self._property_cache = {}
+        self._property_cache_hits = 0
+        self._property_cache_misses = 0
+
     @property
     def formula(self) -> str:
         """Return the adsorbate formula."""
@@ -368,7 +491,7 @@ class Adsorbate():
                 # For some reason coolprop does not implement a python
                 # wrapper for P_triple, so we are directly calling the propsSI function
                 # TODO: this will not work for REFPROP
-                return CP.CoolProp.PropsSI('PTRIPLE', self.backend_name)
+                return coolprop().CoolProp.PropsSI('PTRIPLE', self.backend_name)
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.p_triple(calculate=False)
@@ -492,7 +615,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the pressure is desired in K.
         unit : str
             Unit in which to return the saturation pressure.
@@ -529,7 +652,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the pressure is desired in K.
         unit : str
             Unit in which to return the saturation pressure.
@@ -569,9 +692,7 @@ class Adsorbate():
 
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                sat_p = state.p()
+                sat_p = self._state_property('saturation_pressure', temp)
             except BaseException as err:
                 _warn_reading_params(err)
                 sat_p = self.saturation_pressure(temp, unit=unit, calculate=False)
@@ -636,7 +757,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the surface_tension is desired in K.
         calculate : bool, optional
             Whether to calculate the property or look it up in the properties
@@ -658,9 +779,7 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                return state.surface_tension() * 1000
+                return self._state_property('surface_tension', temp)
 
             except BaseException as err:
                 _warn_reading_params(err)
@@ -681,7 +800,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the liquid density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -703,9 +822,7 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                return state.rhomass() / 1000
+                return self._state_property('liquid_density', temp)
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.liquid_density(temp, calculate=False)
@@ -725,7 +842,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the liquid density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -747,9 +864,7 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 0.0, temp)
-                return state.rhomolar() / 1e6
+                return self._state_property('liquid_molar_density', temp)
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.liquid_molar_density(temp, calculate=False)
@@ -769,7 +884,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the gas density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -791,9 +906,7 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 1.0, temp)
-                return state.rhomass() / 1000
+                return self._state_property('gas_density', temp)
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.gas_density(temp, calculate=False)
@@ -813,7 +926,7 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the gas density is desired in K.
         calculate : bool, optional.
             Whether to calculate the property or look it up in the properties
@@ -835,9 +948,7 @@ class Adsorbate():
         """
         if calculate:
             try:
-                state = self.backend
-                state.update(CP.QT_INPUTS, 1.0, temp)
-                return state.rhomolar() / 1e6
+                return self._state_property('gas_molar_density', temp)
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.gas_molar_density(temp, calculate=False)
@@ -858,8 +969,10 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the enthalpy of vaporisation is desired, in K.
+        press : float or array
+            Pressure at which the enthalpy of vaporisation is desired, in Pa.
         calculate : bool, optional
             Whether to calculate the property or look it up in the properties
             dictionary, default - True.
@@ -891,8 +1004,10 @@ class Adsorbate():
 
         Parameters
         ----------
-        temp : float
+        temp : float or array
             Temperature at which the enthalpy of liquefaction is desired, in K.
+        press : float or array
+            Pressure at which the enthalpy of liquefaction is desired, in Pa.
         calculate : bool, optional
             Whether to calculate the property or look it up in the properties
             dictionary, default - True.
@@ -912,25 +1027,16 @@ class Adsorbate():
 
         """
         if calculate:
-            if temp and press:
+            if temp is not None and press is not None:
                 raise CalculationError(
                     "Can only specify one intensive variable, either temperature or pressure."
                 )
             try:
-                state = self.backend
-                if temp:
-                    state.update(CP.QT_INPUTS, 0.0, temp)
-                    h_liq = state.hmolar()
-                    state.update(CP.QT_INPUTS, 1.0, temp)
-                    h_vap = state.hmolar()
-                elif press:
-                    state.update(CP.PQ_INPUTS, press, 0.0)
-                    h_liq = state.hmolar()
-                    state.update(CP.PQ_INPUTS, press, 1.0)
-                    h_vap = state.hmolar()
-                else:
-                    raise CalculationError("Neither pressure nor temperature specified.")
-                return (h_vap - h_liq) / 1000
+                if temp is not None:
+                    return self._state_property('enthalpy_liquefaction', temp=temp)
+                if press is not None:
+                    return self._state_property('enthalpy_liquefaction', pressure=press)
+                raise CalculationError("Neither pressure nor temperature specified.")
             except BaseException as err:
                 _warn_reading_params(err)
                 return self.enthalpy_liquefaction(temp, calculate=False)
@@ -951,12 +1057,12 @@ class Adsorbate():
 
         Parameters
         ---------
-        temp: float
+        temp: float or array
             Temperature in K
-        pressure: float
+        pressure: float or array
             pressure, in Pa
         """
-        return CP.CoolProp.PropsSI('Z', 'T', temp, 'P', pressure, self.backend_name)
+        return self._state_property('compressibility', temp, pressure)
 
 
 def _warn_reading_params(err):
@@ -0,0 +1,635 @@
+"""
+This module contains a container for many discrete isotherms.
+"""
+
+import copy
+import typing as t
+
+import numpy
+import pandas
+
+from pygaps import logger
+from pygaps.core.adsorbate import Adsorbate
+from pygaps.core.baseisotherm import BaseIsotherm
+from pygaps.core.material import Material
+from pygaps.core.pointisotherm import PointIsotherm
+from pygaps.utilities.exceptions import ParameterError
+
+
+class IsothermCollection():
+    """
+    Class which holds many discrete isotherms in a shared columnar layout.
+
+    The data points of all isotherms are concatenated into single arrays
+    (pressure, loading, branch and any other data), with an array of offsets
+    marking where each isotherm starts. The isotherm parameters (material,
+    adsorbate, temperature, units and other metadata) are available as a
+    table through the ``metadata`` attribute.
+
+    Operations such as unit conversion or interpolation are then performed
+    on all isotherms at once, instead of looping over individual
+    PointIsotherm objects.
+
+    Parameters
+    ----------
+    isotherms : iterable of PointIsotherm
+        The isotherms to store in the collection.
+
+    Notes
+    -----
+    Each isotherm in the collection keeps its own units. Convert
+    the collection if all isotherms should share the same units.
+
+    Indexing the collection with an integer returns a new PointIsotherm,
+    while indexing with a slice, a list of indices or a boolean mask
+    returns a new collection.
+
+    """
+
+    ##########################################################
+    #   Instantiation and classmethods
+
+    def __init__(self, isotherms: t.Iterable[PointIsotherm] = None):
+        """Instantiate by passing a list of PointIsotherms."""
+        params = []
+        columns = []
+        for isotherm in isotherms if isotherms is not None else []:
+            if not isinstance(isotherm, PointIsotherm):
+                raise ParameterError("An IsothermCollection can only contain PointIsotherms.")
+
+            params.append(isotherm.to_dict())
+            data = isotherm.data_raw.rename(
+                columns={
+                    isotherm.pressure_key: 'pressure',
+                    isotherm.loading_key: 'loading',
+                }
+            )
+            columns.append({column: data[column].to_numpy() for column in data.columns})
+
+        lengths = [len(column['pressure']) for column in columns]
+        keys = ['pressure', 'loading', 'branch']
+        for column in columns:
+            keys.extend(key for key in column if key not in keys)
+
+        data = {}
+        for key in keys:
+            if all(key in column for column in columns):
+                parts = [column[key] for column in columns]
+            else:
+                # missing data is marked as empty
+                parts = [
+                    column[key] if key in column else numpy.full(length, None, dtype=object)
+                    for column, length in zip(columns, lengths)
+                ]
+            data[key] = numpy.concatenate(parts) if parts else numpy.empty(0)
+
+        self._from_columns(data, numpy.cumsum([0] + lengths), params)
+
+    def _from_columns(self, data: dict, offsets: numpy.ndarray, params: list):
+        """Set the internal storage of the collection."""
+        # Concatenated data of all isotherms.
+        self._data = data
+        # Start of each isotherm in the data, with the total length at the end.
+        self._offsets = numpy.asarray(offsets, dtype=int)
+        # Parameters of each isotherm, as returned by ``to_dict``.
+        self._params = params
+        self._reset_cache()
+
+    @classmethod
+    def from_json(cls, str_or_path, **isotherm_parameters):
+        """
+        Read a collection from a json list of isotherms.
+
+        Parameters
+        ----------
+        str_or_path : str
+            The isotherms in a json string format or a path
+            to where one can be read.
+        isotherm_parameters :
+            Any other options to be overridden in the isotherm creation.
+
+        Returns
+        -------
+        IsothermCollection
+
+        """
+        from pygaps.parsing.json import isotherms_from_json
+        return cls(isotherms_from_json(str_or_path, **isotherm_parameters))
+
+    @classmethod
+    def from_db(
+        cls,
+        criteria: dict = None,
+        db_path: str = None,
+        verbose: bool = True,
+    ):
+        """
+        Read all point isotherms matching some criteria from an sqlite database.
+
+        Parameters
+        ----------
+        criteria : dict, None
+            Dictionary of isotherm parameters on which to filter database from
+            base parameters ('material', 'adsorbate', 'temperature').
+        db_path : str, None
+            Path to the database. If none is specified, internal database is used.
+        verbose : bool
+            Extra information printed to console.
+
+        Returns
+        -------
+        IsothermCollection
+
+        """
+        from pygaps.parsing.sqlite import isotherms_from_db
+        criteria = dict(criteria) if criteria else {}
+        criteria['iso_type'] = 'pointisotherm'
+        return cls(isotherms_from_db(criteria=criteria, db_path=db_path, verbose=verbose))
+
+    ##########################################################
+    #   Overloaded and own functions
+
+    def __len__(self) -> int:
+        """Return the number of isotherms in the collection."""
+        return len(self._params)
+
+    def __iter__(self) -> t.Iterator[PointIsotherm]:
+        """Iterate over the isotherms of the collection."""
+        for index in range(len(self)):
+            yield self._isotherm(index)
+
+    def __getitem__(self, index):
+        """Return an isotherm, or a sub-collection if indexing with several values."""
+        if isinstance(index, (int, numpy.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("Collection index out of range.")
+            return self._isotherm(index)
+        return self._subset(numpy.arange(len(self))[index])
+
+    def __repr__(self) -> str:
+        """Print key collection parameters."""
+        return f"<{type(self).__name__}>: {len(self)} isotherms, {len(self._data['pressure'])} points"
+
+    @property
+    def metadata(self) -> pandas.DataFrame:
+        """Return a table of the parameters of each isotherm."""
+        if self._metadata is None:
+            self._metadata = pandas.DataFrame([{
+                **params,
+                'material': str(params['material']['name'])
+                if isinstance(params['material'], dict) else params['material'],
+            } for params in self._params])
+        return self._metadata
+
+    @property
+    def lengths(self) -> numpy.ndarray:
+        """Return the number of points of each isotherm."""
+        return numpy.diff(self._offsets)
+
+    def to_isotherms(self) -> t.List[PointIsotherm]:
+        """
+        Return all isotherms in the collection as a list of PointIsotherms.
+
+        Returns
+        -------
+        list
+            List of PointIsotherms.
+
+        """
+        return list(self)
+
+    def to_json(self, path=None, **kwargs) -> t.Union[None, str]:
+        """
+        Convert the collection to a JSON list of isotherms.
+
+        Parameters
+        ----------
+        path
+            File path or object. If not specified, the result is returned as a string.
+        kwargs
+            Custom arguments to be passed to "json.dump", like `indent`.
+
+        Returns
+        -------
+        None or str
+            If path is None, returns the resulting json as a string.
+            Otherwise returns None.
+        """
+        from pygaps.parsing.json import isotherms_to_json
+        return isotherms_to_json(self, path, **kwargs)
+
+    def to_db(
+        self,
+        db_path: str = None,
+        verbose: bool = True,
+        autoinsert_material: bool = True,
+        autoinsert_adsorbate: bool = True,
+    ):
+        """
+        Upload all isotherms in the collection to an sqlite database.
+
+        Parameters
+        ----------
+        db_path : str, None
+            Path to the database. If none is specified, internal database is used.
+        autoinsert_material: bool, True
+            Whether to automatically insert an isotherm material if it is not found
+            in the database.
+        autoinsert_adsorbate: bool, True
+            Whether to automatically insert an isotherm adsorbate if it is not found
+            in the database.
+        verbose : bool
+            Extra information printed to console.
+
+        """
+        from pygaps.parsing.sqlite import isotherms_to_db
+        return isotherms_to_db(
+            self,
+            db_path=db_path,
+            autoinsert_material=autoinsert_material,
+            autoinsert_adsorbate=autoinsert_adsorbate,
+            verbose=verbose,
+        )
+
+    def filter(self, **criteria) -> "IsothermCollection":
+        """
+        Return the isotherms whose parameters match the criteria.
+
+        Parameters
+        ----------
+        criteria : dict
+            Isotherm parameters and their required value, for example
+            ``adsorbate='nitrogen', temperature=77``. A list of values
+            selects isotherms matching any of them.
+
+        Returns
+        -------
+        IsothermCollection
+            A new collection containing the isotherms selected.
+
+        """
+        metadata = self.metadata
+        selected = numpy.ones(len(self), dtype=bool)
+        for key, value in criteria.items():
+            if key not in metadata.columns:
+                selected[:] = False
+                break
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            if key == 'adsorbate':
+                values = [self._find_name(Adsorbate, val) for val in values]
+            elif key == 'material':
+                values = [self._find_name(Material, val) for val in values]
+            selected &= metadata[key].isin(values).to_numpy()
+        return self._subset(numpy.flatnonzero(selected))
+
+    @staticmethod
+    def _find_name(cls, name):
+        """Resolve a name to the one used by an adsorbate/material in the list."""
+        try:
+            return str(cls.find(name))
+        except ParameterError:
+            return name
+
+    def _isotherm(self, index: int) -> PointIsotherm:
+        """Build a PointIsotherm from the data of a collection member."""
+        start, end = self._offsets[index], self._offsets[index + 1]
+        data = pandas.DataFrame({
+            key: column[start:end]
+            for key, column in self._data.items()
+        }).dropna(axis=1, how='all').infer_objects()
+        return PointIsotherm(
+            isotherm_data=data,
+            pressure_key='pressure',
+            loading_key='loading',
+            **copy.deepcopy(self._params[index]),
+        )
+
+    def _subset(self, indices: numpy.ndarray) -> "IsothermCollection":
+        """Return a new collection with the members at the indices given."""
+        lengths = self.lengths[indices]
+        starts = self._offsets[:-1][indices]
+        points = self._points(starts, lengths)
+        subset = IsothermCollection.__new__(IsothermCollection)
+        subset._from_columns(
+            {key: column[points] for key, column in self._data.items()},
+            numpy.concatenate(([0], numpy.cumsum(lengths))),
+            [copy.deepcopy(self._params[i]) for i in indices],
+        )
+        return subset
+
+    @staticmethod
+    def _points(starts: numpy.ndarray, lengths: numpy.ndarray) -> numpy.ndarray:
+        """Return the indices of all points in consecutive ranges."""
+        if len(lengths) == 0:
+            return numpy.empty(0, dtype=int)
+        offsets = numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths)
+        return numpy.arange(lengths.sum()) + offsets
+
+    def _reset_cache(self):
+        """Discard any tables built on the current data."""
+        self._metadata = None
+        self._interp_tables = {}
+
+    ##########################################################
+    #   Conversion functions
+
+    def convert(
+        self,
+        pressure_mode: str = None,
+        pressure_unit: str = None,
+        loading_basis: str = None,
+        loading_unit: str = None,
+        material_basis: str = None,
+        material_unit: str = None,
+        verbose: bool = False,
+    ):
+        """
+        Convenience function for permanently converting any isotherm
+        mode/basis/units for all isotherms in the collection.
+
+        Parameters
+        ----------
+        pressure_mode : {'absolute', 'relative', 'relative%'}
+            The mode in which the isotherms should be converted.
+        pressure_unit : str
+            The unit into which the internal pressure should be converted to.
+            Only makes sense if converting to absolute pressure.
+        loading_basis : {'mass', 'molar', 'volume_gas', 'volume_liquid', 'percent', 'fraction'}
+            The basis in which the isotherms should be converted.
+        loading_unit : str
+            The unit into which the internal loading should be converted to.
+        material_basis : {'mass', 'molar', 'volume'}
+            The basis in which the isotherms should be converted.
+        material_unit : str
+            The unit into which the material should be converted to.
+        verbose : bool
+            Print out steps taken.
+
+        """
+        if pressure_mode or pressure_unit:
+            self.convert_pressure(
+                mode_to=pressure_mode,
+                unit_to=pressure_unit,
+                verbose=verbose,
+            )
+
+        if material_basis or material_unit:
+            self.convert_material(
+                basis_to=material_basis,
+                unit_to=material_unit,
+                verbose=verbose,
+            )
+
+        if loading_basis or loading_unit:
+            self.convert_loading(
+                basis_to=loading_basis,
+                unit_to=loading_unit,
+                verbose=verbose,
+            )
+
+    def convert_pressure(
+        self,
+        mode_to: str = None,
+        unit_to: str = None,
+        verbose: bool = False,
+        pseudo: bool = False,
+    ):
+        """
+        Convert the pressure of all isotherms from one unit to another
+        and the pressure mode from absolute to relative.
+
+        Parameters
+        ----------
+        mode_to : {'absolute', 'relative', 'relative%'}
+            The mode in which the isotherms should be converted.
+        unit_to : str
+            The unit into which the internal pressure should be converted to.
+            Only makes sense if converting to absolute pressure.
+        verbose : bool
+            Print out steps taken.
+        pseudo: bool, optional
+            Whether to use a pseudo-saturation pressure, in the case that the
+            adsorbate is supercritical
+
+        """
+        self._convert(
+            'pressure',
+            'convert_pressure',
+            mode_to=mode_to,
+            unit_to=unit_to,
+            pseudo=pseudo,
+        )
+        if verbose:
+            logger.info(f"Changed pressure to mode '{mode_to}', unit '{unit_to}'.")
+
+    def convert_loading(
+        self,
+        basis_to: str = None,
+        unit_to: str = None,
+        verbose: bool = False,
+    ):
+        """
+        Convert the loading of all isotherms from one unit to another
+        and the basis of the isotherm loading to be
+        either 'mass', 'molar' or 'percent'/'fraction'.
+
+        Parameters
+        ----------
+        basis_to : {'mass', 'molar', 'volume_gas', 'volume_liquid', 'percent', 'fraction'}
+            The basis in which the isotherms should be converted.
+        unit_to : str
+            The unit into which the internal loading should be converted to.
+        verbose : bool
+            Print out steps taken.
+
+        """
+        self._convert('loading', 'convert_loading', basis_to=basis_to, unit_to=unit_to)
+        if verbose:
+            logger.info(f"Changed loading to basis '{basis_to}', unit '{unit_to}'.")
+
+    def convert_material(
+        self,
+        basis_to: str = None,
+        unit_to: str = None,
+        verbose: bool = False,
+    ):
+        """
+        Convert the material of all isotherms from one unit to another and the
+        basis of the isotherm loading to be either 'per mass' or 'per volume' or
+        'per mole' of material.
+
+        Parameters
+        ----------
+        basis_to : {'mass', 'molar', 'volume'}
+            The basis in which the isotherms should be converted.
+        unit_to : str
+            The unit into which the material should be converted to.
+        verbose : bool
+            Print out steps taken.
+
+        """
+        self._convert('loading', 'convert_material', basis_to=basis_to, unit_to=unit_to)
+        if verbose:
+            logger.info(f"Changed material to basis '{basis_to}', unit '{unit_to}'.")
+
+    def _convert(self, key: str, method: str, **conversion):
+        """
+        Convert a column of all isotherms at once.
+
+        All conversions are proportional, so the conversion factor for each
+        group of isotherms sharing the same parameters is found by converting
+        a single-point isotherm. The data is then scaled in one operation.
+        """
+        keys = list(BaseIsotherm._unit_params) + BaseIsotherm._required_params
+        factors = numpy.ones(len(self))
+        groups = {}
+        for index, params in enumerate(self._params):
+            group = repr([params.get(k) for k in keys])
+            if group not in groups:
+                template = PointIsotherm(
+                    pressure=[1.0],
+                    loading=[1.0],
+                    branch='ads',
+                    **{k: copy.deepcopy(params.get(k))
+                       for k in keys}
+                )
+                getattr(template, method)(**conversion)
+                groups[group] = (template.to_dict(), getattr(template, key)()[0])
+
+            converted, factors[index] = groups[group]
+            params.update({k: converted[k] for k in BaseIsotherm._unit_params})
+
+        self._data[key] = self._data[key] * numpy.repeat(factors, self.lengths)
+        self._reset_cache()
+
+    ##########################################################
+    #   Functions that interpolate values of the isotherm data
+
+    def pressure_at(
+        self,
+        loading: t.Union[float, t.List[float]],
+        branch: str = 'ads',
+    ) -> numpy.ndarray:
+        """
+        Linearly interpolate all isotherms to compute pressure at any loading.
+
+        Parameters
+        ----------
+        loading : float or array
+            Loading at which to compute pressure, in the units of each
+            isotherm. A float or 1D array is used for all isotherms,
+            while a 2D array should have one row for each isotherm.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+
+        Returns
+        -------
+        array
+            Predicted pressure for each isotherm (rows) at each loading (columns).
+            Values outside the data range of an isotherm are ``nan``.
+
+        """
+        return self._interp('loading', 'pressure', loading, branch)
+
+    def loading_at(
+        self,
+        pressure: t.Union[float, t.List[float]],
+        branch: str = 'ads',
+    ) -> numpy.ndarray:
+        """
+        Linearly interpolate all isotherms to compute loading at any pressure.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure at which to compute loading, in the units of each
+            isotherm. A float or 1D array is used for all isotherms,
+            while a 2D array should have one row for each isotherm.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+
+        Returns
+        -------
+        array
+            Predicted loading for each isotherm (rows) at each pressure (columns).
+            Values outside the data range of an isotherm are ``nan``.
+
+        """
+        return self._interp('pressure', 'loading', pressure, branch)
+
+    def _interp_table(self, known: str, interp: str, branch: str):
+        """
+        Return the data of a branch sorted by isotherm and known value,
+        together with a search key which is monotonic across all isotherms.
+        """
+        table_key = (known, interp, branch)
+        if table_key in self._interp_tables:
+            return self._interp_tables[table_key]
+
+        if branch == 'ads':
+            selected = self._data['branch'] == 0
+        elif branch == 'des':
+            selected = self._data['branch'] == 1
+        else:
+            raise ParameterError('Bad branch specification.')
+
+        members = numpy.repeat(numpy.arange(len(self)), self.lengths)[selected]
+        x = self._data[known][selected].astype(float)
+        y = self._data[interp][selected].astype(float)
+        order = numpy.lexsort((x, members))
+        members, x, y = members[order], x[order], y[order]
+
+        counts = numpy.bincount(members, minlength=len(self))
+        ends = numpy.cumsum(counts)
+        starts = ends - counts
+        filled = counts > 0
+        x_min = numpy.full(len(self), numpy.nan)
+        x_max = numpy.full(len(self), numpy.nan)
+        x_min[filled] = x[starts[filled]]
+        x_max[filled] = x[ends[filled] - 1]
+        span = numpy.where(x_max > x_min, x_max - x_min, 1)
+
+        # Each isotherm is scaled into a separate interval of the key
+        key = 2 * members + (x - x_min[members]) / span[members]
+
+        table = (x, y, key, starts, ends, x_min, x_max, span)
+        self._interp_tables[table_key] = table
+        return table
+
+    def _interp(self, known: str, interp: str, values, branch: str) -> numpy.ndarray:
+        """Interpolate all isotherms at once."""
+        x, y, key, starts, ends, x_min, x_max, span = self._interp_table(known, interp, branch)
+
+        values = numpy.asarray(values, dtype=float)
+        scalar = values.ndim == 0
+        values = numpy.broadcast_to(
+            values if values.ndim == 2 else numpy.atleast_1d(values)[numpy.newaxis, :],
+            (len(self), 1 if scalar else values.shape[-1]),
+        )
+        if len(self) == 0:
+            return numpy.empty(values.shape[:1] if scalar else values.shape)
+
+        members = numpy.arange(len(self))[:, numpy.newaxis]
+        inside = (values >= x_min[members]) & (values <= x_max[members]) \
+            & (ends - starts > 1)[members]
+        normed = numpy.clip((values - x_min[members]) / span[members], 0, 1)
+        position = numpy.searchsorted(key, 2 * members + numpy.nan_to_num(normed))
+
+        # Keep each search inside the data of its own isotherm
+        right = numpy.clip(position, (starts + 1)[members], (ends - 1)[members])
+        right = numpy.clip(right, 1, max(len(x) - 1, 1))
+        left = right - 1
+
+        result = numpy.full(values.shape, numpy.nan)
+        if len(x) > 1:
+            d_x = x[right] - x[left]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                slope = numpy.where(d_x > 0, (y[right] - y[left]) / d_x, 0)
+            interpolated = y[left] + slope * (values - x[left])
+            result[inside] = interpolated[inside]
+
+        if scalar:
+            return result[:, 0]
+        return result
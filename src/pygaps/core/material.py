@@ -115,13 +115,13 @@ class Material():
             raise ParameterError("Pass a string as an material name.")
 
         # Checks to see if material exists in master list
-        try:
-            return next(mat for mat in MATERIAL_LIST if name == mat)
-        except StopIteration as err:
+        material = MATERIAL_LIST.find(name)
+        if material is None:
             raise ParameterError(
                 f"Material {name} does not exist in list of materials. "
                 "First populate pygaps.MATERIAL_LIST with required material class"
-            ) from err
+            )
+        return material
 
     def to_dict(self) -> dict:
         """
@@ -1,6 +1,9 @@
 """Class representing a model of and isotherm."""
 
+import sys
 import typing as t
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy
 import pandas
@@ -302,6 +305,9 @@ class ModelIsotherm(BaseIsotherm):
         param_guess: dict = None,
         param_bounds: dict = None,
         optimization_params: dict = None,
+        n_jobs: int = 1,
+        executor: Executor = None,
+        rmse_threshold: float = None,
         verbose: bool = False
     ):
         """
@@ -327,6 +333,17 @@ class ModelIsotherm(BaseIsotherm):
             Dictionary to be passed to the minimization function to use in fitting model to data.
             See `here
             <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+        n_jobs : int, optional
+            When fitting several models, the number of models to fit at the
+            same time in a thread pool. Defaults to 1, -1 uses one thread per
+            processor. As fitting mostly holds the GIL, threads give little
+            speedup: pass a ``ProcessPoolExecutor`` as ``executor`` instead.
+        executor : concurrent.futures.Executor, optional
+            When fitting several models, an executor in which to fit them.
+            Takes precedence over ``n_jobs``.
+        rmse_threshold : float, optional
+            When fitting several models, stop as soon as a model fits the data
+            with a RMSE lower than this value.
         verbose : bool
             Prints out extra information about steps taken.
         """
@@ -354,6 +371,9 @@ class ModelIsotherm(BaseIsotherm):
             branch=branch,
             models=model,
             optimization_params=optimization_params,
+            n_jobs=n_jobs,
+            executor=executor,
+            rmse_threshold=rmse_threshold,
             verbose=verbose,
             **iso_params
         )
@@ -370,6 +390,9 @@ class ModelIsotherm(BaseIsotherm):
         models='guess',
         optimization_params: dict = None,
         param_bounds: dict = None,
+        n_jobs: int = 1,
+        executor: Executor = None,
+        rmse_threshold: float = None,
         verbose: bool = False,
         **other_properties
     ):
@@ -378,6 +401,8 @@ class ModelIsotherm(BaseIsotherm):
         then return the one with the best RMS fit.
 
         May take a long time depending on the number of datapoints.
+        The models can be fitted concurrently by specifying ``n_jobs``
+        or passing an ``executor``.
 
         Parameters
         ----------
@@ -403,10 +428,25 @@ class ModelIsotherm(BaseIsotherm):
             Dictionary to be passed to the minimization function to use in fitting model to data.
             See `here
             <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+        param_bounds : dict
+            Bounds for model parameters in the data fitting routine.
+            Only the bounds applicable to each model are used.
         branch : ['ads', 'des'], optional
             The branch on which the model isotherm is based on. It is assumed to be the
             adsorption branch, as it is the most commonly modelled part, although may
             set to desorption as well.
+        n_jobs : int, optional
+            Number of models to fit at the same time in a thread pool.
+            Defaults to 1 (sequential fitting), while -1 uses one thread per processor.
+            As fitting mostly holds the GIL, threads give little speedup: pass
+            a ``ProcessPoolExecutor`` as ``executor`` for parallel fitting.
+        executor : concurrent.futures.Executor, optional
+            An executor (such as a ``ProcessPoolExecutor``) in which to fit the models.
+            Takes precedence over ``n_jobs`` and is not shut down afterwards.
+        rmse_threshold : float, optional
+            Stop as soon as a model fits the data with a RMSE lower than
+            this value. Models are checked in the order given, such that the
+            result does not depend on the number of workers.
         verbose : bool, optional
             Prints out extra information about steps taken.
         other_properties:
@@ -427,39 +467,71 @@ class ModelIsotherm(BaseIsotherm):
                     f'Not all models correspond to internal models. Possible models are f{models}'
                 )
 
-        for model in guess_models:
-            if param_bounds is not None:
-                params = get_isotherm_model(model).params.keys()
-                param_bounds = {key: param_bounds[key] for key in param_bounds if key in params}
-            try:
-                isotherm = cls(
-                    pressure=pressure,
-                    loading=loading,
-                    isotherm_data=isotherm_data,
-                    pressure_key=pressure_key,
-                    loading_key=loading_key,
-                    model=model,
-                    param_guess=None,
-                    param_bounds=param_bounds,
-                    optimization_params=optimization_params,
-                    branch=branch,
-                    verbose=verbose,
-                    plot_fit=False,  # we don't want to plot at this stage
-                    **other_properties
-                )
-
-                attempts.append(isotherm)
+        fit_params = dict(
+            pressure=pressure,
+            loading=loading,
+            isotherm_data=isotherm_data,
+            pressure_key=pressure_key,
+            loading_key=loading_key,
+            param_guess=None,
+            optimization_params=optimization_params,
+            branch=branch,
+            verbose=verbose,
+            plot_fit=False,  # we don't want to plot at this stage
+            **other_properties
+        )
 
-            except CalculationError as err:
-                logger.info(f"Modelling using {model} failed.")
-                if verbose:
-                    logger.info(f"\n{err}")
+        def model_bounds(model):
+            if param_bounds is None:
+                return None
+            params = get_isotherm_model(model).params.keys()
+            return {key: param_bounds[key] for key in param_bounds if key in params}
+
+        pool = executor
+        if pool is None and n_jobs != 1:
+            pool = ThreadPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None)
+
+        futures = []
+        if pool is not None:
+            futures = [
+                pool.submit(cls, model=model, param_bounds=model_bounds(model), **fit_params)
+                for model in guess_models
+            ]
+
+        try:
+            # Results are collected in the order of the models
+            for index, model in enumerate(guess_models):
+                try:
+                    if futures:
+                        isotherm = futures[index].result()
+                    else:
+                        isotherm = cls(model=model, param_bounds=model_bounds(model), **fit_params)
+
+                    attempts.append(isotherm)
+
+                except CalculationError as err:
+                    logger.info(f"Modelling using {model} failed.")
+                    if verbose:
+                        logger.info(f"\n{err}")
+                    continue
+
+                if rmse_threshold is not None and isotherm.model.rmse < rmse_threshold:
+                    break
+
+        finally:
+            # Models left after an early stop are not fitted
+            if pool is not None and executor is None and sys.version_info >= (3, 9):
+                pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                for future in futures:
+                    future.cancel()
+                if pool is not None and executor is None:
+                    pool.shutdown(wait=False)
 
         if not attempts:
             raise CalculationError("No model could be reliably fit on the isotherm.")
 
-        errors = [x.model.rmse for x in attempts]
-        best_fit = attempts[errors.index(min(errors))]
+        best_fit = min(attempts, key=lambda x: x.model.rmse)
 
         if verbose:
             if loading is None:
@@ -1082,6 +1154,70 @@ class ModelIsotherm(BaseIsotherm):
         # calculate based on model
         return self.model.spreading_pressure(pressure)
 
+    def pressure_at_spreading_pressure(
+        self,
+        spreading_pressure: t.Union[float, t.List[float]],
+        branch: str = None,
+        pressure_unit: str = None,
+        pressure_mode: str = None,
+    ):
+        r"""
+        Calculate the bulk gas pressure P at which a reduced spreading
+        pressure is reached.
+
+        This is the inverse of the spreading pressure,
+        :math:`p^0(\Pi)`, required for IAST calculations. It is
+        interpolated from a table of the spreading pressure which is
+        cached by the model, then refined numerically.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure, :math:`\Pi`, in the loading units of the isotherm.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+        pressure_unit : str
+            Unit the pressure is returned in. If ``None``, it defaults to
+            internal isotherm units.
+        pressure_mode : str
+            The mode the pressure is returned in. If ``None``, it defaults to
+            internal isotherm mode.
+
+        Returns
+        -------
+        float or array
+            Pressure at the spreading pressure given, or ``nan``
+            if it cannot be reached.
+
+        """
+        if branch and branch != self.branch:
+            raise ParameterError(
+                f"ModelIsotherm is based on an '{self.branch}' branch "
+                f"(while parameter supplied was '{branch}')."
+            )
+
+        # Calculate pressure using internal model
+        pressure = self.model.spreading_pressure_inverse(spreading_pressure)
+
+        # Ensure pressure is in correct units and mode requested
+        if pressure_mode or pressure_unit:
+            if not pressure_mode:
+                pressure_mode = self.pressure_mode
+            if not pressure_unit:
+                pressure_unit = self.pressure_unit
+
+            pressure = c_pressure(
+                pressure,
+                mode_from=self.pressure_mode,
+                mode_to=pressure_mode,
+                unit_from=self.pressure_unit,
+                unit_to=pressure_unit,
+                adsorbate=self.adsorbate,
+                temp=self.temperature
+            )
+
+        return pressure
+
     def toth_correction_at(
         self,
         pressure: t.Union[float, t.List[float]],
@@ -16,7 +16,9 @@ from pygaps.units.converter_mode import c_pressure
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
 from pygaps.utilities.exceptions import pgError
+from pygaps.utilities.isotherm_integrator import IsothermIntegrator
 from pygaps.utilities.isotherm_interpolator import IsothermInterpolator
+from pygaps.utilities.math_utilities import isotonic_regression
 
 
 class PointIsotherm(BaseIsotherm):
@@ -57,6 +59,10 @@ class PointIsotherm(BaseIsotherm):
         detailed info for each data point if adsorption points ('False')
         or desorption points ('True'). eg: [False, False, True, True...]
         or as a column of the isotherm_data.
+    compact : bool, optional
+        Store the data as contiguous arrays instead of a pandas.DataFrame,
+        which reduces the memory used by each isotherm. The DataFrame is
+        only built when requested through ``data()`` or ``data_raw``.
     material : str
         Name of the material on which the isotherm is measured.
     adsorbate : str
@@ -88,12 +94,27 @@ class PointIsotherm(BaseIsotherm):
     Detection of adsorption/desorption branches will not work if
     data is noisy.
 
+    In compact mode, the DataFrame returned by ``data_raw`` is built when
+    requested and kept until the isotherm data is next used, when any
+    changes made to it are stored back in the arrays. Later changes to
+    the same DataFrame are not stored: request ``data_raw`` again instead.
+
     """
 
+    # Number of interpolators kept for pressure_at / loading_at.
+    _interpolator_cache_size = 8
+
     _reserved_params = BaseIsotherm._reserved_params + [
         'data_raw',
+        '_data_raw',
+        '_data_arrays',
+        '_data_index',
+        '_branch_index',
+        '_data_views',
         'l_interpolator',
         'p_interpolator',
+        '_interpolators',
+        '_sp_integrators',
         'loading_key',
         'pressure_key',
         'other_keys',
@@ -110,6 +131,7 @@ class PointIsotherm(BaseIsotherm):
         pressure_key: str = None,
         loading_key: str = None,
         branch: t.Union[str, t.List[bool]] = 'guess',
+        compact: bool = False,
         **other_properties
     ):
         """
@@ -120,6 +142,9 @@ class PointIsotherm(BaseIsotherm):
         # Run base class constructor
         super().__init__(**other_properties)
 
+        # Arrays holding the data, if stored in compact mode.
+        self._data_arrays = None
+
         # Checks
         if isotherm_data is not None:
             if None in [pressure_key, loading_key]:
@@ -195,12 +220,24 @@ class PointIsotherm(BaseIsotherm):
             except Exception as e_info:
                 raise ParameterError(e_info)
 
+        if compact:
+            self._compact()
+
         # The internal interpolator for loading given pressure.
         self.l_interpolator = None
 
         # The internal interpolator for pressure given loading.
         self.p_interpolator = None
 
+        # Recently used interpolators, per direction, branch, kind and fill.
+        self._interpolators = {}
+
+        # The spreading pressure integrators, per branch and units.
+        self._sp_integrators = {}
+
+        # The converted data columns, per branch and units.
+        self._data_views = {}
+
     @classmethod
     def from_isotherm(
         cls,
@@ -404,8 +441,8 @@ class PointIsotherm(BaseIsotherm):
             return
 
         try:
-            self.data_raw[self.pressure_key] = c_pressure(
-                self.data_raw[self.pressure_key],
+            pressure = c_pressure(
+                self._column(self.pressure_key),
                 mode_from=self.pressure_mode,
                 mode_to=mode_to,
                 unit_from=self.pressure_unit,
@@ -420,6 +457,7 @@ class PointIsotherm(BaseIsotherm):
                 "Is your isotherm supercritical? "
                 "Does the adsorbate have a thermodynamical backend?"
             ) from err
+        self._set_column(self.pressure_key, pressure)
 
         if mode_to != self.pressure_mode:
             self.pressure_mode = mode_to
@@ -428,9 +466,8 @@ class PointIsotherm(BaseIsotherm):
         else:
             self.pressure_unit = None
 
-        # Reset interpolators
-        self.l_interpolator = None
-        self.p_interpolator = None
+        # Reset cached data
+        self._reset_cache()
 
         if verbose:
             logger.info(f"Changed pressure to mode '{mode_to}', unit '{unit_to}'.")
@@ -471,8 +508,8 @@ class PointIsotherm(BaseIsotherm):
                     logger.info("There are no loading units in this mode.")
                 return
 
-        self.data_raw[self.loading_key] = c_loading(
-            self.data_raw[self.loading_key],
+        loading = c_loading(
+            self._column(self.loading_key),
             basis_from=self.loading_basis,
             basis_to=basis_to,
             unit_from=self.loading_unit,
@@ -482,6 +519,7 @@ class PointIsotherm(BaseIsotherm):
             basis_material=self.material_basis,
             unit_material=self.material_unit,
         )
+        self._set_column(self.loading_key, loading)
 
         if basis_to != self.loading_basis:
             self.loading_basis = basis_to
@@ -490,9 +528,8 @@ class PointIsotherm(BaseIsotherm):
         else:
             self.loading_unit = unit_to
 
-        # Reset interpolators
-        self.l_interpolator = None
-        self.p_interpolator = None
+        # Reset cached data
+        self._reset_cache()
 
         if verbose:
             logger.info(f"Changed loading to basis '{basis_to}', unit '{unit_to}'.")
@@ -539,8 +576,8 @@ class PointIsotherm(BaseIsotherm):
                 logger.info("There are no material units in this mode.")
             return
 
-        self.data_raw[self.loading_key] = c_material(
-            self.data_raw[self.loading_key],
+        loading = c_material(
+            self._column(self.loading_key),
             basis_from=self.material_basis,
             basis_to=basis_to,
             unit_from=self.material_unit,
@@ -561,8 +598,8 @@ class PointIsotherm(BaseIsotherm):
                 _basis_from = 'volume_liquid'
             else:
                 _basis_from = self.material_basis
-            self.data_raw[self.loading_key] = c_loading(
-                self.data_raw[self.loading_key],
+            loading = c_loading(
+                loading,
                 basis_from=_basis_from,
                 basis_to=_basis_to,
                 unit_from=self.material_unit,
@@ -572,19 +609,40 @@ class PointIsotherm(BaseIsotherm):
             )
             if verbose:
                 logger.info(f"Changed loading to basis '{basis_to}', unit '{unit_to}'.")
+        self._set_column(self.loading_key, loading)
 
         if unit_to != self.material_unit:
             self.material_unit = unit_to
         if basis_to != self.material_basis:
             self.material_basis = basis_to
 
-        # Reset interpolators
-        self.l_interpolator = None
-        self.p_interpolator = None
+        # Reset cached data
+        self._reset_cache()
 
         if verbose:
             logger.info(f"Changed material to basis '{basis_to}', unit '{unit_to}'.")
 
+    def _reset_cache(self):
+        """Discard any views or interpolators built on the current isotherm data."""
+        self.l_interpolator = None
+        self.p_interpolator = None
+        self._interpolators = {}
+        self._sp_integrators = {}
+        self._data_views = {}
+
+    # Relative pressures depend on the adsorbate and temperature,
+    # so cached views must be discarded when either changes.
+
+    @BaseIsotherm.adsorbate.setter
+    def adsorbate(self, value):
+        BaseIsotherm.adsorbate.fset(self, value)
+        self._reset_cache()
+
+    @BaseIsotherm.temperature.setter
+    def temperature(self, value):
+        BaseIsotherm.temperature.fset(self, value)
+        self._reset_cache()
+
     ###########################################################
     #   Info functions
 
@@ -646,6 +704,113 @@ class PointIsotherm(BaseIsotherm):
     ##########################################################
     #   Functions that return part of the isotherm data
 
+    @property
+    def data_raw(self) -> pandas.DataFrame:
+        """Return the DataFrame holding all isotherm data."""
+        if self._data_arrays is not None and self._data_raw is None:
+            # kept until the arrays are next used, see _store_data_raw
+            self._data_raw = pandas.DataFrame(self._data_arrays, index=self._data_index)
+        return self._data_raw
+
+    @data_raw.setter
+    def data_raw(self, data: pandas.DataFrame):
+        self._data_raw = data
+        if self._data_arrays is not None:
+            self._compact()
+        self._reset_cache()
+
+    @property
+    def compact(self) -> bool:
+        """Whether the isotherm data is stored as arrays instead of a DataFrame."""
+        return self._data_arrays is not None
+
+    def _compact(self):
+        """Move the isotherm data from the DataFrame into contiguous arrays."""
+        data = self._data_raw
+        self._data_arrays = {
+            column: numpy.ascontiguousarray(data[column].to_numpy())
+            for column in data.columns
+        }
+
+        # A default index does not need to be stored
+        self._data_index = data.index
+        if data.index.equals(pandas.RangeIndex(len(data))):
+            self._data_index = None
+
+        # Branches are usually contiguous and can be taken as slices
+        self._branch_index = {}
+        for branch, value in (('ads', 0), ('des', 1)):
+            index = numpy.flatnonzero(self._data_arrays['branch'] == value)
+            if len(index) == 0:
+                index = slice(0, 0)
+            elif index[-1] - index[0] + 1 == len(index):
+                index = slice(index[0], index[-1] + 1)
+            self._branch_index[branch] = index
+
+        self._data_raw = None
+
+    def _store_data_raw(self):
+        """Store any changes made to the DataFrame built in compact mode."""
+        if self._data_arrays is None or self._data_raw is None:
+            return
+        arrays = self._data_arrays
+        self._compact()
+        if arrays.keys() != self._data_arrays.keys() or not all(
+            numpy.array_equal(arrays[key], self._data_arrays[key]) for key in arrays
+        ):
+            self._reset_cache()
+
+    def _column(
+        self,
+        key: str,
+        branch: str = None,
+    ) -> t.Union[numpy.ndarray, pandas.Series]:
+        """Return a column of data, as an array if the isotherm is compact."""
+        self._store_data_raw()
+        if self._data_arrays is None:
+            return self.data(branch=branch).loc[:, key]
+        if branch is None or branch.startswith('all'):
+            return self._data_arrays[key]
+        if branch in self._branch_index:
+            return self._data_arrays[key][self._branch_index[branch]]
+        raise ParameterError('Bad branch specification.')
+
+    def _set_column(self, key: str, values: t.Union[numpy.ndarray, pandas.Series]):
+        """Replace a column of data."""
+        self._store_data_raw()
+        if self._data_arrays is None:
+            self._data_raw[key] = values
+        else:
+            self._data_arrays[key] = numpy.ascontiguousarray(values)
+
+    def _select(
+        self,
+        ret: t.Union[numpy.ndarray, pandas.Series],
+        branch: str = None,
+        limits: t.Tuple[float, float] = None,
+        indexed: bool = False,
+    ) -> t.Union[numpy.ndarray, pandas.Series]:
+        """Select the data within limits and return it as an array or Series."""
+        if indexed and not isinstance(ret, pandas.Series):
+            index = self._data_index
+            if index is None:
+                index = pandas.RangeIndex(len(self._data_arrays['branch']))
+            if branch in self._branch_index:
+                index = index[self._branch_index[branch]]
+            ret = pandas.Series(ret, index=index)
+
+        # Select required points
+        if len(ret) and limits and any(limits):
+            ret = ret[(ret >= (-numpy.inf if limits[0] is None else limits[0]))
+                      & (ret <= (numpy.inf if limits[1] is None else limits[1]))]
+        else:
+            # Cached views must not be modified by the caller
+            ret = ret.copy()
+
+        if indexed:
+            return ret
+        return numpy.asarray(ret)
+
     def data(self, branch: str = None) -> pandas.DataFrame:
         """
         Return underlying isotherm data.
@@ -662,12 +827,13 @@ class PointIsotherm(BaseIsotherm):
             The pandas DataFrame containing all isotherm data.
 
         """
+        data = self.data_raw
         if branch is None or branch.startswith('all'):
-            return self.data_raw
+            return data
         if branch == 'ads':
-            return self.data_raw.loc[self.data_raw['branch'] == 0]
+            return data.loc[data['branch'] == 0]
         if branch == 'des':
-            return self.data_raw.loc[self.data_raw['branch'] == 1]
+            return data.loc[data['branch'] == 1]
         raise ParameterError('Bad branch specification.')
 
     def pressure(
@@ -705,45 +871,15 @@ class PointIsotherm(BaseIsotherm):
             The pressure slice corresponding to the parameters passed.
 
         """
-        ret = self.data(branch=branch).loc[:, self.pressure_key]
+        # Converted columns are cached, as conversions can be expensive
+        self._store_data_raw()
+        view_key = ('pressure', branch, pressure_unit, pressure_mode)
+        ret = self._data_views.get(view_key)
+        if ret is None:
+            ret = self._pressure_view(branch, pressure_unit, pressure_mode)
+            self._data_views[view_key] = ret
 
-        if not ret.empty:
-            # Convert if needed
-            if pressure_mode or pressure_unit:
-                # If pressure mode not given, try current
-                if not pressure_mode:
-                    pressure_mode = self.pressure_mode
-                # If pressure unit not given, try current
-                if not pressure_unit:
-                    pressure_unit = self.pressure_unit
-
-                try:
-                    ret = c_pressure(
-                        ret,
-                        mode_from=self.pressure_mode,
-                        mode_to=pressure_mode,
-                        unit_from=self.pressure_unit,
-                        unit_to=pressure_unit,
-                        adsorbate=self.adsorbate,
-                        temp=self.temperature
-                    )
-                except pgError as err:
-                    raise CalculationError(
-                        f"The pressure cannot be read in a {pressure_mode} basis ({pressure_unit}). "
-                        "Is your isotherm supercritical? "
-                        "Does the adsorbate have a thermodynamical backend?"
-                    ) from err
-
-            # Select required points
-            if limits and any(limits):
-                ret = ret.loc[ret.between(
-                    -numpy.inf if limits[0] is None else limits[0],
-                    numpy.inf if limits[1] is None else limits[1]
-                )]
-
-        if indexed:
-            return ret
-        return ret.values
+        return self._select(ret, branch, limits, indexed)
 
     def loading(
         self,
@@ -788,9 +924,72 @@ class PointIsotherm(BaseIsotherm):
             The loading slice corresponding to the parameters passed.
 
         """
-        ret = self.data(branch=branch).loc[:, self.loading_key]
+        # Converted columns are cached, as conversions can be expensive
+        self._store_data_raw()
+        view_key = ('loading', branch, loading_unit, loading_basis, material_unit, material_basis)
+        ret = self._data_views.get(view_key)
+        if ret is None:
+            ret = self._loading_view(
+                branch,
+                loading_unit,
+                loading_basis,
+                material_unit,
+                material_basis,
+            )
+            self._data_views[view_key] = ret
+
+        return self._select(ret, branch, limits, indexed)
 
-        if not ret.empty:
+    def _pressure_view(
+        self,
+        branch: str = None,
+        pressure_unit: str = None,
+        pressure_mode: str = None,
+    ) -> pandas.Series:
+        """Return the pressure column of a branch, converted if required."""
+        ret = self._column(self.pressure_key, branch)
+
+        if len(ret):
+            # Convert if needed
+            if pressure_mode or pressure_unit:
+                # If pressure mode not given, try current
+                if not pressure_mode:
+                    pressure_mode = self.pressure_mode
+                # If pressure unit not given, try current
+                if not pressure_unit:
+                    pressure_unit = self.pressure_unit
+
+                try:
+                    ret = c_pressure(
+                        ret,
+                        mode_from=self.pressure_mode,
+                        mode_to=pressure_mode,
+                        unit_from=self.pressure_unit,
+                        unit_to=pressure_unit,
+                        adsorbate=self.adsorbate,
+                        temp=self.temperature
+                    )
+                except pgError as err:
+                    raise CalculationError(
+                        f"The pressure cannot be read in a {pressure_mode} basis ({pressure_unit}). "
+                        "Is your isotherm supercritical? "
+                        "Does the adsorbate have a thermodynamical backend?"
+                    ) from err
+
+        return ret
+
+    def _loading_view(
+        self,
+        branch: str = None,
+        loading_unit: str = None,
+        loading_basis: str = None,
+        material_unit: str = None,
+        material_basis: str = None,
+    ) -> pandas.Series:
+        """Return the loading column of a branch, converted if required."""
+        ret = self._column(self.loading_key, branch)
+
+        if len(ret):
             # Convert if needed
 
             # First adsorbent is converted
@@ -831,26 +1030,19 @@ class PointIsotherm(BaseIsotherm):
                     unit_material=material_unit,
                 )
 
-            # Select required points
-            if limits and any(limits):
-                ret = ret.loc[ret.between(
-                    -numpy.inf if limits[0] is None else limits[0],
-                    numpy.inf if limits[1] is None else limits[1]
-                )]
-
-        if indexed:
-            return ret
-        return ret.values
+        return ret
 
     @property
     def other_keys(self):
         """
         Return column names of any supplementary data points.
         """
-        return [
-            c for c in self.data_raw.columns
-            if c not in (self.pressure_key, self.loading_key, 'branch')
-        ]
+        self._store_data_raw()
+        if self._data_arrays is None:
+            columns = self._data_raw.columns
+        else:
+            columns = self._data_arrays.keys()
+        return [c for c in columns if c not in (self.pressure_key, self.loading_key, 'branch')]
 
     def other_data(
         self,
@@ -883,19 +1075,7 @@ class PointIsotherm(BaseIsotherm):
 
         """
         if key in self.other_keys:
-            ret = self.data(branch=branch).loc[:, key]
-
-            if not ret.empty:
-                # Select required points
-                if limits and any(limits):
-                    ret = ret.loc[ret.between(
-                        -numpy.inf if limits[0] is None else limits[0],
-                        numpy.inf if limits[1] is None else limits[1]
-                    )]
-
-            if indexed:
-                return ret
-            return ret.values
+            return self._select(self._column(key, branch), branch, limits, indexed)
 
         raise ParameterError(f"Isotherm does not contain any {key} data.")
 
@@ -914,7 +1094,7 @@ class PointIsotherm(BaseIsotherm):
             Whether the data exists or not.
 
         """
-        return not self.data(branch=branch).empty
+        return len(self._column(self.pressure_key, branch)) > 0
 
     ##########################################################
     #   Functions that interpolate values of the isotherm data
@@ -931,6 +1111,7 @@ class PointIsotherm(BaseIsotherm):
         loading_basis: str = None,
         material_unit: str = None,
         material_basis: str = None,
+        monotonic: bool = False,
     ) -> numpy.ndarray:
         """
         Interpolate isotherm to compute pressure at any loading given.
@@ -942,8 +1123,9 @@ class PointIsotherm(BaseIsotherm):
         branch : {'ads', 'des'}
             The branch of the use for calculation. Defaults to adsorption.
         interpolation_type : str
-            The type of scipy.interp1d used: `linear`, `nearest`, `zero`,
-            `slinear`, `quadratic`, `cubic`. It defaults to `linear`.
+            The type of interpolation used: `linear`, `nearest`, `zero`,
+            `slinear`, `quadratic`, `cubic` as in scipy.interp1d, or a
+            monotonic `pchip`. It defaults to `linear`.
         interp_fill : array-like or (array-like, array_like) or “extrapolate”, optional
             Parameter to determine what to do outside data bounds.
             Passed to the scipy.interpolate.interp1d function as ``fill_value``.
@@ -968,6 +1150,10 @@ class PointIsotherm(BaseIsotherm):
         material_basis : str
             The basis the loading is passed in. If ``None``, it defaults to
             internal isotherm basis.
+        monotonic : bool, optional
+            Whether to make the loading non-decreasing with pressure before
+            interpolating, through an isotonic regression. Use on noisy
+            data where the loading cannot otherwise be inverted.
 
         Returns
         -------
@@ -978,19 +1164,10 @@ class PointIsotherm(BaseIsotherm):
         # Convert to numpy array just in case
         loading = numpy.asarray(loading)
 
-        # Check if interpolator is applicable
-        if (
-            self.p_interpolator is None or self.p_interpolator.interp_branch != branch
-            or self.p_interpolator.interp_kind != interpolation_type
-            or self.p_interpolator.interp_fill != interp_fill
-        ):
-            self.p_interpolator = IsothermInterpolator(
-                self.loading(branch=branch),
-                self.pressure(branch=branch),
-                interp_branch=branch,
-                interp_kind=interpolation_type,
-                interp_fill=interp_fill
-            )
+        # Get an interpolator, reusing one if possible
+        self.p_interpolator = self._interpolator(
+            'pressure', branch, interpolation_type, interp_fill, monotonic
+        )
 
         # Ensure loading is in correct units and basis for the internal model
         if material_basis or material_unit:
@@ -1073,8 +1250,9 @@ class PointIsotherm(BaseIsotherm):
         branch : {'ads', 'des'}
             The branch the interpolation takes into account.
         interpolation_type : str
-            The type of scipy.interp1d used: `linear`, `nearest`, `zero`,
-            `slinear`, `quadratic`, `cubic`. It defaults to `linear`.
+            The type of interpolation used: `linear`, `nearest`, `zero`,
+            `slinear`, `quadratic`, `cubic` as in scipy.interp1d, or a
+            monotonic `pchip`. It defaults to `linear`.
         interp_fill : array-like or (array-like, array_like) or “extrapolate”, optional
             Parameter to determine what to do outside data bounds.
             Passed to the scipy.interpolate.interp1d function as ``fill_value``.
@@ -1109,19 +1287,8 @@ class PointIsotherm(BaseIsotherm):
         # Convert to a numpy array just in case
         pressure = numpy.asarray(pressure)
 
-        # Check if interpolator is applicable
-        if (
-            self.l_interpolator is None or self.l_interpolator.interp_branch != branch
-            or self.l_interpolator.interp_kind != interpolation_type
-            or self.l_interpolator.interp_fill != interp_fill
-        ):
-            self.l_interpolator = IsothermInterpolator(
-                self.pressure(branch=branch),
-                self.loading(branch=branch),
-                interp_branch=branch,
-                interp_kind=interpolation_type,
-                interp_fill=interp_fill
-            )
+        # Get an interpolator, reusing one if possible
+        self.l_interpolator = self._interpolator('loading', branch, interpolation_type, interp_fill)
 
         # Ensure pressure is in correct units and mode for the internal model
         if pressure_mode or pressure_unit:
@@ -1178,6 +1345,67 @@ class PointIsotherm(BaseIsotherm):
 
         return loading
 
+    def _interpolator(
+        self,
+        interp_on: str,
+        branch: str,
+        interpolation_type: str,
+        interp_fill,
+        monotonic: bool = False,
+    ) -> IsothermInterpolator:
+        """
+        Return an interpolator for pressure or loading on a branch.
+
+        The last few interpolators are kept in internal units, such that
+        alternating between kinds, fills or branches does not rebuild them.
+        They are discarded when the isotherm is converted.
+
+        If `monotonic`, the loading is first fitted with an isotonic
+        regression in pressure, and each pooled block of points is
+        replaced by its mean pressure and loading.
+        """
+        fill_key = interp_fill
+        if numpy.ndim(interp_fill):
+            fill_key = tuple(numpy.ravel(interp_fill).tolist())
+        key = (
+            interp_on,
+            branch,
+            interpolation_type,
+            fill_key,
+            monotonic,
+            self.pressure_mode,
+            self.pressure_unit,
+            self.loading_basis,
+            self.loading_unit,
+            self.material_basis,
+            self.material_unit,
+        )
+
+        self._store_data_raw()
+        interpolator = self._interpolators.pop(key, None)
+        if interpolator is None:
+            known, interp = self.loading(branch=branch), self.pressure(branch=branch)
+            if monotonic:
+                order = numpy.argsort(interp, kind='mergesort')
+                known, sizes = isotonic_regression(known[order])
+                starts = numpy.concatenate(([0], numpy.cumsum(sizes)[:-1]))
+                interp = numpy.add.reduceat(interp[order], starts) / sizes
+            if interp_on == 'loading':
+                known, interp = interp, known
+            interpolator = IsothermInterpolator(
+                known,
+                interp,
+                interp_branch=branch,
+                interp_kind=interpolation_type,
+                interp_fill=interp_fill,
+            )
+            if len(self._interpolators) >= self._interpolator_cache_size:
+                del self._interpolators[next(iter(self._interpolators))]
+
+        # Most recently used interpolators are last
+        self._interpolators[key] = interpolator
+        return interpolator
+
     def spreading_pressure_at(
         self,
         pressure: t.List[float],
@@ -1201,13 +1429,15 @@ class PointIsotherm(BaseIsotherm):
             \Pi(p) = \int_0^p \frac{q(\hat{p})}{ \hat{p}} d\hat{p}.
 
         In this integral, the isotherm :math:`q(\hat{p})` is represented by a
-        linear interpolation of the data.
+        linear interpolation of the data. The cumulative integral at each
+        data point is computed once for each branch and set of units, then
+        reused until the isotherm is converted.
 
         For in-detail explanations, check reference [#]_.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             Pressure (in corresponding units as data in instantiation).
         branch : {'ads', 'des'}
             The branch of the use for calculation. Defaults to adsorption.
@@ -1230,7 +1460,7 @@ class PointIsotherm(BaseIsotherm):
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure, :math:`\Pi`.
 
         References
@@ -1239,28 +1469,30 @@ class PointIsotherm(BaseIsotherm):
            Theory (IAST) Python Package. Computer Physics Communications.
 
         """
-        # Get all data points
-        pressures = self.pressure(
-            branch=branch, pressure_unit=pressure_unit, pressure_mode=pressure_mode
-        )
-        loadings = self.loading(
+        # Convert to numpy array just in case
+        pressure = numpy.asarray(pressure)
+
+        # Get the integrator for this branch and set of units
+        integrator = self._spreading_pressure_integrator(
             branch=branch,
+            pressure_unit=pressure_unit,
+            pressure_mode=pressure_mode,
             loading_unit=loading_unit,
             loading_basis=loading_basis,
             material_unit=material_unit,
-            material_basis=material_basis
+            material_basis=material_basis,
         )
+        p_max = integrator.pressure[-1]
 
         # Check if we need to extrapolate beyond available data
-        if (self.l_interpolator is not None and self.l_interpolator.interp_fill is None) & \
-                (pressure > pressures.max() or pressure < pressures.min()):
+        if interp_fill is None and numpy.any(pressure > p_max):
             raise CalculationError(
                 textwrap.dedent(
                     f"""
                 To compute the spreading pressure at this bulk adsorbate pressure,
-                we would need to extrapolate the isotherm since this pressure ({pressure:.3g} {self.pressure_unit})
+                we would need to extrapolate the isotherm since this pressure ({pressure.max():.3g} {self.pressure_unit})
                 is outside the range of the highest pressure in your pure-component
-                isotherm data ({pressures.max()} {self.pressure_unit}).
+                isotherm data ({p_max} {self.pressure_unit}).
 
                 At present, the PointIsotherm class is set to throw an exception
                 when this occurs, as we do not have data outside this pressure range
@@ -1269,7 +1501,7 @@ class PointIsotherm(BaseIsotherm):
                 Option 1: fit an analytical model to extrapolate the isotherm
                 Option 2: pass a `interp_fill` to the spreading pressure function of the
                     PointIsotherm object. Then, that PointIsotherm will
-                    assume that the uptake beyond {pressures.max()} {self.pressure_unit} is given by
+                    assume that the uptake beyond {p_max} {self.pressure_unit} is given by
                     `interp_fill`. This is reasonable if your isotherm data exhibits
                     a plateau at the highest pressures.
                 Option 3: Go back to the lab or computer to collect isotherm data
@@ -1278,35 +1510,69 @@ class PointIsotherm(BaseIsotherm):
                 )
             )
 
-        # Step 1: Approximate loading up to first pressure point with Henry's law
-        # loading = henry_const * P where henry_const is the initial slope
-        henry_const = loadings[0] / pressures[0]
-
-        # Step 2: Find how many points are less than target pressure P
-        n_points = numpy.sum(pressures < pressure)
-
-        if n_points == 0:
-            # Step 3a: If P is between 0 and first pressure point
-            # The integral simplifies to henry_const * P
-            return henry_const * pressure
-
-        # Step 3b: P > first pressure point - calculate the total area
-        # Area of first segment from 0 to P_1
-        area = loadings[0]
-
-        # Step 4: Calculate area between P_1 and P_k where P_k < P < P_{k+1}
-        # using linear interpolation of isotherm data
-        for i in range(n_points - 1):
-            slope = (loadings[i + 1] - loadings[i]) / (pressures[i + 1] - pressures[i])
-            intercept = loadings[i] - slope * pressures[i]
-            # Add area of this segment
-            area += slope * (pressures[i + 1] - pressures[i]) + intercept * \
-                numpy.log(pressures[i + 1] / pressures[i])
-
-        # Step 5: Calculate area of final segment from P_k to P
-        # Get the loading at pressure P using interpolation
-        loading_at_p = self.loading_at(
-            pressure,
+        return integrator(pressure, interp_fill=interp_fill)
+
+    def pressure_at_spreading_pressure(
+        self,
+        spreading_pressure: t.List[float],
+        branch: str = 'ads',
+        pressure_unit: str = None,
+        pressure_mode: str = None,
+        loading_unit: str = None,
+        loading_basis: str = None,
+        material_unit: str = None,
+        material_basis: str = None,
+    ) -> numpy.ndarray:
+        r"""
+        Calculate the bulk adsorbate pressure P at which a reduced spreading
+        pressure is reached.
+
+        This is the inverse of the spreading pressure, :math:`p^0(\Pi)`,
+        required for IAST calculations. As the spreading pressure increases
+        monotonically with pressure, it is found from the same cumulative
+        integral used by `spreading_pressure_at`, which is cached for each
+        branch and set of units.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure, :math:`\Pi`, in the loading units requested.
+        branch : {'ads', 'des'}
+            The branch of the use for calculation. Defaults to adsorption.
+        pressure_unit : str
+            Unit the pressure is returned in. If ``None``, it defaults to
+            internal isotherm units.
+        pressure_mode : str
+            The mode the pressure is returned in. If ``None``, it defaults to
+            internal isotherm mode.
+        loading_unit : str
+            Unit the loading is specified in. If ``None``, it defaults to
+            internal isotherm units.
+        loading_basis : str
+            The basis the loading is specified in. If ``None``, it defaults to
+            internal isotherm basis.
+        material_unit : str
+            Unit the material is specified in. If ``None``, it defaults to
+            internal isotherm units.
+        material_basis : str
+            The basis the loading is passed in. If ``None``, it defaults to
+            internal isotherm basis.
+
+        Returns
+        -------
+        float or array
+            Pressure at the spreading pressure given.
+
+        Raises
+        ------
+        CalculationError
+            If the spreading pressure is higher than at the highest
+            pressure in the isotherm data.
+
+        """
+        spreading_pressure = numpy.asarray(spreading_pressure)
+
+        integrator = self._spreading_pressure_integrator(
             branch=branch,
             pressure_unit=pressure_unit,
             pressure_mode=pressure_mode,
@@ -1314,15 +1580,58 @@ class PointIsotherm(BaseIsotherm):
             loading_basis=loading_basis,
             material_unit=material_unit,
             material_basis=material_basis,
-            interp_fill=interp_fill
         )
+        sp_max = integrator.cumulative[-1]
 
-        # Calculate the slope of the final segment
-        slope = (loading_at_p - loadings[n_points - 1]) / (pressure - pressures[n_points - 1])
-        intercept = loadings[n_points - 1] - slope * pressures[n_points - 1]
+        if numpy.any(spreading_pressure > sp_max):
+            raise CalculationError(
+                f"The spreading pressure ({spreading_pressure.max():.3g}) is higher than "
+                f"the spreading pressure at the highest pressure in the isotherm data "
+                f"({sp_max:.3g}). Fit a model to extrapolate the isotherm instead."
+            )
 
-        # Add the area of the final segment
-        area += slope * (pressure - pressures[n_points - 1]) + intercept * \
-            numpy.log(pressure / pressures[n_points - 1])
+        return integrator.inverse(spreading_pressure)
 
-        return area
+    def _spreading_pressure_integrator(
+        self,
+        branch: str = 'ads',
+        pressure_unit: str = None,
+        pressure_mode: str = None,
+        loading_unit: str = None,
+        loading_basis: str = None,
+        material_unit: str = None,
+        material_basis: str = None,
+    ) -> IsothermIntegrator:
+        """
+        Return the (cached) spreading pressure integrator for a branch and
+        set of units. Integrators are discarded when the isotherm is converted.
+        """
+        key = (
+            branch,
+            pressure_unit,
+            pressure_mode,
+            loading_unit,
+            loading_basis,
+            material_unit,
+            material_basis,
+        )
+        self._store_data_raw()
+        integrator = self._sp_integrators.get(key)
+        if integrator is None:
+            integrator = IsothermIntegrator(
+                self.pressure(
+                    branch=branch,
+                    pressure_unit=pressure_unit,
+                    pressure_mode=pressure_mode,
+                ),
+                self.loading(
+                    branch=branch,
+                    loading_unit=loading_unit,
+                    loading_basis=loading_basis,
+                    material_unit=material_unit,
+                    material_basis=material_basis,
+                ),
+                interp_branch=branch,
+            )
+            self._sp_integrators[key] = integrator
+        return integrator
@@ -1,9 +1,9 @@
 """
-Loading some data at import-time.
+Locations of pyGAPS data.
 
-Here is where objects such as adsorbates or materials are imported to be
-available for pyGAPS. These are populated at import-time. Also defines the
-internal database location.
+Here is where objects such as adsorbates or materials are made available
+for pyGAPS. These are loaded from the internal database the first time
+they are used. Also defines the internal database location.
 """
 # flake8: noqa
 # isort:skip_file
@@ -18,7 +18,9 @@ except ImportError:
     from importlib_resources import files as importlib_resources_files
 
 from contextlib import ExitStack
+from pathlib import Path
 import atexit
+import os
 
 # We use an exit stack and register it at interpreter exit to cleanup anything needed
 file_manager = ExitStack()
@@ -26,22 +28,47 @@ atexit.register(file_manager.close)
 ref = importlib_resources_files('pygaps.data') / 'default.db'
 DATABASE = file_manager.enter_context(importlib_resources.as_file(ref))
 
-# Lists of pygaps data
-MATERIAL_LIST = []
-ADSORBATE_LIST = []
+from pygaps.data.registry import DataRegistry
 
 
-def load_data():
-    """Will proceed with filling the data store."""
+def _load_materials():
+    """Read the materials in the internal database."""
+    from pygaps.parsing.sqlite import materials_from_db
+    return materials_from_db(verbose=False)
 
+
+def _load_adsorbates():
+    """Read the adsorbates in the internal database."""
     from pygaps.parsing.sqlite import adsorbates_from_db
-    from pygaps.parsing.sqlite import materials_from_db
+    return adsorbates_from_db(verbose=False)
+
+
+def _material_names(material):
+    """Materials are found by their exact name."""
+    return [material.name]
+
+
+def _adsorbate_names(adsorbate):
+    """Adsorbates are found by any alias, regardless of capitalisation."""
+    return adsorbate.alias
 
-    global MATERIAL_LIST
-    global ADSORBATE_LIST
 
-    MATERIAL_LIST.extend(materials_from_db(verbose=False))
-    ADSORBATE_LIST.extend(adsorbates_from_db(verbose=False))
+# Lists of pygaps data, populated on first access
+MATERIAL_LIST = DataRegistry(
+    loader=_load_materials,
+    keys=_material_names,
+)
+ADSORBATE_LIST = DataRegistry(
+    loader=_load_adsorbates,
+    keys=_adsorbate_names,
+    normalise=str.lower,
+)
+
+
+def load_data():
+    """Will proceed with filling the data store."""
+    MATERIAL_LIST.load()
+    ADSORBATE_LIST.load()
 
 
 # TODO These methods actually WILL not work if there's a Zip file or
@@ -55,6 +82,30 @@ KERNELS = {
     'DFT-N2-77K-carbon-slit': _kernel_res / 'DFT-N2-77K-carbon-slit.csv',
 }
 
+# Directory for data generated and cached by pyGAPS
+USER_CACHE = Path(
+    os.environ.get(
+        "PYGAPS_CACHE",
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pygaps",
+    )
+)
+
+# Locations for precomputed thermodynamic property tables, in search order
+PROPERTY_TABLES = [
+    USER_CACHE / "tables",
+    importlib_resources_files('pygaps.data') / "tables",
+]
+
+# Directories searched for kernels which are not in KERNELS, in search order.
+# Further directories can be given in the PYGAPS_KERNELS environment variable.
+KERNEL_DIRECTORIES = [
+    *(Path(path) for path in os.environ.get("PYGAPS_KERNELS", "").split(os.pathsep) if path),
+    USER_CACHE / "kernels",
+]
+
+# Location for saved Horvath-Kawazoe pore filling curves
+HK_CURVES = USER_CACHE / "hk_curves"
+
 # Locations for standard isotherms
 _stdiso_res = importlib_resources_files('pygaps.data') / "stdiso"
 STANDARD_ISOTHERMS = {
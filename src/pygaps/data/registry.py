@@ -0,0 +1,148 @@
+"""A list of pyGAPS objects which is populated when first used."""
+
+from collections import UserList
+
+
+class DataRegistry(UserList):
+    """
+    A list of adsorbates or materials, populated when first accessed.
+
+    Behaves as a normal list, but the objects in the internal
+    database are only loaded the first time the list is used, to
+    keep importing pyGAPS fast.
+
+    Objects are also indexed by name, such that ``find`` takes constant
+    time. The index is updated as objects are added, and rebuilt on the
+    next search after any are removed or reordered.
+
+    Parameters
+    ----------
+    initlist : list, optional
+        Initial contents of the list. If given, nothing is loaded.
+    loader : callable, optional
+        Function returning the objects to populate the list with.
+    keys : callable, optional
+        Function returning the names an object can be found by.
+    normalise : callable, optional
+        Function applied to names before they are indexed or searched,
+        for example to disregard capitalisation.
+
+    """
+    def __init__(self, initlist=None, loader=None, keys=None, normalise=None):
+        """Store the loader, without calling it."""
+        # UserList.__init__ is not called, as it would access data.
+        self._loader = loader
+        self._keys = keys
+        self._normalise = normalise
+        self._data = None if initlist is None else list(initlist)
+        self._index = None
+
+    @property
+    def data(self) -> list:
+        """The objects in the list, loaded if needed."""
+        if self._data is None:
+            # Set first, in case objects are stored as they are loaded
+            self._data = []
+            if self._loader is not None:
+                self._data.extend(self._loader())
+        return self._data
+
+    @data.setter
+    def data(self, value: list):
+        self._data = value
+        self._index = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the list has been populated."""
+        return self._data is not None
+
+    def load(self):
+        """Populate the list, if not already done."""
+        return self.data
+
+    def find(self, name: str):
+        """
+        Get the first object known by a name.
+
+        Parameters
+        ----------
+        name : str
+            The name to search for.
+
+        Returns
+        -------
+        object or None
+            The object, or None if no object has this name.
+        """
+        if self._index is None:
+            self._index = {}
+            for item in self.data:
+                self._index_item(item)
+        if self._normalise is not None:
+            name = self._normalise(name)
+        return self._index.get(name)
+
+    def _index_item(self, item):
+        """Add the names of an object to the index, keeping earlier objects."""
+        keys = [item] if self._keys is None else self._keys(item)
+        for key in keys:
+            if self._normalise is not None:
+                key = self._normalise(key)
+            self._index.setdefault(key, item)
+
+    # Additions at the end of the list update the index
+
+    def append(self, item):
+        super().append(item)
+        if self._index is not None:
+            self._index_item(item)
+
+    def extend(self, other):
+        start = len(self.data)
+        super().extend(other)
+        if self._index is not None:
+            for item in self.data[start:]:
+                self._index_item(item)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    # Other changes discard the index
+
+    def insert(self, i, item):
+        self._index = None
+        super().insert(i, item)
+
+    def remove(self, item):
+        self._index = None
+        super().remove(item)
+
+    def pop(self, i=-1):
+        self._index = None
+        return super().pop(i)
+
+    def clear(self):
+        self._index = None
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._index = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._index = None
+        super().reverse()
+
+    def __setitem__(self, i, item):
+        self._index = None
+        super().__setitem__(i, item)
+
+    def __delitem__(self, i):
+        self._index = None
+        super().__delitem__(i)
+
+    def __imul__(self, n):
+        self._index = None
+        return super().__imul__(n)
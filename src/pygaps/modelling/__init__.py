@@ -255,6 +255,9 @@ def model_iso(
     param_guess: dict = None,
     param_bounds: dict = None,
     optimization_params: dict = None,
+    n_jobs: int = 1,
+    executor: "concurrent.futures.Executor" = None,
+    rmse_threshold: float = None,
     verbose: bool = False,
 ):
     """
@@ -279,6 +282,17 @@ def model_iso(
         Dictionary to be passed to the minimization function to use in fitting model to data.
         See `here
         <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+    n_jobs : int, optional
+        When fitting several models, the number of models to fit at the
+        same time in a thread pool. Defaults to 1, -1 uses one thread per
+        processor. As fitting mostly holds the GIL, threads give little
+        speedup: pass a ``ProcessPoolExecutor`` as ``executor`` instead.
+    executor : concurrent.futures.Executor, optional
+        When fitting several models, an executor in which to fit them.
+        Takes precedence over ``n_jobs``.
+    rmse_threshold : float, optional
+        When fitting several models, stop as soon as a model fits the data
+        with a RMSE lower than this value.
     verbose : bool
         Prints out extra information about steps taken.
     """
@@ -290,5 +304,11 @@ def model_iso(
         param_guess=param_guess,
         param_bounds=param_bounds,
         optimization_params=optimization_params,
+        n_jobs=n_jobs,
+        executor=executor,
+        rmse_threshold=rmse_threshold,
         verbose=verbose,
     )
+
+
+from pygaps.modelling.batch_fit import fit_batch
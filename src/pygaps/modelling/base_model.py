@@ -1,13 +1,17 @@
 """Base class for all isotherm models."""
 
 import abc
+import functools
+import math
 
 import numpy
+from scipy import integrate
 from scipy import optimize
 
 from pygaps import logger
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.math_utilities import safe_newton
 
 
 class IsothermBaseModel():
@@ -35,6 +39,10 @@ class IsothermBaseModel():
     loading_range: "tuple[float,float]" = None
     # Model fit on the provided data
     rmse: float = None
+    # Cached cumulative spreading pressure table
+    _sp_table: tuple = None
+    # Cached table for the inverse of the spreading pressure
+    _sp_inverse: tuple = None
 
     def __init__(self, **params):
         """Populate instance-specific parameters."""
@@ -138,6 +146,50 @@ class IsothermBaseModel():
             Pressure at specified loading.
         """
 
+    def loading_jacobian(self, pressure: "list[float]"):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Used when fitting models which calculate the loading. If a model
+        does not override this function, the derivatives are
+        estimated numerically by finite differences.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        raise NotImplementedError("This model does not implement a loading Jacobian.")
+
+    def pressure_jacobian(self, loading: "list[float]"):
+        """
+        Calculate the derivatives of the pressure with respect to
+        each model parameter at specified loading.
+
+        Used when fitting models which calculate the pressure. If a model
+        does not override this function, the derivatives are
+        estimated numerically by finite differences.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        raise NotImplementedError("This model does not implement a pressure Jacobian.")
+
     @abc.abstractmethod
     def spreading_pressure(self, pressure: float) -> float:
         """
@@ -178,6 +230,196 @@ class IsothermBaseModel():
         """
         raise NotImplementedError("""This model does not implement T\'oth correction.""")
 
+    def spreading_pressure_integral(self, pressure: "list[float]"):
+        r"""
+        Calculate spreading pressure at specified gas pressure
+        by numerically integrating the loading.
+
+        .. math::
+
+            \pi = \int_{0}^{p_i} \frac{n_i(p)}{p} dp = \int_{-\infty}^{\ln p_i} n_i(p) d \ln p
+
+        The integral is tabulated on a logarithmic pressure grid, which is
+        refined until Gauss-Legendre quadratures of different order agree on
+        each interval. Any pressure is then evaluated by adding the integral
+        from the closest grid point. The table is kept until the model
+        parameters or other inputs (such as temperature) change, or it has to
+        be extended to cover a new pressure.
+
+        Parameters
+        ----------
+        pressure : float or array
+            The pressure at which to calculate the spreading pressure.
+
+        Returns
+        -------
+        float or array
+            Spreading pressure at specified pressure.
+        """
+        key = self._cache_key()
+        table = self._sp_table
+
+        # fast path for a single pressure inside the table
+        if numpy.ndim(pressure) == 0 and table is not None and table[0] == key and pressure > 0:
+            _, grid, cumulative = table
+            log_p = math.log(pressure)
+            if grid[0] <= log_p <= grid[-1]:
+                index = min(int(grid.searchsorted(log_p, side='right')) - 1, len(grid) - 2)
+                nodes, weights = _gauss_legendre(10)
+                half = (log_p - grid[index]) / 2
+                loading = self.loading(numpy.exp(grid[index] + half + half * nodes))
+                return cumulative[index] + half * weights.dot(loading)
+
+        pressure = numpy.asarray(pressure, dtype=float)
+        points = pressure.ravel()
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            log_p = numpy.log(points)
+            if table is None or table[0] != key or not \
+                    table[1][0] <= log_p.min() <= log_p.max() <= table[1][-1]:
+                valid = log_p[numpy.isfinite(log_p)]
+                if valid.size == 0:
+                    result = numpy.where(points == 0, 0.0, numpy.nan)
+                    return result[0] if pressure.ndim == 0 else result.reshape(pressure.shape)
+                log_min, log_max = valid.min(), valid.max()
+                if table is not None and table[0] == key:
+                    # extend the table to include previous pressures
+                    log_min, log_max = min(log_min, table[1][0]), max(log_max, table[1][-1])
+                table = (key, *self._spreading_pressure_table(numpy.exp(log_min) / 10, numpy.exp(log_max) * 10))
+                self._sp_table = table
+
+            _, grid, cumulative = table
+            index = numpy.searchsorted(grid, log_p, side='right') - 1
+            index = numpy.clip(index, 0, len(grid) - 2)
+            result = cumulative[index] + self._log_quadrature(grid[index], log_p)
+            result[points == 0] = 0
+
+        if pressure.ndim == 0:
+            return result[0]
+        return result.reshape(pressure.shape)
+
+    def _cache_key(self) -> tuple:
+        """Identify the model inputs on which cached tables depend."""
+        # besides parameters, models can store inputs such as temperature
+        # in __init_parameters__, as numerical attributes
+        inputs = tuple(
+            (name, value) for name, value in sorted(vars(self).items())
+            if name != 'rmse' and isinstance(value, (int, float))
+        )
+        return (tuple(self.params.values()), inputs)
+
+    def _spreading_pressure_table(self, p_min: float, p_max: float, rtol: float = 1e-10):
+        """Tabulate the cumulative spreading pressure between two pressures."""
+        grid = numpy.linspace(numpy.log(p_min), numpy.log(p_max), int(numpy.log(p_max / p_min) / 0.5) + 2)
+
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for _ in range(30):
+                fine = self._log_quadrature(grid[:-1], grid[1:], order=10)
+                coarse = self._log_quadrature(grid[:-1], grid[1:], order=5)
+                split = numpy.abs(fine - coarse) > rtol * numpy.abs(fine)
+                if not numpy.any(split):
+                    break
+                grid = numpy.sort(numpy.concatenate((grid, (grid[:-1][split] + grid[1:][split]) / 2)))
+            else:
+                fine = self._log_quadrature(grid[:-1], grid[1:], order=10)
+
+            # the integral below the grid is done directly
+            start = integrate.quad(lambda x: self.loading(x) / x, 0, p_min)[0]
+
+        return grid, numpy.concatenate(([start], start + numpy.cumsum(fine)))
+
+    def _log_quadrature(self, lower: "list[float]", upper: "list[float]", order: int = 10):
+        """Integrate the loading over the logarithm of pressure between limits."""
+        nodes, weights = _gauss_legendre(order)
+        middle = (upper + lower)[:, numpy.newaxis] / 2
+        half = (upper - lower)[:, numpy.newaxis] / 2
+        loading = self.loading(numpy.exp(middle + half * nodes))
+        return (half * weights * loading).sum(axis=1)
+
+    def spreading_pressure_inverse(self, spreading_pressure: "list[float]"):
+        """
+        Calculate the gas pressure at which a spreading pressure is reached.
+
+        The logarithm of spreading pressure is tabulated on a logarithmic
+        pressure grid, which is kept until the model parameters change and
+        extended when needed. A starting point is interpolated from the table
+        and refined with Newton steps on the logarithm of pressure, for which
+        the derivative of spreading pressure is the loading.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            The spreading pressure at which to calculate the pressure.
+
+        Returns
+        -------
+        float or array
+            Pressure at specified spreading pressure, or ``nan`` where it
+            cannot be reached.
+        """
+        spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+        points = spreading_pressure.ravel()
+        result = numpy.full(points.shape, numpy.nan)
+        result[points == 0] = 0
+
+        valid = numpy.flatnonzero(points > 0)
+        if valid.size:
+            target = points[valid]
+            grid, log_sp = self._spreading_pressure_inverse_table(target.min(), target.max())
+            log_target = numpy.log(target)
+            inside = (log_target >= log_sp[0]) & (log_target <= log_sp[-1])
+            index = numpy.clip(numpy.searchsorted(log_sp, log_target) - 1, 0, len(grid) - 2)
+
+            def func(log_p, index):
+                pressure = numpy.exp(log_p)
+                return self.spreading_pressure(pressure) - target[index], self.loading(pressure)
+
+            log_p = safe_newton(
+                func,
+                numpy.interp(log_target, log_sp, grid),
+                grid[index],
+                grid[index + 1],
+            )
+            result[valid[inside]] = numpy.exp(log_p[inside])
+
+        if spreading_pressure.ndim == 0:
+            return result[0]
+        return result.reshape(spreading_pressure.shape)
+
+    def _spreading_pressure_inverse_table(self, sp_min: float, sp_max: float):
+        """Tabulate the spreading pressure to include the limits given."""
+        key = self._cache_key()
+        table = self._sp_inverse
+        if table is not None and table[0] == key and \
+                table[2][0] <= numpy.log(sp_min) and numpy.log(sp_max) <= table[2][-1]:
+            return table[1:]
+
+        # ten points for each decade of pressure, up to 1e-30 and 1e30
+        step = numpy.log(10) / 10
+        limit = numpy.log(1e30)
+        if table is not None and table[0] == key:
+            lower, upper = table[1][0], table[1][-1]
+        elif numpy.all(numpy.isfinite(self.pressure_range)) and min(self.pressure_range) > 0:
+            lower, upper = numpy.log(min(self.pressure_range) / 10), numpy.log(max(self.pressure_range) * 10)
+        else:
+            lower, upper = numpy.log(1e-3), numpy.log(1e3)
+
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            while True:
+                grid = numpy.arange(lower, upper + step / 2, step)
+                log_sp = numpy.log(self.spreading_pressure(numpy.exp(grid)))
+                keep = numpy.isfinite(log_sp)
+                grid, log_sp = grid[keep], log_sp[keep]
+                extend_lower = lower > -limit and (not grid.size or numpy.log(sp_min) < log_sp[0])
+                extend_upper = upper < limit and (not grid.size or numpy.log(sp_max) > log_sp[-1])
+                if not (extend_lower or extend_upper):
+                    break
+                lower = max(lower - 30 * step, -limit) if extend_lower else lower
+                upper = min(upper + 30 * step, limit) if extend_upper else upper
+
+        self._sp_inverse = (key, grid, log_sp)
+        return grid, log_sp
+
     def initial_guess(self, pressure: "list[float]", loading: "list[float]"):
         """
         Return initial guess for fitting.
@@ -260,9 +502,13 @@ class IsothermBaseModel():
 
         if self.calculates == "loading":
             fit_func_base = lambda pr, ld: self.loading(pr) - ld
+            fit_jac_base = lambda pr, ld: self.loading_jacobian(pr)
+            has_jac = self._overrides("loading_jacobian")
             model_range = self.loading_range[1] - self.loading_range[0]
         elif self.calculates == "pressure":
             fit_func_base = lambda pr, ld: self.pressure(ld) - pr
+            fit_jac_base = lambda pr, ld: self.pressure_jacobian(ld)
+            has_jac = self._overrides("pressure_jacobian")
             model_range = self.pressure_range[1] - self.pressure_range[0]
 
         def fit_func(x, pressure, loading):
@@ -270,6 +516,14 @@ class IsothermBaseModel():
                 self.params[param_names[i]] = x[i]
             return fit_func_base(pressure, loading)
 
+        # columns of the jacobian are in the order of the parameter names
+        jac_columns = [list(self.param_names).index(p) for p in param_names]
+
+        def fit_jac(x, pressure, loading):
+            for i, _ in enumerate(param_names):
+                self.params[param_names[i]] = x[i]
+            return fit_jac_base(pressure, loading)[:, jac_columns]
+
         fit_args = {
             "fun": fit_func,  # fitting function
             "x0": guess,  # initial guess
@@ -277,6 +531,8 @@ class IsothermBaseModel():
             "args": (pressure, loading),  # extra arguments to the fit function
             "x_scale": "jac",  # scale the problem using the jacobian
         }
+        if has_jac:
+            fit_args["jac"] = fit_jac  # analytical derivatives of the fit function
         if optimization_params:
             fit_args.update(optimization_params)
 
@@ -292,6 +548,10 @@ class IsothermBaseModel():
         if verbose:
             logger.info(f"Model {self.name} success, RMSE is {self.rmse:.3g}")
 
+    def _overrides(self, method: str) -> bool:
+        """Check whether the model implements a base class method."""
+        return getattr(type(self), method) is not getattr(IsothermBaseModel, method)
+
     def fit_leastsq(self, leastsq_args: dict):
         """Try fitting parameters using least squares."""
         try:
@@ -310,3 +570,106 @@ class IsothermBaseModel():
                 f"\n{leastsq_args['x0']}\n"
             )
         return opt_res
+
+
+@functools.lru_cache(maxsize=None)
+def _gauss_legendre(order: int):
+    """Return the nodes and weights of a Gauss-Legendre quadrature."""
+    return numpy.polynomial.legendre.leggauss(order)
+
+
+def bracketed_root(func, target, upper: float = numpy.inf, rtol: float = 1e-12, max_iter: int = 200):
+    """
+    Solve ``func(x) = target`` independently for each target value, for an
+    element-wise function which increases with x, on x >= 0.
+
+    Used to numerically invert isotherm models. Each root is first
+    bracketed, by expanding an upper limit until the function exceeds
+    the target, then refined with the Illinois variant of the false
+    position method. All points are solved together, so the cost
+    scales linearly with their number.
+
+    Parameters
+    ----------
+    func : callable
+        Element-wise function to invert, accepting an array.
+    target : float or array
+        Values of the function for which to find x.
+    upper : float, optional
+        Upper limit of x, at which the function tends to infinity
+        (e.g. a saturation capacity). If not given, the upper limit
+        is found by expansion.
+    rtol : float, optional
+        Relative tolerance on x.
+    max_iter : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    float or array
+        Solution with the same shape as the target.
+
+    Raises
+    ------
+    CalculationError
+        If a root could not be bracketed or did not converge.
+    """
+    target = numpy.asarray(target, dtype=float)
+    values = target.ravel()
+    result = numpy.full(values.shape, numpy.nan)
+
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        a = numpy.zeros_like(values)
+        f_a = func(a) - values
+        b = numpy.full_like(values, upper if numpy.isfinite(upper) else 1.0)
+        f_b = func(b) - values
+        if numpy.isfinite(upper):
+            # the function diverges at the upper limit
+            f_b[~numpy.isfinite(f_b)] = numpy.inf
+        else:
+            for _ in range(max_iter):
+                low = f_b <= 0
+                if not numpy.any(low):
+                    break
+                a[low], f_a[low] = b[low], f_b[low]
+                b[low] = b[low] * 10
+                f_b[low] = func(b[low]) - values[low]
+
+        solved = f_a == 0
+        result[solved] = a[solved]
+        active = numpy.flatnonzero(~solved & (f_a < 0) & (f_b > 0))
+        failed = ~solved
+        failed[active] = False
+
+        # Illinois false position: halve the retained end if the same side is
+        # replaced twice in a row, which guarantees superlinear convergence
+        side = numpy.zeros_like(values)
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+            a_i, b_i, fa_i, fb_i = a[active], b[active], f_a[active], f_b[active]
+            x = b_i - fb_i * (b_i - a_i) / (fb_i - fa_i)
+            bisect = ~numpy.isfinite(x) | (x <= a_i) | (x >= b_i)
+            x[bisect] = (a_i[bisect] + b_i[bisect]) / 2
+            f_x = func(x) - values[active]
+
+            above = f_x > 0
+            repeat = side[active] == numpy.where(above, 1, -1)
+            f_a[active] = numpy.where(above, numpy.where(repeat, fa_i / 2, fa_i), f_x)
+            f_b[active] = numpy.where(above, f_x, numpy.where(repeat, fb_i / 2, fb_i))
+            a[active] = numpy.where(above, a_i, x)
+            b[active] = numpy.where(above, x, b_i)
+            side[active] = numpy.where(above, 1, -1)
+
+            done = (f_x == 0) | (b[active] - a[active] <= rtol * numpy.abs(x))
+            failed[active[numpy.isnan(f_x)]] = True
+            result[active[done]] = x[done]
+            active = active[~done & ~numpy.isnan(f_x)]
+
+    failed[active] = True
+    if numpy.any(failed):
+        raise CalculationError(f"Root finding for value {values[failed]} failed.")
+
+    if target.ndim == 0:
+        return result[0]
+    return result.reshape(target.shape)
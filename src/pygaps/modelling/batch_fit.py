@@ -0,0 +1,220 @@
+"""
+Fitting of a single isotherm model to many isotherms at once.
+
+Instead of creating a ModelIsotherm for each isotherm, the data is split into
+chunks. In each chunk a single model instance is fitted to one isotherm after
+the other. The solution of the previous isotherm is used as a starting point
+for the next one (warm start). Chunks can be processed in parallel.
+"""
+
+import typing as t
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+import pandas
+
+from pygaps import logger
+from pygaps.modelling import get_isotherm_model
+from pygaps.modelling import model_from_dict
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+
+# A warm started fit is repeated from the model initial guess if its RMSE is
+# this many times larger than the RMSE of the previous isotherm.
+_WARM_START_TOLERANCE = 2
+
+
+def fit_batch(
+    pressures: t.List[t.List[float]],
+    loadings: t.List[t.List[float]],
+    model: str,
+    isotherm_parameters: t.Union[dict, t.List[dict]] = None,
+    param_guess: dict = None,
+    param_bounds: dict = None,
+    optimization_params: dict = None,
+    warm_start: bool = True,
+    chunk_size: int = 100,
+    n_jobs: int = 1,
+    executor: Executor = None,
+    return_isotherms: bool = False,
+    verbose: bool = False,
+):
+    """
+    Fit the same isotherm model to many pressure/loading datasets.
+
+    Parameters
+    ----------
+    pressures : list of arrays
+        The pressure points of each isotherm.
+    loadings : list of arrays
+        The loading points of each isotherm.
+    model : str
+        The name of the model to fit.
+    isotherm_parameters : dict or list of dict, optional
+        Isotherm parameters (material, adsorbate, temperature etc.) either
+        common to all isotherms, or one dictionary for each isotherm.
+        Required by some models (e.g. DR requires ``temperature``)
+        and to create ModelIsotherms.
+    param_guess : dict, optional
+        Starting guess for the model parameters, used for all isotherms.
+        If not specified, the model initial guess is used, or the
+        solution of the previous isotherm if ``warm_start`` is set.
+    param_bounds : dict, optional
+        Bounds for model parameters in the data fitting routine.
+    optimization_params : dict, optional
+        Dictionary to be passed to the minimization function to use in fitting model to data.
+        See `here
+        <https://docs.scipy.org/doc/scipy/reference/optimize.html#module-scipy.optimize>`__.
+    warm_start : bool, optional
+        Start each fit from the parameters found for the previous isotherm in
+        the same chunk. If this fails, or fits clearly worse than the previous
+        isotherm, the fit is repeated with the model initial guess and the
+        better result is kept. Works best if similar isotherms are next to each other.
+    chunk_size : int, optional
+        Number of isotherms fitted sequentially by each job.
+    n_jobs : int, optional
+        Number of chunks to fit at the same time in a thread pool.
+        Defaults to 1 (sequential fitting), while -1 uses one thread per processor.
+    executor : concurrent.futures.Executor, optional
+        An executor (such as a ``ProcessPoolExecutor``) in which to fit the chunks.
+        Takes precedence over ``n_jobs`` and is not shut down afterwards.
+    return_isotherms : bool, optional
+        Whether to also return a ModelIsotherm for each isotherm.
+    verbose : bool, optional
+        Prints out extra information about steps taken.
+
+    Returns
+    -------
+    DataFrame
+        A table with the fitted parameters and the RMSE of each isotherm.
+        Isotherms which could not be fit are marked with ``nan``.
+    list of ModelIsotherm
+        If ``return_isotherms`` is set, a list of ModelIsotherms
+        (or None where the fit failed).
+
+    Notes
+    -----
+    The results depend on the chunk size when warm starting, but not on the
+    number of jobs or the type of executor.
+
+    """
+    if len(pressures) != len(loadings):
+        raise ParameterError("The number of pressure and loading arrays must be the same.")
+    if chunk_size < 1:
+        raise ParameterError("The chunk size must be a positive integer.")
+
+    if isotherm_parameters is None or isinstance(isotherm_parameters, dict):
+        isotherm_parameters = [isotherm_parameters or {}] * len(pressures)
+    elif len(isotherm_parameters) != len(pressures):
+        raise ParameterError("Isotherm parameters must be given for each isotherm.")
+
+    datasets = []
+    for pressure, loading in zip(pressures, loadings):
+        pressure = numpy.asarray(pressure, dtype=float)
+        loading = numpy.asarray(loading, dtype=float)
+        if pressure.shape != loading.shape or pressure.size == 0:
+            raise ParameterError("Pressure and loading arrays are not equal!")
+        datasets.append((pressure, loading))
+
+    # check model name and parameters before starting
+    param_names = get_isotherm_model(model, param_bounds=param_bounds).param_names
+
+    chunks = [(
+        model,
+        datasets[start:start + chunk_size],
+        isotherm_parameters[start:start + chunk_size],
+        param_guess,
+        param_bounds,
+        optimization_params,
+        warm_start,
+    ) for start in range(0, len(datasets), chunk_size)]
+
+    pool = executor
+    if pool is None and n_jobs != 1 and len(chunks) > 1:
+        pool = ThreadPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None)
+
+    try:
+        if pool is None:
+            results = [_fit_chunk(*chunk) for chunk in chunks]
+        else:
+            results = [future.result() for future in [pool.submit(_fit_chunk, *chunk) for chunk in chunks]]
+    finally:
+        if pool is not None and executor is None:
+            pool.shutdown()
+
+    fits = [fit for chunk in results for fit in chunk]
+    table = pandas.DataFrame(
+        [{
+            **(fit['parameters'] if fit else dict.fromkeys(param_names, numpy.nan)),
+            'rmse': fit['rmse'] if fit else numpy.nan,
+        } for fit in fits],
+        columns=list(param_names) + ['rmse'],
+    )
+
+    if verbose:
+        failed = sum(fit is None for fit in fits)
+        logger.info(f"Fitted {model} on {len(fits) - failed} isotherms, {failed} failed.")
+
+    if not return_isotherms:
+        return table
+
+    from pygaps.core.modelisotherm import ModelIsotherm
+    isotherms = []
+    for fit, iso_params in zip(fits, isotherm_parameters):
+        if fit is None:
+            isotherms.append(None)
+            continue
+        fit_model = model_from_dict(dict(fit, param_bounds=param_bounds))
+        fit_model.__init_parameters__(iso_params)
+        isotherms.append(ModelIsotherm(model=fit_model, **iso_params))
+
+    return table, isotherms
+
+
+def _fit_chunk(
+    model,
+    datasets,
+    isotherm_parameters,
+    param_guess,
+    param_bounds,
+    optimization_params,
+    warm_start,
+):
+    """Fit a model to each dataset in turn, returning the model dictionaries."""
+    fit_model = get_isotherm_model(model, param_bounds=param_bounds)
+    previous = None
+    fits = []
+
+    for (pressure, loading), iso_params in zip(datasets, isotherm_parameters):
+        fit_model.pressure_range = (min(pressure), max(pressure))
+        fit_model.loading_range = (min(loading), max(loading))
+        fit_model.__init_parameters__(iso_params)
+
+        warm = warm_start and not param_guess and previous is not None
+        if param_guess:
+            guesses = [param_guess]
+        else:
+            guesses = [fit_model.initial_guess(pressure, loading)]
+            if warm:
+                guesses.insert(0, previous['parameters'])
+
+        fit = None
+        for guess in guesses:
+            try:
+                fit_model.fit(pressure, loading, guess, optimization_params)
+            except CalculationError:
+                continue
+            result = fit_model.to_dict()
+            result['parameters'] = dict(result['parameters'])
+            if fit is None or result['rmse'] < fit['rmse']:
+                fit = result
+            # a warm start may converge to a worse local minimum
+            if not warm or fit['rmse'] <= _WARM_START_TOLERANCE * previous['rmse']:
+                break
+            warm = False
+
+        previous = fit
+        fits.append(fit)
+
+    return fits
@@ -162,6 +162,35 @@ class BET(IsothermBaseModel):
 
         return res
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        nm = self.params['n_m']
+        N = self.params['N']
+        C = self.params['C']
+        a = 1.0 - N * pressure
+        b = 1.0 - N * pressure + C * pressure
+        loading = nm * C * pressure / (a * b)
+        return numpy.column_stack([
+            C * pressure / (a * b),
+            nm * pressure / b**2,
+            loading * pressure * (1 / a + 1 / b),
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -2,11 +2,10 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
+from pygaps.modelling.base_model import bracketed_root
+from pygaps.modelling.toth import toth_site_jacobian
 
 
 class ChemiPhysisorption(IsothermBaseModel):
@@ -107,15 +106,35 @@ class ChemiPhysisorption(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        return bracketed_root(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
 
-        return opt_res.x
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        K2p = self.params["K2"] * pressure
+        activation = numpy.exp(-self.params["Ea"] / self.rt)
+        chemi_load = self.params['n_m2'] * K2p / (1.0 + K2p) * activation
+        return numpy.column_stack(
+            toth_site_jacobian(self.params["n_m1"], self.params["K1"], self.params["t1"], pressure) + (
+                K2p / (1.0 + K2p) * activation,
+                self.params['n_m2'] * pressure / (1.0 + K2p)**2 * activation,
+                -chemi_load / self.rt,
+            )
+        )
 
     def spreading_pressure(self, pressure):
         r"""
@@ -129,19 +148,20 @@ class ChemiPhysisorption(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the ChemiPhysisorption model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. The integral is tabulated
+        once for each set of parameters, see ``spreading_pressure_integral``.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.spreading_pressure_integral(pressure)
 
     def toth_correction(self, pressure):
         r"""
@@ -2,7 +2,7 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
+from scipy import special
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -109,6 +109,35 @@ class DA(IsothermBaseModel):
         m = self.params['m']
         return numpy.exp(e / self.minus_rt * numpy.power(-numpy.log(loading / nm), 1 / m))
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        nm = self.params['n_m']
+        e = self.params['e']
+        m = self.params['m']
+        ratio = self.minus_rt * numpy.log(pressure) / e
+        pot = ratio**m
+        log_ratio = numpy.log(numpy.where(ratio > 0, ratio, 1))
+        return numpy.column_stack([
+            numpy.exp(-pot),
+            nm * numpy.exp(-pot) * m * pot / e,
+            -nm * numpy.exp(-pot) * pot * log_ratio,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -120,20 +149,39 @@ class DA(IsothermBaseModel):
 
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
-        The integral for the DA model cannot be solved analytically
-        and must be calculated numerically.
+        The integral for the DA model is solved analytically for
+        :math:`p \leq 1` by a change of variable to the adsorption potential,
+        using the upper incomplete gamma function :math:`\Gamma`.
+
+        .. math::
+
+            \pi = n_m \frac{\varepsilon}{m RT} \Gamma
+                \Big( \frac{1}{m}, \Big( \frac{-RT \ln p}{\varepsilon} \Big)^m \Big)
+
+        Above this pressure, it is calculated numerically.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        nm = self.params['n_m']
+        e = self.params['e']
+        m = self.params['m']
+        pressure = numpy.asarray(pressure, dtype=float)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            ratio = self.minus_rt * numpy.log(pressure) / e
+            result = nm * e / (-m * self.minus_rt) * special.gamma(1 / m) * \
+                special.gammaincc(1 / m, ratio**m)
+        above = ratio < 0
+        if numpy.any(above):
+            result = numpy.where(above, self.spreading_pressure_integral(pressure), result)
+        return result[()]
 
     def initial_guess(self, pressure, loading):
         """
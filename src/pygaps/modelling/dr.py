@@ -2,7 +2,7 @@
 
 import numpy
 from scipy import constants
-from scipy import integrate
+from scipy import special
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
@@ -103,6 +103,31 @@ class DR(IsothermBaseModel):
         e = self.params['e']
         return numpy.exp(e / self.minus_rt * numpy.sqrt(-numpy.log(loading / nm)))
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        nm = self.params['n_m']
+        e = self.params['e']
+        pot = (self.minus_rt * numpy.log(pressure) / e)**2
+        return numpy.column_stack([
+            numpy.exp(-pot),
+            nm * numpy.exp(-pot) * 2 * pot / e,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -114,20 +139,29 @@ class DR(IsothermBaseModel):
 
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
-        The integral for the DR model cannot be solved analytically
-        and must be calculated numerically.
+        The integral for the DR model is solved analytically
+        by a change of variable to the adsorption potential.
+
+        .. math::
+
+            \pi = n_m \frac{\sqrt{\pi} \varepsilon}{2 RT} \operatorname{erfc}
+                \Big( \frac{-RT \ln p}{\varepsilon} \Big)
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        nm = self.params['n_m']
+        e = self.params['e']
+        with numpy.errstate(divide='ignore'):
+            ratio = self.minus_rt * numpy.log(pressure) / e
+        return nm * numpy.sqrt(numpy.pi) * e / (-2 * self.minus_rt) * special.erfc(ratio)
 
     def initial_guess(self, pressure, loading):
         """
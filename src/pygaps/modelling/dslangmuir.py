@@ -142,6 +142,32 @@ class DSLangmuir(IsothermBaseModel):
 
         return (n_P * dP_dn) - 1
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        k1p = self.params["K1"] * pressure
+        k2p = self.params["K2"] * pressure
+        return numpy.column_stack([
+            k1p / (1.0 + k1p),
+            self.params["n_m1"] * pressure / (1.0 + k1p)**2,
+            k2p / (1.0 + k2p),
+            self.params["n_m2"] * pressure / (1.0 + k2p)**2,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -1,10 +1,9 @@
 """Flory-Huggins-VST isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
+from pygaps.modelling.base_model import bracketed_root
 
 
 class FHVST(IsothermBaseModel):
@@ -101,15 +100,7 @@ class FHVST(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        def fun(x):
-            return self.pressure(x) - pressure
-
-        opt_res = optimize.root(fun, numpy.zeros_like(pressure), method='hybr')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {pressure} failed.")
-
-        return opt_res.x
+        return bracketed_root(self.pressure, pressure, upper=self.params["n_m"])
 
     def pressure(self, loading):
         """
@@ -133,6 +124,34 @@ class FHVST(IsothermBaseModel):
         cov = loading / nm
         return (nm / K) * (cov / (1 - cov)) * numpy.exp(a1v**2 * cov / (1 + a1v * cov))
 
+    def pressure_jacobian(self, loading):
+        """
+        Calculate the derivatives of the pressure with respect to
+        each model parameter at specified loading.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        loading = numpy.asarray(loading, dtype=float)
+        nm = self.params["n_m"]
+        K = self.params["K"]
+        a1v = self.params["a1v"]
+        cov = loading / nm
+        pressure = self.pressure(loading)
+        return numpy.column_stack([
+            -pressure * cov / nm * (1 / (1 - cov) + a1v**2 / (1 + a1v * cov)**2),
+            -pressure / K,
+            pressure * a1v * cov * (2 + a1v * cov) / (1 + a1v * cov)**2,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -94,6 +94,32 @@ class Freundlich(IsothermBaseModel):
         """
         return (loading / self.params['K'])**self.params['m']
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        K = self.params["K"]
+        m = self.params["m"]
+        p_m = pressure**(1 / m)
+        log_p = numpy.log(numpy.where(pressure > 0, pressure, 1))
+        return numpy.column_stack([
+            p_m,
+            -K * p_m * log_p / m**2,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -89,6 +89,35 @@ class GAB(IsothermBaseModel):
 
         return res
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        nm = self.params['n_m']
+        C = self.params['C']
+        Kp = self.params['K'] * pressure
+        a = 1.0 - Kp
+        b = 1.0 - Kp + C * Kp
+        loading = nm * C * Kp / (a * b)
+        return numpy.column_stack([
+            C * Kp / (a * b),
+            nm * Kp / b**2,
+            pressure * (nm * C / (a * b) + loading / a + loading * (1 - C) / b),
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
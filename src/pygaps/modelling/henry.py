@@ -43,7 +43,7 @@ class Henry(IsothermBaseModel):
     name = 'Henry'
     formula = r"n(p) = K_H p"
     calculates = 'loading'
-    param_names = ("K")
+    param_names = ("K", )
     param_default_bounds = ((0., numpy.inf), )
 
     def loading(self, pressure):
@@ -85,6 +85,25 @@ class Henry(IsothermBaseModel):
         """
         return loading / self.params["K"]
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        return pressure[:, numpy.newaxis]
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -1,11 +1,9 @@
 """Jensen-Seaton isotherm model."""
 
 import numpy
-from scipy import integrate
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
+from pygaps.modelling.base_model import bracketed_root
 
 
 class JensenSeaton(IsothermBaseModel):
@@ -96,15 +94,40 @@ class JensenSeaton(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        return bracketed_root(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
 
-        return opt_res.x
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        K = self.params["K"]
+        n_m = self.params["n_m"]
+        k = self.params["k"]
+        t = self.params["t"]
+        ratio = K * pressure / (n_m * (1 + k * pressure))
+        ratio_t = ratio**t
+        sum_t = 1 + ratio_t
+        loading = K * pressure / sum_t**(1 / t)
+        log_ratio = numpy.log(numpy.where(ratio > 0, ratio, 1))
+        return numpy.column_stack([
+            pressure / sum_t**(1 / t + 1),
+            loading * ratio_t / sum_t / n_m,
+            loading * ratio_t / sum_t * pressure / (1 + k * pressure),
+            loading * (numpy.log(sum_t) / t**2 - ratio_t * log_ratio / (t * sum_t)),
+        ])
 
     def spreading_pressure(self, pressure):
         r"""
@@ -118,19 +141,20 @@ class JensenSeaton(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the Jensen-Seaton model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. The integral is tabulated
+        once for each set of parameters, see ``spreading_pressure_integral``.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.spreading_pressure_integral(pressure)
 
     def initial_guess(self, pressure, loading):
         """
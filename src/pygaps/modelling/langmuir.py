@@ -125,6 +125,29 @@ class Langmuir(IsothermBaseModel):
         """
         return loading / (self.params["K"] * (self.params["n_m"] - loading))
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        kp = self.params["K"] * pressure
+        return numpy.column_stack([
+            self.params["n_m"] * pressure / (1.0 + kp)**2,
+            kp / (1.0 + kp),
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -96,6 +96,33 @@ class Quadratic(IsothermBaseModel):
 
         return res
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        nm = self.params["n_m"]
+        Ka = self.params["Ka"]
+        Kb = self.params["Kb"]
+        denom = 1.0 + Ka * pressure + Kb * pressure**2
+        return numpy.column_stack([
+            (Ka + 2.0 * Kb * pressure) * pressure / denom,
+            nm * pressure * (1.0 - Kb * pressure**2) / denom**2,
+            nm * pressure**2 * (2.0 + Ka * pressure) / denom**2,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
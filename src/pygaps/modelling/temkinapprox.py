@@ -1,10 +1,9 @@
 """Temkin Approximation isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
+from pygaps.modelling.base_model import bracketed_root
 
 
 class TemkinApprox(IsothermBaseModel):
@@ -84,15 +83,34 @@ class TemkinApprox(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        return bracketed_root(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
 
-        return opt_res.x
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        n_m = self.params["n_m"]
+        Kp = self.params["K"] * pressure
+        tht = self.params["tht"]
+        lang_load = Kp / (1.0 + Kp)
+        return numpy.column_stack([
+            lang_load + tht * lang_load**2 * (lang_load - 1),
+            n_m * (1 + tht * (3 * lang_load**2 - 2 * lang_load)) * pressure / (1.0 + Kp)**2,
+            n_m * lang_load**2 * (lang_load - 1),
+        ])
 
     def spreading_pressure(self, pressure):
         r"""
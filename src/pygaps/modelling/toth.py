@@ -1,11 +1,28 @@
 """Toth isotherm model."""
 
 import numpy
-from scipy import integrate
 
 from pygaps.modelling.base_model import IsothermBaseModel
 
 
+def toth_site_jacobian(n_m, K, t, pressure):
+    """
+    Return the loading derivatives of a Toth site with respect to
+    its parameters (n_m, K, t) at specified pressure.
+    """
+    pressure = numpy.asarray(pressure, dtype=float)
+    Kp = K * pressure
+    Kp_t = Kp**t
+    sum_t = 1.0 + Kp_t
+    loading = n_m * Kp / sum_t**(1 / t)
+    log_Kp = numpy.log(numpy.where(Kp > 0, Kp, 1))
+    return (
+        Kp / sum_t**(1 / t),
+        n_m * pressure / sum_t**(1 / t + 1),
+        loading * (numpy.log(sum_t) / t**2 - Kp_t * log_Kp / (t * sum_t)),
+    )
+
+
 class Toth(IsothermBaseModel):
     r"""
     Toth isotherm model.
@@ -82,6 +99,26 @@ class Toth(IsothermBaseModel):
         t = self.params["t"]
         return (loading / (n_m * K)) / (1 - (loading / n_m)**t)**(1 / t)
 
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
+
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        return numpy.column_stack(
+            toth_site_jacobian(self.params["n_m"], self.params["K"], self.params["t"], pressure)
+        )
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -94,19 +131,20 @@ class Toth(IsothermBaseModel):
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
         The integral for the Toth model cannot be solved analytically
-        and must be calculated numerically.
+        and must be calculated numerically. The integral is tabulated
+        once for each set of parameters, see ``spreading_pressure_integral``.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        return integrate.quad(lambda x: self.loading(x) / x, 0, pressure)[0]
+        return self.spreading_pressure_integral(pressure)
 
     def toth_correction(self, pressure):
         r"""
@@ -1,10 +1,9 @@
 """Triple Site Langmuir isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
+from pygaps.modelling.base_model import bracketed_root
 
 
 class TSLangmuir(IsothermBaseModel):
@@ -93,15 +92,36 @@ class TSLangmuir(IsothermBaseModel):
         float
             Pressure at specified loading.
         """
-        def fun(x):
-            return self.loading(x) - loading
+        return bracketed_root(self.loading, loading)
 
-        opt_res = optimize.root(fun, numpy.zeros_like(loading), method='hybr')
+    def loading_jacobian(self, pressure):
+        """
+        Calculate the derivatives of the loading with respect to
+        each model parameter at specified pressure.
 
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {loading} failed.")
+        Parameters
+        ----------
+        pressure : array
+            The pressures at which to calculate the derivatives.
 
-        return opt_res.x
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        k1p = self.params["K1"] * pressure
+        k2p = self.params["K2"] * pressure
+        k3p = self.params["K3"] * pressure
+        return numpy.column_stack([
+            k1p / (1.0 + k1p),
+            k2p / (1.0 + k2p),
+            k3p / (1.0 + k3p),
+            self.params["n_m1"] * pressure / (1.0 + k1p)**2,
+            self.params["n_m2"] * pressure / (1.0 + k2p)**2,
+            self.params["n_m3"] * pressure / (1.0 + k3p)**2,
+        ])
 
     def spreading_pressure(self, pressure):
         r"""
@@ -1,11 +1,11 @@
 """Virial isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps import logger
 from pygaps.graphing.calc_graphs import virial_plot
 from pygaps.modelling.base_model import IsothermBaseModel
+from pygaps.modelling.base_model import bracketed_root
 from pygaps.utilities.exceptions import CalculationError
 
 
@@ -70,15 +70,7 @@ class Virial(IsothermBaseModel):
         float
             Loading at specified pressure.
         """
-        def fun(x):
-            return (self.pressure(x) - pressure)**2
-
-        opt_res = optimize.minimize(fun, pressure, method='Nelder-Mead')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding failed. Error: \n\t{opt_res.message}")
-
-        return opt_res.x
+        return bracketed_root(self.pressure, pressure)
 
     def pressure(self, loading):
         """
@@ -101,6 +93,31 @@ class Virial(IsothermBaseModel):
             self.params['B'] * loading**2 + self.params['C'] * loading**3
         )
 
+    def pressure_jacobian(self, loading):
+        """
+        Calculate the derivatives of the pressure with respect to
+        each model parameter at specified loading.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        loading = numpy.asarray(loading, dtype=float)
+        pressure = self.pressure(loading)
+        return numpy.column_stack([
+            -pressure / self.params['K'],
+            pressure * loading,
+            pressure * loading**2,
+            pressure * loading**3,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
@@ -112,20 +129,30 @@ class Virial(IsothermBaseModel):
 
             \pi = \int_{0}^{p_i} \frac{n_i(p_i)}{p_i} dp_i
 
-        The integral for the Virial model cannot be solved analytically
-        and must be calculated numerically.
+        The integral for the Virial model is solved analytically by integrating
+        over the loading instead, as :math:`d \ln p = (1/n + A + 2Bn + 3Cn^2) dn`.
+
+        .. math::
+
+            \pi = n + \frac{A}{2} n^2 + \frac{2B}{3} n^3 + \frac{3C}{4} n^4
+
+        where the loading :math:`n` is calculated numerically at each pressure.
 
         Parameters
         ----------
-        pressure : float
+        pressure : float or array
             The pressure at which to calculate the spreading pressure.
 
         Returns
         -------
-        float
+        float or array
             Spreading pressure at specified pressure.
         """
-        raise NotImplementedError
+        loading = self.loading(pressure)
+        return loading * (
+            1 + self.params['A'] * loading / 2 + 2 * self.params['B'] * loading**2 / 3 +
+            3 * self.params['C'] * loading**3 / 4
+        )
 
     def initial_guess(self, pressure, loading):
         """
@@ -214,8 +241,18 @@ class Virial(IsothermBaseModel):
             return self.params['C'] * L**3 + self.params['B'] * L**2 \
                 + self.params['A'] * L - numpy.log(self.params['K']) - ln_p_over_n
 
+        def fit_jac(x, L, ln_p_over_n):
+            derivatives = {
+                'K': -numpy.ones_like(L) / x[param_names.index('K')],
+                'A': L,
+                'B': L**2,
+                'C': L**3,
+            }
+            return numpy.column_stack([derivatives[param] for param in param_names])
+
         kwargs = {
             "fun": fit_func,  # fitting function
+            "jac": fit_jac,  # analytical derivatives of the fit function
             "x0": guess,  # initial guess
             "bounds": bounds,  # bounds of the parameters
             "args": (loading, ln_p_over_n),  # extra arguments to the fit function
@@ -1,10 +1,9 @@
 """Wilson-VST isotherm model."""
 
 import numpy
-from scipy import optimize
 
 from pygaps.modelling.base_model import IsothermBaseModel
-from pygaps.utilities.exceptions import CalculationError
+from pygaps.modelling.base_model import bracketed_root
 
 
 class WVST(IsothermBaseModel):
@@ -96,15 +95,7 @@ class WVST(IsothermBaseModel):
             Loading at specified pressure.
 
         """
-        def fun(x):
-            return self.pressure(x) - pressure
-
-        opt_res = optimize.root(fun, numpy.zeros_like(pressure), method='hybr')
-
-        if not opt_res.success:
-            raise CalculationError(f"Root finding for value {pressure} failed.")
-
-        return opt_res.x
+        return bracketed_root(self.pressure, pressure, upper=self.params["n_m"])
 
     def pressure(self, loading):
         """
@@ -136,6 +127,46 @@ class WVST(IsothermBaseModel):
 
         return res
 
+    def pressure_jacobian(self, loading):
+        """
+        Calculate the derivatives of the pressure with respect to
+        each model parameter at specified loading.
+
+        Parameters
+        ----------
+        loading : array
+            The loadings at which to calculate the derivatives.
+
+        Returns
+        -------
+        array
+            Derivatives with shape (points, parameters), in the
+            order of ``param_names``.
+        """
+        loading = numpy.asarray(loading, dtype=float)
+        n_m = self.params["n_m"]
+        Lv1 = self.params["Lv1"]
+        L1v = self.params["L1v"]
+        cov = loading / n_m
+        covX1minLv1 = (1 - Lv1) * cov
+        covX1minL1v = (1 - L1v) * cov
+        denom = L1v + covX1minL1v
+        pressure = self.pressure(loading)
+
+        # derivatives of the logarithm of pressure, without the 1 / cov term
+        d_cov = 1 / (1 - cov) - (1 - Lv1) / (1 - covX1minLv1) \
+            - (1 - L1v) / denom - Lv1 * (1 - Lv1) / (1 - covX1minLv1)**2 \
+            - (1 - L1v) * L1v / denom**2
+        d_L1v = 1 / L1v - (1 - cov) / denom + (cov * denom + covX1minL1v * (1 - cov)) / denom**2
+        d_Lv1 = (cov - covX1minLv1) / (1 - covX1minLv1) + Lv1 * cov / (1 - covX1minLv1)**2
+
+        return numpy.column_stack([
+            -pressure * cov / n_m * d_cov,
+            -pressure / self.params["K"],
+            pressure * d_L1v,
+            pressure * d_Lv1,
+        ])
+
     def spreading_pressure(self, pressure):
         r"""
         Calculate spreading pressure at specified gas pressure.
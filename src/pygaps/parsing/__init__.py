@@ -14,9 +14,12 @@ from .excel import isotherm_to_xl
 from .isodb import isotherm_from_isodb
 from .json import isotherm_from_json
 from .json import isotherm_to_json
+from .json import isotherms_from_json
+from .json import isotherms_to_json
 from .sqlite import isotherms_from_db
 from .sqlite import isotherm_delete_db
 from .sqlite import isotherm_to_db
+from .sqlite import isotherms_to_db
 from .sqlite import adsorbates_from_db
 from .sqlite import adsorbate_delete_db
 from .sqlite import adsorbate_to_db
@@ -49,9 +49,62 @@ def isotherm_to_json(isotherm, path=None, **args_to_json):
         Otherwise returns None.
 
     """
+    iso_dict = _isotherm_to_dict(isotherm)
+    iso_dict['file_version'] = _parser_version  # version
+
+    args_to_json = {} if args_to_json is None else args_to_json
+    args_to_json['sort_keys'] = True  # we will sort always
+
+    if path:
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(iso_dict, file, **args_to_json)
+    else:
+        return json.dumps(iso_dict, **args_to_json)
+
+
+def isotherms_to_json(isotherms, path=None, **args_to_json):
+    """
+    Convert several isotherms to a json representation, as a list.
+
+    If the path is specified, the isotherms are saved as a file,
+    otherwise they are returned as a string.
+
+    Parameters
+    ----------
+    isotherms : iterable of Isotherm
+        Isotherms to be written to json.
+    path : str, None
+        Path to the file to be written.
+    args_to_json : dict
+        Custom arguments to be passed to "json.dump".
+
+    Returns
+    -------
+    None or str
+        If path is None, returns the resulting json format as a string.
+        Otherwise returns None.
+
+    """
+    iso_list = []
+    for isotherm in isotherms:
+        iso_dict = _isotherm_to_dict(isotherm)
+        iso_dict['file_version'] = _parser_version  # version
+        iso_list.append(iso_dict)
+
+    args_to_json = {} if args_to_json is None else args_to_json
+    args_to_json['sort_keys'] = True  # we will sort always
+
+    if path:
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(iso_list, file, **args_to_json)
+    else:
+        return json.dumps(iso_list, **args_to_json)
+
+
+def _isotherm_to_dict(isotherm):
+    """Convert an isotherm to a dictionary ready for json serialisation."""
     # Isotherm properties
     iso_dict = isotherm.to_dict()
-    iso_dict['file_version'] = _parser_version  # version
 
     # Isotherm data
     if isinstance(isotherm, PointIsotherm):
@@ -74,14 +127,7 @@ def isotherm_to_json(isotherm, path=None, **args_to_json):
     elif isinstance(isotherm, ModelIsotherm):
         iso_dict["isotherm_model"] = isotherm.model.to_dict()
 
-    args_to_json = {} if args_to_json is None else args_to_json
-    args_to_json['sort_keys'] = True  # we will sort always
-
-    if path:
-        with open(path, mode='w', encoding='utf-8') as file:
-            json.dump(iso_dict, file, **args_to_json)
-    else:
-        return json.dumps(iso_dict, **args_to_json)
+    return iso_dict
 
 
 def isotherm_from_json(
@@ -121,18 +167,84 @@ def isotherm_from_json(
 
     """
     # Parse isotherm in dictionary
+    raw_dict = _load_json(str_or_path)
+
+    return _isotherm_from_dict(
+        raw_dict,
+        fmt=fmt,
+        loading_key=loading_key,
+        pressure_key=pressure_key,
+        **isotherm_parameters,
+    )
+
+
+def isotherms_from_json(
+    str_or_path,
+    loading_key='loading',
+    pressure_key='pressure',
+    **isotherm_parameters,
+):
+    """
+    Read a list of pyGAPS isotherms from a file or from a string.
+
+    Parameters
+    ----------
+    str_or_path : str
+        The isotherms in a json string format or a path
+        to where one can be read.
+    loading_key : str
+        The title of the pressure data in the json provided.
+    pressure_key
+        The title of the loading data in the json provided.
+
+    Other Parameters
+    ----------------
+    isotherm_parameters :
+        Any other options to be overridden in the isotherm creation.
+
+    Returns
+    -------
+    list
+        The isotherms contained in the json string or file.
+
+    """
+    raw_list = _load_json(str_or_path)
+    if not isinstance(raw_list, list):
+        raise ParsingError("The JSON provided does not contain a list of isotherms.")
+
+    return [
+        _isotherm_from_dict(
+            raw_dict,
+            loading_key=loading_key,
+            pressure_key=pressure_key,
+            **isotherm_parameters,
+        ) for raw_dict in raw_list
+    ]
+
+
+def _load_json(str_or_path):
+    """Load json from a file or from a string."""
     try:
         with open(str_or_path, encoding='utf-8') as f:
-            raw_dict = json.load(f)
+            return json.load(f)
     except OSError:
         try:
-            raw_dict = json.loads(str_or_path)
+            return json.loads(str_or_path)
         except Exception as err:
             raise ParsingError(
                 "Could not parse JSON isotherm. "
                 "The `str_or_path` is invalid or does not exist. "
             ) from err
 
+
+def _isotherm_from_dict(
+    raw_dict,
+    fmt=None,
+    loading_key='loading',
+    pressure_key='pressure',
+    **isotherm_parameters,
+):
+    """Generate an isotherm from a dictionary in the json format."""
     # version check
     version = raw_dict.pop("file_version", None)
     if not version or float(version) < float(_parser_version):
@@ -974,6 +974,53 @@ def isotherm_to_db(
         logger.info(f"Isotherm uploaded: '{isotherm.iso_id}'")
 
 
+@with_connection
+def isotherms_to_db(
+    isotherms: "list[BaseIsotherm | PointIsotherm | ModelIsotherm]",
+    db_path: str = None,
+    autoinsert_material: bool = True,
+    autoinsert_adsorbate: bool = True,
+    verbose: bool = True,
+    **kwargs: dict,
+):
+    """
+    Uploads several isotherms to the database, in a single transaction.
+
+    Parameters
+    ----------
+    isotherms : iterable of Isotherm
+        Isotherms, PointIsotherms or ModelIsotherms to upload to the database.
+    db_path : str, None
+        Path to the database. If none is specified, internal database is used.
+    autoinsert_material: bool, True
+        Whether to automatically insert an isotherm material if it is not found
+        in the database.
+    autoinsert_adsorbate: bool, True
+        Whether to automatically insert an isotherm adsorbate if it is not found
+        in the database.
+    verbose : bool, True
+        Extra information printed to console.
+    """
+
+    cursor = kwargs['cursor']
+
+    count = 0
+    for isotherm in isotherms:
+        isotherm_to_db(
+            isotherm,
+            db_path=db_path,
+            autoinsert_material=autoinsert_material,
+            autoinsert_adsorbate=autoinsert_adsorbate,
+            verbose=False,
+            cursor=cursor,
+        )
+        count += 1
+
+    if verbose:
+        # Print success
+        logger.info(f"Isotherms uploaded: {count}")
+
+
 @with_connection
 def isotherms_from_db(
     criteria: dict = None,
@@ -3,8 +3,11 @@
 # isort:skip_file
 from .iast import iast_point
 from .iast import iast_point_fraction
+from .iast import iast_grid
+from .iast import iast_screen
 from .iast import iast_binary_svp
 from .iast import iast_binary_vle
 from .iast import reverse_iast
+from .iast import reverse_iast_path
 from .enthalpy_to_isotherm import predict_isotherm_from_enthalpy_clapeyron
 from .enthalpy_to_isotherm import predict_isosurface_from_enthalpy_clapeyron
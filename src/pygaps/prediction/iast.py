@@ -1,9 +1,12 @@
 """Module calculating IAST, given the pure-component adsorption isotherm model."""
 
 import textwrap
+import warnings
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy
-from scipy import optimize
+import pandas
 
 from pygaps import logger
 from pygaps.core.modelisotherm import ModelIsotherm
@@ -12,6 +15,7 @@ from pygaps.graphing.iast_graphs import plot_iast_vle
 from pygaps.modelling import is_model_iast
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.exceptions import ParameterError
+from pygaps.utilities.math_utilities import safe_newton
 
 # TODO add _raw functions to ensure that sanity checks only happen once
 
@@ -80,19 +84,15 @@ def iast_binary_vle(
     y_data = numpy.linspace(0.01, 0.99, npoints)
     binary_fractions = numpy.array((y_data, 1 - y_data)).transpose()
 
-    # Generate the array of loadings
-    component_loadings = numpy.zeros((npoints, 2))
-
-    # Run IAST
-    for index, fraction in enumerate(binary_fractions):
-        component_loadings[index, :] = iast_point_fraction(
-            isotherms,
-            fraction,
-            total_pressure,
-            branch=branch,
-            warningoff=warningoff,
-            adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
-        )
+    # Run IAST on all fractions at once
+    component_loadings = _iast_grid_loadings(
+        isotherms,
+        binary_fractions,
+        total_pressure,
+        branch=branch,
+        warningoff=warningoff,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
+    )
 
     x_data = [x[0] / (x[0] + x[1]) for x in component_loadings]
 
@@ -180,18 +180,15 @@ def iast_binary_svp(
     pressures = numpy.asarray(pressures)
     mole_fractions = numpy.asarray(mole_fractions)
 
-    # Generate the array of partial pressures
-    component_loadings = numpy.zeros((len(pressures), 2))
-
-    for index, pressure in enumerate(pressures):
-        component_loadings[index, :] = iast_point_fraction(
-            isotherms,
-            mole_fractions,
-            pressure,
-            branch=branch,
-            warningoff=warningoff,
-            adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
-        )
+    # Run IAST on all pressures at once
+    component_loadings = _iast_grid_loadings(
+        isotherms,
+        mole_fractions,
+        pressures,
+        branch=branch,
+        warningoff=warningoff,
+        adsorbed_mole_fraction_guess=adsorbed_mole_fraction_guess
+    )
 
     selectivities = [(x[0] / mole_fractions[0]) / (x[1] / mole_fractions[1])
                      for x in component_loadings]
@@ -338,52 +335,18 @@ def iast_point(
         for i in range(n_components):
             logger.info(f"\tPartial pressure component {i:d} = {partial_pressures[i]:.4g}")
 
-    # Assert that the spreading pressures of each component are equal
-    def spreading_pressure_differences(adsorbed_mole_fractions):
-        """
-        Assert that spreading pressures of each component at fictitious pressure
-        are equal.
-
-        Parameters
-        ----------
-        adsorbed_mole_fractions : array
-            Mole fractions in the adsorbed phase;
-            numpy.size(adsorbed_mole_fractions) = n_components - 1
-            because sum z_i = 1 asserted here automatically.
-
-        Returns
-        -------
-        array
-            Spreading pressure difference between component i and i+1.
-        """
-        spreading_pressure_diff = numpy.zeros((n_components - 1, ))
-        for i in range(n_components - 1):
-            if i == n_components - 2:
-                # automatically assert \sum z_i = 1
-                ads_mole_frac2 = 1.0 - numpy.sum(adsorbed_mole_fractions)
-            else:
-                ads_mole_frac2 = adsorbed_mole_fractions[i + 1]
-
-            sp1 = isotherms[i].spreading_pressure_at(
-                partial_pressures[i] / adsorbed_mole_fractions[i],
-                branch=branch,
-            )
-            sp2 = isotherms[i + 1].spreading_pressure_at(
-                partial_pressures[i + 1] / ads_mole_frac2,
-                branch=branch,
-            )
-            spreading_pressure_diff[i] = sp1 - sp2
-
-        return spreading_pressure_diff
+    components = [_iast_component(isotherm, branch) for isotherm in isotherms]
+    partial_pressures = numpy.asarray(partial_pressures, dtype=float)
 
     ###
-    #   Solve for mole fractions in adsorbed phase by equating spreading
-    #   pressures.
+    #   Solve for the spreading pressure at which the adsorbed phase
+    #   mole fractions add up to one.
     ####
     if adsorbed_mole_fraction_guess is None:
         # Default guess: pure-component loadings at these partial pressures.
         loading_guess = numpy.asarray([
-            isotherms[i].loading_at(partial_pressures[i]) for i in range(n_components)
+            component.loading(min(partial_pressures[i], component.p_max))
+            for i, component in enumerate(components)
         ])
         adsorbed_mole_fraction_guess = loading_guess / numpy.sum(loading_guess)
     else:
@@ -391,44 +354,24 @@ def iast_point(
         # if list, convert to numpy array
         adsorbed_mole_fraction_guess = numpy.asarray(adsorbed_mole_fraction_guess)
 
-    res = optimize.root(
-        spreading_pressure_differences,
-        adsorbed_mole_fraction_guess[:-1],
-        method='lm',
-    )
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        log_sp = _iast_guess(components, (partial_pressures / adsorbed_mole_fraction_guess)[None, :])
+    log_sp, converged, _, _ = _iast_root(components, partial_pressures[None, :], -1, log_sp)
 
-    if not res.success:
+    if not converged[0]:
         raise CalculationError(
             textwrap.dedent(
-                f"""
-                Root finding for adsorbed phase mole fractions failed. This is
-                likely because the default guess is not good enough. Try a
-                different starting guess for the adsorbed phase mole fractions
-                by passing an array adsorbed_mole_fraction_guess to this
-                function. Scipy error message: \n\t{res.message}
                 """
+                Root finding for the spreading pressure of the adsorbed phase failed.
+                This is likely because the pure-component isotherms do not reach
+                the spreading pressure required, as a PointIsotherm cannot be
+                extrapolated beyond its highest pressure. Try fitting a model to
+                the isotherm data instead."""
             )
         )
 
-    adsorbed_mole_fractions = res.x
-
-    # concatenate mole fraction of last component
-    adsorbed_mole_fractions = numpy.concatenate(
-        (adsorbed_mole_fractions, numpy.asarray([1.0 - numpy.sum(adsorbed_mole_fractions)]))
-    )
-
-    if numpy.any((adsorbed_mole_fractions < 0.0) | (adsorbed_mole_fractions > 1.0)):
-        raise CalculationError(
-            textwrap.dedent(
-                """
-                Some adsorbed mole fractions are below 0 or over 1. Try a different
-                starting guess for the adsorbed mole fractions by passing an array or
-                list 'adsorbed_mole_fraction_guess' into this function.
-                e.g. adsorbed_mole_fraction_guess=[0.2, 0.8]"""
-            )
-        )
-
-    pressure0 = partial_pressures / adsorbed_mole_fractions
+    pressure0 = _iast_pressure0(components, log_sp)[0]
+    adsorbed_mole_fractions = numpy.where(partial_pressures > 0, partial_pressures / pressure0, 0)
 
     # solve for the total gas adsorbed
     inverse_loading = 0.0
@@ -470,6 +413,525 @@ def iast_point(
     return loadings
 
 
+def iast_grid(
+    isotherms,
+    gas_mole_fractions,
+    total_pressures,
+    branch="ads",
+    adsorbed_mole_fraction_guess=None,
+    tol=1e-10,
+    max_iter=50,
+    warningoff=False,
+    verbose=False,
+):
+    r"""
+    Perform IAST calculations on many mixture compositions and total
+    pressures at once.
+
+    All components have the same spreading pressure :math:`\Pi` at the
+    fictitious pure-component pressures :math:`p_i^0`. Using the inverse of
+    the spreading pressure of each isotherm, :math:`p_i^0(\Pi)`, the
+    IAST equations reduce to a single monotonic equation
+
+    .. math::
+
+        \sum_i \frac{y_i P}{p_i^0(\Pi)} = 1
+
+    which is solved with bracketed Newton steps on all points of the grid
+    simultaneously. Points which do not converge from the default guess are
+    restarted from the solution of the closest converged point on the grid.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        Pure-component adsorption isotherms.
+        e.g. [methane_isotherm, ethane_isotherm, ...]
+    gas_mole_fractions : array
+        Fractions of gas components, with the last dimension
+        corresponding to the components, e.g. [[0.1, 0.9], [0.5, 0.5]].
+    total_pressures : float or array
+        Total gas phase pressures. Broadcast against the leading dimensions
+        of ``gas_mole_fractions``, such that fractions of shape (K, 1, n) and
+        pressures of shape (L, ) give a K x L grid.
+    branch : str
+        which branch of the isotherm to use
+    adsorbed_mole_fraction_guess : array or list, optional
+        Starting guess for adsorbed phase mole fractions, used for all points.
+        If not given, it is based on the pure-component loadings at the
+        partial pressures.
+    tol : float, optional
+        Tolerance on the sum of adsorbed mole fractions.
+    max_iter : int, optional
+        Maximum number of Newton iterations.
+    warningoff: bool, optional
+        When False, logger.warning will print when some points have not converged,
+        or when the IAST calculation result required extrapolation of the
+        pure-component adsorption isotherm beyond the highest pressure in the data.
+    verbose : bool, optional
+        Print off a extra information.
+
+    Returns
+    -------
+    dict
+        Dictionary with the following components, where points which
+        did not converge are set to ``nan``:
+            - `loading` the predicted uptake of each component
+            - `adsorbed_mole_fraction` the adsorbed phase mole fractions
+            - `pressure0` the fictitious pure-component pressures
+            - `spreading_pressure` the reduced spreading pressure
+            - `converged` whether each point has converged
+
+    """
+    # Parameter checks
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+    if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
+        raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+
+    n_components = len(isotherms)
+    if n_components == 1:
+        raise ParameterError("Pass at least two isotherms.")
+
+    gas_mole_fractions = numpy.asarray(gas_mole_fractions, dtype=float)
+    total_pressures = numpy.asarray(total_pressures, dtype=float)
+    if gas_mole_fractions.ndim == 0 or gas_mole_fractions.shape[-1] != n_components:
+        raise ParameterError("Number of gas mole fractions != number of isotherms.")
+    if numpy.any(gas_mole_fractions < 0) or \
+            not numpy.allclose(gas_mole_fractions.sum(axis=-1), 1):
+        raise ParameterError("Gas mole fractions must be positive and add up to unity.")
+    if numpy.any(total_pressures <= 0):
+        raise ParameterError("Total pressures must be positive.")
+
+    shape = numpy.broadcast_shapes(gas_mole_fractions.shape[:-1], total_pressures.shape)
+    partial_pressures = (
+        numpy.broadcast_to(gas_mole_fractions, shape + (n_components, )) *
+        numpy.broadcast_to(total_pressures, shape)[..., None]
+    ).reshape(-1, n_components)
+
+    components = [_iast_component(isotherm, branch) for isotherm in isotherms]
+    present = partial_pressures > 0
+
+    # Starting guess, either given or from pure-component loadings
+    if adsorbed_mole_fraction_guess is None:
+        fractions_guess = numpy.column_stack([
+            component.loading(numpy.minimum(partial_pressures[:, i], component.p_max))
+            for i, component in enumerate(components)
+        ])
+        fractions_guess = fractions_guess / fractions_guess.sum(axis=1, keepdims=True)
+    else:
+        fractions_guess = numpy.asarray(adsorbed_mole_fraction_guess, dtype=float)
+        if fractions_guess.shape != (n_components, ):
+            raise ParameterError("Number of adsorbed mole fractions != number of isotherms.")
+        numpy.testing.assert_almost_equal(1.0, numpy.sum(fractions_guess), decimal=4)
+        fractions_guess = numpy.broadcast_to(fractions_guess, partial_pressures.shape)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        log_sp = _iast_guess(components, partial_pressures / fractions_guess)
+
+    rows = numpy.arange(len(partial_pressures))
+    log_sp, converged, _, _ = _iast_root(
+        components,
+        partial_pressures,
+        -1,
+        log_sp,
+        tol=tol,
+        max_iter=max_iter,
+    )
+
+    # Restart failed points from their closest converged neighbour on the grid
+    while not converged.all() and converged.any():
+        failed = rows[~converged]
+        done = rows[converged]
+        position = numpy.clip(numpy.searchsorted(done, failed), 1, max(done.size - 1, 1))
+        left = done[position - 1]
+        right = done[numpy.minimum(position, done.size - 1)]
+        nearest = numpy.where(failed - left <= right - failed, left, right)
+        new_log_sp, new_converged, _, _ = _iast_root(
+            components,
+            partial_pressures[failed],
+            -1,
+            log_sp[nearest],
+            tol=tol,
+            max_iter=max_iter,
+        )
+        if not new_converged.any():
+            break
+        log_sp[failed[new_converged]] = new_log_sp[new_converged]
+        converged[failed[new_converged]] = True
+
+    # Compute results
+    log_sp[~converged] = numpy.nan
+    pressure0 = _iast_pressure0(components, log_sp)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        adsorbed_mole_fractions = numpy.where(present, partial_pressures / pressure0, 0)
+        inverse_loading = numpy.where(
+            present,
+            adsorbed_mole_fractions / numpy.column_stack([
+                component.loading(pressure0[:, i]) for i, component in enumerate(components)
+            ]),
+            0,
+        ).sum(axis=1)
+    loadings = adsorbed_mole_fractions / inverse_loading[:, None]
+    spreading_pressure = numpy.exp(log_sp)
+
+    adsorbed_mole_fractions[~converged] = numpy.nan
+    loadings[~converged] = numpy.nan
+
+    if verbose:
+        logger.info(
+            f"{n_components:d} components, {converged.size:d} points, "
+            f"{numpy.count_nonzero(converged):d} converged."
+        )
+
+    if not warningoff:
+        if not converged.all():
+            logger.warning(
+                f"IAST did not converge for {numpy.count_nonzero(~converged):d} "
+                f"out of {converged.size:d} points."
+            )
+        for i, isotherm in enumerate(isotherms):
+            p_max = isotherm.pressure(branch=branch).max()
+            n_extrapolated = numpy.count_nonzero(pressure0[:, i] > p_max)
+            if n_extrapolated:
+                logger.warning(
+                    textwrap.dedent(
+                        f"""
+                        WARNING:
+                        Component {i:d}: p0 > {p_max:.4g} for {n_extrapolated:d} points,
+                        the highest pressure exhibited in the pure-component
+                        isotherm data. Thus, pyGAPS had to extrapolate the
+                        isotherm data to achieve this IAST result."""
+                    )
+                )
+
+    return {
+        "loading": loadings.reshape(shape + (n_components, )),
+        "adsorbed_mole_fraction": adsorbed_mole_fractions.reshape(shape + (n_components, )),
+        "pressure0": pressure0.reshape(shape + (n_components, )),
+        "spreading_pressure": spreading_pressure.reshape(shape),
+        "converged": converged.reshape(shape),
+    }
+
+
+_IASTComponent = namedtuple("_IASTComponent", "loading spreading_pressure inverse p_max sp_max")
+
+
+def _iast_component(isotherm, branch):
+    """
+    Return vectorised loading, spreading pressure and inverse spreading
+    pressure functions for an isotherm, together with the highest pressure
+    and spreading pressure at which they can be evaluated.
+    """
+    if isinstance(isotherm, ModelIsotherm):
+        return _IASTComponent(
+            lambda pressure: isotherm.loading_at(pressure, branch=branch),
+            lambda pressure: isotherm.spreading_pressure_at(pressure, branch=branch),
+            lambda spreading: isotherm.pressure_at_spreading_pressure(spreading, branch=branch),
+            numpy.inf,
+            numpy.inf,
+        )
+
+    # Point isotherms are linearly interpolated, following Henry's law
+    # before the first point, as in the spreading pressure integral
+    integrator = isotherm._spreading_pressure_integrator(branch=branch)
+    pressure = numpy.concatenate(([0], integrator.pressure))
+    loading = numpy.concatenate(([0], integrator.loading))
+    return _IASTComponent(
+        lambda points: numpy.interp(points, pressure, loading),
+        integrator,
+        integrator.inverse,
+        integrator.pressure[-1],
+        integrator.cumulative[-1],
+    )
+
+
+def _iast_guess(components, pressure0):
+    """Logarithm of the mean spreading pressure at guesses of the fictitious pressures."""
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        log_sp = numpy.log(
+            numpy.column_stack([
+                component.spreading_pressure(numpy.minimum(pressure0[:, i], component.p_max))
+                for i, component in enumerate(components)
+            ])
+        )
+    log_sp[~numpy.isfinite(log_sp)] = numpy.nan
+    with warnings.catch_warnings():
+        # points without any valid guess start from zero
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return numpy.nan_to_num(numpy.nanmean(log_sp, axis=1), nan=0)
+
+
+def _iast_pressure0(components, log_sp):
+    """Fictitious pure-component pressures at a spreading pressure."""
+    spreading = numpy.exp(log_sp)
+    return numpy.column_stack([component.inverse(spreading) for component in components])
+
+
+def _iast_root(components, weights, sign, log_sp, tol=1e-10, max_iter=50):
+    r"""
+    Find the common spreading pressure of many IAST points at once.
+
+    Using the inverse of the spreading pressure of each component,
+    :math:`p_i^0(\Pi)`, IAST becomes a one-dimensional root in the
+    spreading pressure: the fractions :math:`w_i (p_i^0)^s` must add up
+    to one, for weights `weights` and `sign` :math:`s`. In forward IAST these
+    are the adsorbed fractions :math:`y_i P / p_i^0`, while in reverse IAST
+    the gas fractions :math:`x_i p_i^0 / P`. As the sum is monotonic in
+    :math:`\ln \Pi`, with a derivative of :math:`\Pi \sum_i w_i (p_i^0)^s / n_i`,
+    the root is first bracketed, then found with safeguarded Newton steps.
+
+    Returns
+    -------
+    tuple
+        The logarithm of the spreading pressure, whether each point has
+        converged, the number of function evaluations and the residual of
+        the sum of fractions for each point.
+    """
+    n_points = len(weights)
+    present = weights > 0
+    iterations = numpy.zeros(n_points, dtype=int)
+
+    def evaluate(log_sp, index):
+        """Residual of the sum of fractions and its derivative."""
+        pressure0 = _iast_pressure0(components, log_sp)
+        with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            fractions = numpy.where(present[index], weights[index] * pressure0**sign, 0)
+            loading = numpy.column_stack([
+                component.loading(pressure0[:, i]) for i, component in enumerate(components)
+            ])
+            derivative = numpy.exp(log_sp) * numpy.where(present[index], fractions / loading, 0).sum(axis=1)
+        iterations[index] += 1
+        # spreading pressures which cannot be reached are too high
+        value = numpy.nan_to_num(sign * (fractions.sum(axis=1) - 1), nan=numpy.inf)
+        return value, derivative
+
+    # The spreading pressure cannot exceed the range of any point isotherm
+    with numpy.errstate(divide='ignore'):
+        log_max = numpy.log(
+            numpy.where(present, [component.sp_max for component in components], numpy.inf).min(axis=1)
+        )
+    lower = numpy.full(n_points, -numpy.inf)
+    upper = numpy.full(n_points, numpy.inf)
+    feasible = numpy.ones(n_points, dtype=bool)
+
+    # Bracket the root by moving from the guess in steps of twice the
+    # Newton step (at most a decade), up to the highest possible spreading pressure
+    log_sp = numpy.minimum(numpy.where(numpy.isfinite(log_sp), log_sp, 0), log_max)
+    start = log_sp.copy()
+    active = numpy.arange(n_points)
+    for iteration in range(100):
+        if not active.size:
+            break
+        value, derivative = evaluate(log_sp[active], active)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            step = value / derivative
+        if iteration == 0:
+            # the first Newton step is the starting point of the solver
+            start = numpy.where(numpy.isfinite(step), log_sp - step, log_sp)
+
+        above = value > 0
+        upper[active[above]] = log_sp[active[above]]
+        lower[active[~above]] = log_sp[active[~above]]
+        stuck = ~above & (log_sp[active] >= log_max[active])
+        feasible[active[stuck]] = False
+
+        keep = ~stuck & (numpy.isinf(lower[active]) | numpy.isinf(upper[active]))
+        active, step = active[keep], step[keep]
+        jump = numpy.clip(numpy.nan_to_num(2 * numpy.abs(step), nan=1), 1e-3, numpy.log(10))
+        log_sp[active] = numpy.where(
+            numpy.isinf(lower[active]),
+            log_sp[active] - jump,
+            numpy.minimum(log_sp[active] + jump, log_max[active]),
+        )
+    feasible[active] = False
+
+    rows = numpy.flatnonzero(feasible)
+    log_sp[~feasible] = numpy.nan
+    log_sp[rows] = safe_newton(
+        lambda x, index: evaluate(x, rows[index]),
+        numpy.clip(start[rows], lower[rows], upper[rows]),
+        lower[rows],
+        upper[rows],
+        rtol=tol * 1e-2,
+        max_iter=max_iter,
+    )
+
+    residual = numpy.full(n_points, numpy.nan)
+    pressure0 = _iast_pressure0(components, log_sp[rows])
+    with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        fractions = numpy.where(present[rows], weights[rows] * pressure0**sign, 0)
+    residual[rows] = numpy.abs(fractions.sum(axis=1) - 1)
+    converged = residual <= tol
+    return log_sp, converged, iterations, residual
+
+
+def iast_screen(
+    materials,
+    gas_mole_fractions,
+    total_pressures,
+    branch="ads",
+    chunk_size=10,
+    n_jobs=1,
+    executor=None,
+    verbose=False,
+):
+    """
+    Screen many materials for a separation, by running IAST for each
+    set of pure-component isotherms over the same feed conditions.
+
+    The materials are split into chunks, which can be distributed over a
+    pool of processes. Each material is solved for all feed conditions in
+    a single `iast_grid` call, such that the spreading pressure tables
+    of its isotherms are built once and reused for every condition.
+
+    Parameters
+    ----------
+    materials : dict or list
+        Pure-component isotherms for each material, either as a dictionary
+        of ``{name: [isotherm1, isotherm2, ...]}`` or as a list of isotherm lists.
+        The isotherms must be in the same order and units for all materials.
+    gas_mole_fractions : array
+        Feed gas mole fractions, either a single composition or one for each
+        condition, e.g. [[0.1, 0.9], [0.5, 0.5]].
+    total_pressures : float or array
+        Feed total pressure, either a single pressure or one for each condition.
+    branch : str
+        which branch of the isotherm to use
+    chunk_size : int, optional
+        Number of materials solved sequentially by each job.
+    n_jobs : int, optional
+        Number of chunks to solve at the same time in a process pool.
+        Defaults to 1 (sequential calculation), while -1 uses one process per processor.
+    executor : concurrent.futures.Executor, optional
+        An executor in which to solve the chunks.
+        Takes precedence over ``n_jobs`` and is not shut down afterwards.
+    verbose : bool, optional
+        Print off a extra information.
+
+    Returns
+    -------
+    DataFrame
+        A table with one row for each material and condition, containing the
+        total pressure ``pressure``, gas fractions ``y{i}``, adsorbed fractions
+        ``x{i}`` and loadings ``loading{i}`` of each component, the
+        ``selectivity`` of the first component over all others, whether the
+        point has ``converged`` and any ``error`` raised for the material.
+
+    """
+    if isinstance(materials, dict):
+        names = list(materials)
+        materials = list(materials.values())
+    else:
+        names = list(range(len(materials)))
+        materials = list(materials)
+    if not materials:
+        raise ParameterError("Pass at least one material to screen.")
+    if chunk_size < 1:
+        raise ParameterError("The chunk size must be a positive integer.")
+
+    n_components = len(materials[0])
+    if any(len(isotherms) != n_components for isotherms in materials):
+        raise ParameterError("All materials must have the same number of isotherms.")
+
+    gas_mole_fractions = numpy.atleast_2d(numpy.asarray(gas_mole_fractions, dtype=float))
+    total_pressures = numpy.atleast_1d(numpy.asarray(total_pressures, dtype=float))
+    if gas_mole_fractions.ndim != 2 or gas_mole_fractions.shape[1] != n_components:
+        raise ParameterError("Number of gas mole fractions != number of isotherms.")
+    if total_pressures.ndim != 1:
+        raise ParameterError("Total pressures must be a number or a list.")
+    n_conditions = max(len(gas_mole_fractions), len(total_pressures))
+    try:
+        gas_mole_fractions = numpy.broadcast_to(gas_mole_fractions, (n_conditions, n_components))
+        total_pressures = numpy.broadcast_to(total_pressures, (n_conditions, ))
+    except ValueError as err:
+        raise ParameterError("The number of gas mole fractions and pressures must be the same.") from err
+
+    chunks = [(
+        materials[start:start + chunk_size],
+        gas_mole_fractions,
+        total_pressures,
+        branch,
+    ) for start in range(0, len(materials), chunk_size)]
+
+    pool = executor
+    if pool is None and n_jobs != 1 and len(chunks) > 1:
+        pool = ProcessPoolExecutor(max_workers=n_jobs if n_jobs > 0 else None)
+
+    try:
+        if pool is None:
+            results = [_iast_screen_chunk(*chunk) for chunk in chunks]
+        else:
+            results = [future.result() for future in [pool.submit(_iast_screen_chunk, *chunk) for chunk in chunks]]
+    finally:
+        if pool is not None and executor is None:
+            pool.shutdown()
+
+    loadings, errors = zip(*[result for chunk in results for result in chunk])
+    loadings = numpy.concatenate(loadings)
+    errors = numpy.repeat(errors, n_conditions)
+
+    gas = numpy.tile(gas_mole_fractions, (len(materials), 1))
+    adsorbed = loadings / loadings.sum(axis=1, keepdims=True)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        selectivity = (adsorbed[:, 0] / gas[:, 0]) / ((1 - adsorbed[:, 0]) / (1 - gas[:, 0]))
+
+    table = pandas.DataFrame({
+        "material": numpy.repeat(names, n_conditions),
+        "condition": numpy.tile(numpy.arange(n_conditions), len(materials)),
+        "pressure": numpy.tile(total_pressures, len(materials)),
+        **{f"y{i}": gas[:, i] for i in range(n_components)},
+        **{f"x{i}": adsorbed[:, i] for i in range(n_components)},
+        **{f"loading{i}": loadings[:, i] for i in range(n_components)},
+        "selectivity": selectivity,
+        "converged": ~numpy.isnan(loadings).any(axis=1),
+        "error": errors,
+    })
+
+    if verbose:
+        failed = numpy.count_nonzero(~table["converged"])
+        logger.info(f"Screened {len(materials)} materials over {n_conditions} conditions, {failed} points failed.")
+
+    return table
+
+
+def _iast_screen_chunk(materials, gas_mole_fractions, total_pressures, branch):
+    """Solve IAST for each material in turn, returning loadings and errors."""
+    results = []
+    for isotherms in materials:
+        try:
+            loadings = iast_grid(
+                isotherms,
+                gas_mole_fractions,
+                total_pressures,
+                branch=branch,
+                warningoff=True,
+            )["loading"]
+            error = None
+        except (ParameterError, CalculationError) as err:
+            loadings = numpy.full(gas_mole_fractions.shape, numpy.nan)
+            error = str(err)
+        results.append((loadings, error))
+    return results
+
+
+def _iast_grid_loadings(isotherms, gas_mole_fractions, total_pressures, **kwargs):
+    """Run a grid IAST calculation, raising an error if any point fails."""
+    result = iast_grid(isotherms, gas_mole_fractions, total_pressures, **kwargs)
+    if not result["converged"].all():
+        raise CalculationError(
+            textwrap.dedent(
+                """
+                Root finding for adsorbed phase mole fractions failed for some
+                points. Try a different starting guess for the adsorbed phase
+                mole fractions by passing an array adsorbed_mole_fraction_guess
+                to this function, or use models which can be extrapolated."""
+            )
+        )
+    return result["loading"]
+
+
 def reverse_iast(
     isotherms,
     adsorbed_mole_fractions,
@@ -546,47 +1008,12 @@ def reverse_iast(
                 f"\tDesired adsorbed phase mole fraction of component {i:d} = {adsorbed_mole_fractions[i]:.4g}"
             )
 
-    # assert that the spreading pressures of each component are equal
-    def spreading_pressure_differences(gas_mole_fractions):
-        r"""
-        Assert that spreading pressures of each component at fictitious pressure
-        are equal.
-
-        Parameters
-        ----------
-        gas_mole_fractions : array
-            Mole fractions in bulk gas phase
-            numpy.size(y) = n_components - 1 because \sum y_i = 1 asserted here
-            automatically.
-
-        Returns
-        -------
-        array
-            Spreading pressure difference
-            between component i and i+1.
-        """
-        spreading_pressure_diff = numpy.zeros((n_components - 1, ))
-        for i in range(n_components - 1):
-            if i == n_components - 2:
-                # automatically assert \sum y_i = 1
-                gas_mole_fraction_n = 1.0 - numpy.sum(gas_mole_fractions)
-            else:
-                gas_mole_fraction_n = gas_mole_fractions[i + 1]
-
-            sp1 = isotherms[i].spreading_pressure_at(
-                total_pressure * gas_mole_fractions[i] / adsorbed_mole_fractions[i],
-                branch=branch,
-            )
-            sp2 = isotherms[i + 1].spreading_pressure_at(
-                total_pressure * gas_mole_fraction_n / adsorbed_mole_fractions[i + 1],
-                branch=branch
-            )
-            spreading_pressure_diff[i] = sp1 - sp2
-
-        return spreading_pressure_diff
+    components = [_iast_component(isotherm, branch) for isotherm in isotherms]
+    weights = adsorbed_mole_fractions / total_pressure
 
     ###
-    #  Solve for mole fractions in gas phase by equating spreading pressures
+    #  Solve for the spreading pressure at which the gas phase
+    #  mole fractions add up to one.
     if gas_mole_fraction_guess is None:
         # Default guess: adsorbed mole fraction
         gas_mole_fraction_guess = adsorbed_mole_fractions
@@ -595,38 +1022,24 @@ def reverse_iast(
         # if list, convert to numpy array
         gas_mole_fraction_guess = numpy.asarray(gas_mole_fraction_guess)
 
-    res = optimize.root(spreading_pressure_differences, gas_mole_fraction_guess[:-1], method='lm')
-
-    if not res.success:
-        raise CalculationError(
-            textwrap.dedent(
-                f"""
-                Root finding for gas phase mole fractions failed.
-                This is likely because the default guess is not good enough.
-                Try a different starting guess for the gas phase mole fractions by
-                passing an array or list gas_mole_fraction_guess to this function.
-                Scipy error message: \n\t{res.message}"""
-            )
-        )
-
-    gas_mole_fractions = res.x
-
-    # concatenate mole fraction of last component
-    gas_mole_fractions = numpy.concatenate(
-        (gas_mole_fractions, numpy.array([1.0 - numpy.sum(gas_mole_fractions)]))
-    )
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        log_sp = _iast_guess(components, (gas_mole_fraction_guess / weights)[None, :])
+    log_sp, converged, _, _ = _iast_root(components, weights[None, :], 1, log_sp)
 
-    if numpy.sum(gas_mole_fractions < 0.0) != 0 or numpy.sum(gas_mole_fractions > 1.0) != 0:
+    if not converged[0]:
         raise CalculationError(
             textwrap.dedent(
-                """Gas phase mole fraction not in [0,1]. Try a different
-                starting guess for the gas phase mole fractions by passing an
-                array or list 'gas_mole_fraction_guess' into this function. e.g.
-                gas_mole_fraction_guess=[0.2, 0.8]"""
+                """
+                Root finding for the spreading pressure of the gas phase failed.
+                This is likely because the pure-component isotherms do not reach
+                the spreading pressure required, as a PointIsotherm cannot be
+                extrapolated beyond its highest pressure. Try fitting a model to
+                the isotherm data instead."""
             )
         )
 
-    pressure0 = total_pressure * gas_mole_fractions / adsorbed_mole_fractions
+    pressure0 = _iast_pressure0(components, log_sp)[0]
+    gas_mole_fractions = numpy.where(adsorbed_mole_fractions > 0, weights * pressure0, 0)
 
     # solve for the total gas adsorbed
     inverse_loading = 0.0
@@ -671,3 +1084,193 @@ def reverse_iast(
 
     # return mole fractions in gas phase, component loadings
     return gas_mole_fractions, loadings
+
+
+def reverse_iast_path(
+    isotherms,
+    adsorbed_mole_fractions,
+    total_pressures,
+    branch="ads",
+    gas_mole_fraction_guess=None,
+    tol=1e-10,
+    max_iter=50,
+    warningoff=False,
+    verbose=False,
+):
+    """
+    Perform reverse IAST along a path of adsorbed phase compositions
+    and total pressures, such as a desorption path.
+
+    All points are solved at once, as a single equation in the spreading
+    pressure (see `iast_grid`), starting from the default guess. Points which
+    do not converge are then traced using numerical continuation: the
+    spreading pressure of the previous converged point on the path is the
+    starting guess for the next one.
+
+    Pass a list of pure-component adsorption isotherms `isotherms`.
+
+    Parameters
+    ----------
+    isotherms : list
+        Pure-component adsorption isotherms.
+        e.g. [ethane_isotherm, methane_isotherm]
+    adsorbed_mole_fractions : array
+        Desired adsorbed mole fractions, either a single composition or
+        one for each point, e.g. [[0.5, 0.5], [0.4, 0.6]].
+    total_pressures : float or array
+        Total bulk gas pressure, either a single pressure or one for each point.
+    branch : str
+        which branch of the isotherm to use
+    gas_mole_fraction_guess : array or list, optional
+        Starting guess for the gas phase mole fractions, used for all points.
+        Defaults to the adsorbed mole fractions of each point.
+    tol : float, optional
+        Tolerance on the sum of gas mole fractions.
+    max_iter : int, optional
+        Maximum number of Newton iterations for each attempt.
+    warningoff : bool
+        When False, logger.warning will print when some points have not converged,
+        or when the IAST calculation result required extrapolation of the
+        pure-component adsorption isotherm beyond the highest pressure in the data.
+    verbose : bool
+        Print extra information.
+
+    Returns
+    -------
+    dict
+        Dictionary with the following components, where points which
+        did not converge are set to ``nan``:
+            - `gas_mole_fraction` the bulk gas mole fractions
+            - `loading` the adsorbed component loadings
+            - `pressure0` the fictitious pure-component pressures
+            - `converged` whether each point has converged
+            - `iterations` the number of evaluations of the IAST equations for each point
+            - `residual` the remaining error in the sum of gas mole fractions
+
+    """
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+    if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
+        raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+
+    n_components = len(isotherms)
+    if n_components == 1:
+        raise ParameterError("Pass at least two isotherms.")
+
+    adsorbed_mole_fractions = numpy.atleast_2d(numpy.asarray(adsorbed_mole_fractions, dtype=float))
+    total_pressures = numpy.atleast_1d(numpy.asarray(total_pressures, dtype=float))
+    if adsorbed_mole_fractions.ndim != 2 or adsorbed_mole_fractions.shape[1] != n_components:
+        raise ParameterError("Number of adsorbed mole fractions != number of isotherms.")
+    if numpy.any(adsorbed_mole_fractions < 0) or \
+            not numpy.allclose(adsorbed_mole_fractions.sum(axis=1), 1):
+        raise ParameterError("Desired adsorbed mole fractions should be positive and sum to 1.0.")
+    if total_pressures.ndim != 1 or numpy.any(total_pressures <= 0):
+        raise ParameterError("Total pressures must be positive.")
+    n_points = max(len(adsorbed_mole_fractions), len(total_pressures))
+    try:
+        adsorbed_mole_fractions = numpy.broadcast_to(adsorbed_mole_fractions, (n_points, n_components))
+        total_pressures = numpy.broadcast_to(total_pressures, (n_points, ))
+    except ValueError as err:
+        raise ParameterError("The number of adsorbed mole fractions and pressures must be the same.") from err
+
+    if gas_mole_fraction_guess is not None:
+        gas_mole_fraction_guess = numpy.asarray(gas_mole_fraction_guess, dtype=float)
+        if gas_mole_fraction_guess.shape != (n_components, ):
+            raise ParameterError("Number of gas mole fractions != number of isotherms.")
+        numpy.testing.assert_almost_equal(1.0, numpy.sum(gas_mole_fraction_guess), decimal=4)
+
+    components = [_iast_component(isotherm, branch) for isotherm in isotherms]
+    weights = adsorbed_mole_fractions / total_pressures[:, None]
+    present = weights > 0
+
+    def solve(rows, guess):
+        """Solve the selected points of the path and store the results."""
+        solution, success, n_iter, res = _iast_root(
+            components,
+            weights[rows],
+            1,
+            guess,
+            tol=tol,
+            max_iter=max_iter,
+        )
+        iterations[rows] += n_iter
+        residual[rows] = res
+        log_sp[rows[success]] = solution[success]
+        converged[rows[success]] = True
+        return success.any()
+
+    log_sp = numpy.full(n_points, numpy.nan)
+    converged = numpy.zeros(n_points, dtype=bool)
+    iterations = numpy.zeros(n_points, dtype=int)
+    residual = numpy.full(n_points, numpy.nan)
+    rows = numpy.arange(n_points)
+
+    # All points start from the default guess
+    if gas_mole_fraction_guess is None:
+        default = adsorbed_mole_fractions
+    else:
+        default = numpy.broadcast_to(gas_mole_fraction_guess, (n_points, n_components))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        solve(rows, _iast_guess(components, default / weights))
+
+    # Continuation: failed points start from the spreading pressure of the
+    # previous converged point on the path (or the next, at the start)
+    while not converged.all() and converged.any():
+        failed = rows[~converged]
+        done = rows[converged]
+        position = numpy.searchsorted(done, failed)
+        seed = done[numpy.where(position > 0, position - 1, 0)]
+        if not solve(failed, log_sp[seed]):
+            break
+
+    # Compute results
+    pressure0 = _iast_pressure0(components, log_sp)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        gas_mole_fractions = numpy.where(present, weights * pressure0, 0)
+        inverse_loading = numpy.where(
+            present,
+            adsorbed_mole_fractions / numpy.column_stack([
+                component.loading(pressure0[:, i]) for i, component in enumerate(components)
+            ]),
+            0,
+        ).sum(axis=1)
+    loadings = adsorbed_mole_fractions / inverse_loading[:, None]
+    gas_mole_fractions[~converged] = numpy.nan
+
+    if verbose:
+        logger.info(
+            f"{n_components:d} components, {n_points:d} points, "
+            f"{numpy.count_nonzero(converged):d} converged in {iterations.sum():d} iterations."
+        )
+
+    if not warningoff:
+        if not converged.all():
+            logger.warning(
+                f"Reverse IAST did not converge for {numpy.count_nonzero(~converged):d} "
+                f"out of {n_points:d} points."
+            )
+        for i, isotherm in enumerate(isotherms):
+            p_max = isotherm.pressure(branch=branch).max()
+            n_extrapolated = numpy.count_nonzero(pressure0[:, i] > p_max)
+            if n_extrapolated:
+                logger.warning(
+                    textwrap.dedent(
+                        f"""
+                        WARNING:
+                        Component {i:d}: p0 > {p_max:.4g} for {n_extrapolated:d} points,
+                        the highest pressure exhibited in the pure-component
+                        isotherm data. Thus, pyGAPS had to extrapolate the
+                        isotherm data to achieve this IAST result."""
+                    )
+                )
+
+    return {
+        "gas_mole_fraction": gas_mole_fractions,
+        "loading": loadings,
+        "pressure0": pressure0,
+        "converged": converged,
+        "iterations": iterations,
+        "residual": residual,
+    }
@@ -1,16 +1,41 @@
 """Utilities for interacting with the CoolProp backend."""
 
 from pygaps import logger
+from pygaps.utilities.exceptions import ParameterError
 
-try:
-    import CoolProp as CP
-    logger.debug(f"CoolProp version is '{CP.__version__}'")
-except ImportError:
-    CP = None
+# CoolProp is slow to import, so it is only imported when first used.
+_NOT_IMPORTED = object()
+_COOLPROP = _NOT_IMPORTED
 
 #: The backend which CoolProp uses, normally either HEOS or REFPROP.
 COOLPROP_BACKEND = 'HEOS'
 
+#: The CoolProp tabular interpolation methods available.
+_TABULAR_BACKENDS = ['BICUBIC', 'TTSE']
+
+#: The backend which interpolates saturation properties in precomputed tables.
+TABLES_BACKEND = 'TABLES'
+
+
+def coolprop():
+    """
+    Return the CoolProp module, importing it on first use.
+
+    Returns
+    -------
+    module or None
+        The CoolProp module, or None if it is not installed.
+    """
+    global _COOLPROP
+    if _COOLPROP is _NOT_IMPORTED:
+        try:
+            import CoolProp
+            logger.debug(f"CoolProp version is '{CoolProp.__version__}'")
+            _COOLPROP = CoolProp
+        except ImportError:
+            _COOLPROP = None
+    return _COOLPROP
+
 
 def thermodynamic_backend():
     global COOLPROP_BACKEND
@@ -24,8 +49,91 @@ def backend_use_refprop():
     logger.info("Switched to CoolProp REFPROP backend.")
 
 
-def backend_use_coolprop():
-    """Switch the equation of state used to HEOS (CoolProp)."""
+def backend_use_tables():
+    """
+    Switch to interpolating saturation properties in precomputed tables.
+
+    Tables are read from the user cache or the package data, or generated
+    through CoolProp HEOS the first time an adsorbate is used. Properties
+    which are not tabulated are still calculated with HEOS.
+    """
+    global COOLPROP_BACKEND
+    COOLPROP_BACKEND = TABLES_BACKEND
+    logger.info("Switched to precomputed property tables.")
+
+
+def backend_use_coolprop(tabular: str = None):
+    """
+    Switch the equation of state used to HEOS (CoolProp).
+
+    Parameters
+    ----------
+    tabular : {None, 'BICUBIC', 'TTSE'}, optional
+        If given, properties are interpolated in tables generated by
+        CoolProp from HEOS, which is much faster for many state points.
+        The tables are built (and cached on disk by CoolProp) on first use.
+    """
     global COOLPROP_BACKEND
-    COOLPROP_BACKEND = 'HEOS'
-    logger.info("Switched to CoolProp HEOS backend.")
+    if tabular is None:
+        COOLPROP_BACKEND = 'HEOS'
+    elif tabular.upper() in _TABULAR_BACKENDS:
+        COOLPROP_BACKEND = f"{tabular.upper()}&HEOS"
+    else:
+        raise ParameterError(
+            f"Tabular backend '{tabular}' is not recognised. "
+            f"Choose from {_TABULAR_BACKENDS}."
+        )
+    logger.info(f"Switched to CoolProp {COOLPROP_BACKEND} backend.")
+
+
+def calculate_property(state, prop: str, temp: float = None, pressure: float = None) -> float:
+    """
+    Calculate a property from a CoolProp state, in pyGAPS units.
+
+    Parameters
+    ----------
+    state : CoolProp.AbstractState
+        The state object of the fluid.
+    prop : str
+        Name of the property, as the corresponding Adsorbate method.
+    temp : float, optional
+        Temperature in K.
+    pressure : float, optional
+        Pressure in Pa.
+
+    Returns
+    -------
+    float
+        The value of the property.
+    """
+    CP = coolprop()
+
+    if prop == 'compressibility':
+        state.update(CP.PT_INPUTS, pressure, temp)
+        return state.compressibility_factor()
+
+    if prop == 'enthalpy_liquefaction':
+        if temp is not None:
+            state.update(CP.QT_INPUTS, 0.0, temp)
+            h_liq = state.hmolar()
+            state.update(CP.QT_INPUTS, 1.0, temp)
+        else:
+            state.update(CP.PQ_INPUTS, pressure, 0.0)
+            h_liq = state.hmolar()
+            state.update(CP.PQ_INPUTS, pressure, 1.0)
+        return (state.hmolar() - h_liq) / 1000
+
+    if prop in ('gas_density', 'gas_molar_density'):
+        state.update(CP.QT_INPUTS, 1.0, temp)
+    else:
+        state.update(CP.QT_INPUTS, 0.0, temp)
+
+    if prop == 'saturation_pressure':
+        return state.p()
+    if prop == 'surface_tension':
+        return state.surface_tension() * 1000
+    if prop in ('liquid_density', 'gas_density'):
+        return state.rhomass() / 1000
+    if prop in ('liquid_molar_density', 'gas_molar_density'):
+        return state.rhomolar() / 1e6
+    raise ParameterError(f"Property '{prop}' cannot be calculated.")
@@ -0,0 +1,316 @@
+"""Storage, conversion and lookup of DFT kernels."""
+
+import hashlib
+import json
+from collections import namedtuple
+from pathlib import Path
+
+import numpy
+
+from pygaps.data import KERNEL_DIRECTORIES
+from pygaps.data import KERNELS
+from pygaps.utilities.exceptions import ParameterError
+
+#: Version of the binary kernel format.
+KERNEL_VERSION = 1
+
+#: Extensions of kernel files, in order of preference.
+KERNEL_FORMATS = ['.npz', '.csv']
+
+# Number of kernels kept in memory.
+_KERNEL_CACHE_SIZE = 8
+
+# Kernels already loaded, per path, the least recently used first.
+_LOADED = {}
+
+#: The kernel matrix at a set of pressures, with its thin QR factorisation
+#: and singular values.
+KernelProjection = namedtuple("KernelProjection", "matrix q r singular")
+
+
+class DFTKernel():
+    """
+    A collection of ideal isotherms in pores of different widths.
+
+    Call with an array of pressures to get the loading in each pore
+    at these pressures, as a matrix with one column per pore width.
+    All isotherms are interpolated together, by cubic splines.
+
+    As isotherms are often measured at the same pressures, the kernel
+    matrices at recently used pressures are cached, see ``projection``.
+
+    Parameters
+    ----------
+    pressure : array
+        The pressures of the kernel isotherms, increasing.
+    pore_widths : array
+        The width of each pore.
+    loading : array
+        The loading at each pressure (rows) in each pore (columns).
+    metadata : dict, optional
+        Information on the kernel, such as its source.
+
+    """
+    #: Number of kernel projections kept in memory.
+    projection_cache_size = 16
+
+    def __init__(
+        self,
+        pressure,
+        pore_widths,
+        loading,
+        metadata: dict = None,
+    ):
+        """Store the kernel and prepare the interpolation."""
+        # Imported here to keep importing pyGAPS fast
+        from scipy.interpolate import make_interp_spline
+
+        self.pressure = numpy.asarray(pressure, dtype=float)
+        self.pore_widths = numpy.asarray(pore_widths, dtype=float)
+        self.loading = numpy.asarray(loading, dtype=float)
+        self.metadata = metadata or {}
+
+        if self.loading.shape != (self.pressure.size, self.pore_widths.size):
+            raise ParameterError(
+                f"Kernel loading has shape {self.loading.shape}, expected "
+                f"{(self.pressure.size, self.pore_widths.size)}."
+            )
+
+        self._spline = make_interp_spline(self.pressure, self.loading, k=3, axis=0)
+        self._projections = {}
+
+    def __call__(self, pressure):
+        """
+        Interpolate all kernel isotherms at once.
+
+        Parameters
+        ----------
+        pressure : array
+            Pressures at which to get the loading.
+
+        Returns
+        -------
+        array
+            The loading at each pressure (rows) in each pore (columns).
+
+        Raises
+        ------
+        ValueError
+            If the pressures are outside of the kernel range.
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        if numpy.any(pressure < self.pressure[0]) or numpy.any(pressure > self.pressure[-1]):
+            raise ValueError(
+                f"Pressures must be between {self.pressure[0]} and {self.pressure[-1]}."
+            )
+        return self._spline(pressure)
+
+    def projection(self, pressure) -> KernelProjection:
+        r"""
+        Get the kernel matrix at a set of pressures, and its factorisation.
+
+        The least squares fit of the kernel :math:`\min ||Ax - b||` is
+        equivalent to the smaller problem :math:`\min ||Rx - Q^T b||` with
+        the thin QR factorisation :math:`A = QR`, which is solved for any
+        isotherm measured at the same pressures. Results are cached by
+        the pressure values.
+
+        Parameters
+        ----------
+        pressure : array
+            Pressures at which to get the loading.
+
+        Returns
+        -------
+        KernelProjection
+            The kernel matrix, its Q and R factors and its singular values.
+        """
+        pressure = numpy.ascontiguousarray(pressure, dtype=float)
+        key = hashlib.md5(pressure.tobytes()).hexdigest()
+
+        projection = self._projections.pop(key, None)  # reinserted as the most recently used
+        if projection is None:
+            matrix = self(pressure)
+            q, r = numpy.linalg.qr(matrix)
+            singular = numpy.linalg.svd(r, compute_uv=False)
+            projection = KernelProjection(matrix, q, r, singular)
+
+        self._projections[key] = projection
+        if len(self._projections) > self.projection_cache_size:
+            del self._projections[next(iter(self._projections))]
+        return projection
+
+    @classmethod
+    def from_csv(cls, path):
+        """
+        Read a kernel stored as a pressure-loading table.
+
+        The first column contains the pressures, and each other column the
+        isotherm in a pore, with the pore width as header. A point at zero
+        pressure and loading is added, for interpolation at low pressure.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the .csv file to read.
+
+        Returns
+        -------
+        DFTKernel
+            The kernel.
+        """
+        # Imported here to keep importing pyGAPS fast
+        import pandas
+
+        with open(path, encoding="utf8") as fp:
+            raw_kernel = pandas.read_csv(fp, index_col=0)
+
+        pressure = raw_kernel.index.to_numpy(dtype=float)
+        loading = raw_kernel.to_numpy(dtype=float)
+        if pressure[0] > 0:
+            pressure = numpy.concatenate(([0], pressure))
+            loading = numpy.vstack((numpy.zeros(loading.shape[1]), loading))
+
+        return cls(
+            pressure,
+            raw_kernel.columns.astype(float),
+            loading,
+            {"source": Path(path).name},
+        )
+
+    def to_file(self, path):
+        """
+        Save the kernel as an uncompressed numpy archive.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the file to write.
+        """
+        numpy.savez(
+            path,
+            version=KERNEL_VERSION,
+            pressure=self.pressure,
+            pore_widths=self.pore_widths,
+            loading=self.loading,
+            metadata=json.dumps(self.metadata),
+        )
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a kernel saved with ``to_file``.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the file to read.
+
+        Returns
+        -------
+        DFTKernel
+            The stored kernel.
+        """
+        with numpy.load(path, allow_pickle=False) as data:
+            if int(data['version']) != KERNEL_VERSION:
+                raise ParameterError(
+                    f"Kernel '{path}' is version {int(data['version'])}, "
+                    f"expected version {KERNEL_VERSION}."
+                )
+            return cls(
+                data['pressure'],
+                data['pore_widths'],
+                data['loading'],
+                json.loads(str(data['metadata'])),
+            )
+
+    @classmethod
+    def read(cls, path):
+        """Read a kernel in any supported format, according to its extension."""
+        if Path(path).suffix == '.csv':
+            return cls.from_csv(path)
+        return cls.from_file(path)
+
+
+def convert_kernel(path, output=None) -> Path:
+    """
+    Convert a kernel from the .csv format to the binary .npz format.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path of the .csv kernel.
+    output : str or Path, optional
+        Path of the converted kernel, defaults to the same
+        location with a .npz extension.
+
+    Returns
+    -------
+    Path
+        Path of the converted kernel.
+    """
+    path = Path(path)
+    output = path.with_suffix('.npz') if output is None else Path(output)
+    DFTKernel.from_csv(path).to_file(output)
+    return output
+
+
+def kernel_path(kernel: str) -> Path:
+    """
+    Find the file of a kernel.
+
+    Kernels are looked up by name in ``pygaps.data.KERNELS``, then
+    as files named after the kernel in ``pygaps.data.KERNEL_DIRECTORIES``.
+    Otherwise, the kernel is assumed to be a path.
+
+    Parameters
+    ----------
+    kernel : str
+        The name of the kernel, or its path.
+
+    Returns
+    -------
+    Path
+        The location of the kernel.
+    """
+    if kernel in KERNELS:
+        return Path(KERNELS[kernel])
+
+    for directory in KERNEL_DIRECTORIES:
+        for extension in KERNEL_FORMATS:
+            path = Path(directory) / f"{kernel}{extension}"
+            if path.is_file():
+                return path
+
+    path = Path(kernel)
+    if not path.is_file():
+        raise ParameterError(f"Could not find the kernel '{kernel}'.")
+    return path
+
+
+def get_kernel(kernel: str) -> DFTKernel:
+    """
+    Get a kernel, by name or path.
+
+    Recently used kernels are kept in memory.
+
+    Parameters
+    ----------
+    kernel : str
+        The name of the kernel, or its path. See ``kernel_path``.
+
+    Returns
+    -------
+    DFTKernel
+        The kernel.
+    """
+    path = kernel_path(kernel)
+
+    loaded = _LOADED.pop(path, None)  # reinserted as the most recently used
+    if loaded is None:
+        loaded = DFTKernel.read(path)
+
+    _LOADED[path] = loaded
+    if len(_LOADED) > _KERNEL_CACHE_SIZE:
+        del _LOADED[next(iter(_LOADED))]
+    return loaded
@@ -0,0 +1,183 @@
+"""A class used for computing the spreading pressure of discrete isotherms."""
+
+import numpy
+
+from pygaps.utilities.math_utilities import safe_newton
+
+
+class IsothermIntegrator():
+    r"""
+    Class used to integrate an isotherm for its reduced spreading pressure.
+
+    Call directly to use.
+
+    The isotherm is represented by a linear interpolation of the data, for
+    which the integral
+
+    .. math::
+
+        \Pi(p) = \int_0^p \frac{q(\hat{p})}{ \hat{p}} d\hat{p}
+
+    has a closed form on each segment. The cumulative integral at each
+    data point is computed once on instantiation, such that any subsequent
+    evaluation only requires locating the segment and adding the partial area
+    up to the requested pressure.
+
+    Parameters
+    ----------
+    known_pressure : array
+        The pressure points of the isotherm.
+    known_loading : array
+        The loading points of the isotherm.
+    interp_branch : str, optional
+        Stores which isotherm branch the integrator is based on.
+
+    """
+    def __init__(
+        self,
+        known_pressure,
+        known_loading,
+        interp_branch='ads',
+    ):
+        # The branch the integrator is on.
+        self.interp_branch = interp_branch
+
+        # Points are sorted by pressure, as the integral is cumulative.
+        known_pressure = numpy.asarray(known_pressure, dtype=float)
+        known_loading = numpy.asarray(known_loading, dtype=float)
+        order = numpy.argsort(known_pressure, kind='stable')
+        self.pressure = known_pressure[order]
+        self.loading = known_loading[order]
+
+        # Loading up to first pressure point follows Henry's law.
+        self.henry_const = self.loading[0] / self.pressure[0]
+
+        # Slope and intercept of each linear segment between data points.
+        # Zero-width segments (repeated pressures) do not add any area.
+        d_pressure = numpy.diff(self.pressure)
+        flat = d_pressure == 0
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            self.slope = numpy.diff(self.loading) / d_pressure
+        self.slope[flat] = 0
+        self.intercept = self.loading[:-1] - self.slope * self.pressure[:-1]
+        area = self.slope * d_pressure + \
+            self.intercept * numpy.log(self.pressure[1:] / self.pressure[:-1])
+
+        # The area from 0 to the first point is equal to its loading.
+        self.cumulative = numpy.cumsum(numpy.concatenate(([self.loading[0]], area)))
+
+    def __call__(self, pressure, interp_fill=None):
+        """
+        Return the spreading pressure at the pressure(s) given.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure(s) at which to compute the spreading pressure.
+        interp_fill : array-like or (array-like, array_like) or “extrapolate”, optional
+            Loading assumed beyond the highest pressure in the data, as
+            in the ``fill_value`` of scipy.interpolate.interp1d.
+            If blank, points outside the data return ``nan``.
+
+        Returns
+        -------
+        float or array
+            Spreading pressure, :math:`\\Pi`.
+
+        """
+        pressure = numpy.asarray(pressure, dtype=float)
+        points = numpy.atleast_1d(pressure)
+        result = numpy.full(points.shape, numpy.nan)
+
+        # Number of data points strictly lower than each requested pressure
+        n_points = numpy.searchsorted(self.pressure, points, side='left')
+        n_data = len(self.pressure)
+
+        # Below the first point, the integral simplifies to henry_const * P
+        below = n_points == 0
+        result[below] = self.henry_const * points[below]
+
+        # Inside the data: area up to the previous point plus partial segment
+        inside = (n_points > 0) & (n_points < n_data)
+        prev = n_points[inside] - 1
+        result[inside] = self._area(
+            points[inside],
+            prev,
+            self.slope[prev],
+            self.intercept[prev],
+        )
+
+        # Beyond the data: the final segment depends on the fill value
+        above = n_points == n_data
+        if numpy.any(above) and interp_fill is not None:
+            prev = numpy.full(numpy.count_nonzero(above), n_data - 1)
+            if isinstance(interp_fill, str):
+                # extrapolate the last data segment
+                slope = self.slope[-1] if n_data > 1 else 0
+                intercept = self.intercept[-1] if n_data > 1 else self.loading[-1]
+            else:
+                fill = interp_fill[-1] if numpy.ndim(interp_fill) else interp_fill
+                slope = (fill - self.loading[-1]) / (points[above] - self.pressure[-1])
+                intercept = self.loading[-1] - slope * self.pressure[-1]
+            result[above] = self._area(points[above], prev, slope, intercept)
+
+        if pressure.ndim == 0:
+            return result[0]
+        return result
+
+    def inverse(self, spreading_pressure):
+        """
+        Return the pressure at which the spreading pressure(s) given are reached.
+
+        As the spreading pressure increases monotonically with pressure, the
+        cumulative integral is used to find the segment of each point.
+        The closed form of the integral on that segment is then
+        solved with Newton steps on the logarithm of pressure,
+        where the derivative is the loading.
+
+        Parameters
+        ----------
+        spreading_pressure : float or array
+            Spreading pressure(s), :math:`\\Pi`.
+
+        Returns
+        -------
+        float or array
+            Pressure, or ``nan`` if outside the range of the data.
+
+        """
+        spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+        points = numpy.atleast_1d(spreading_pressure)
+        result = numpy.full(points.shape, numpy.nan)
+
+        # Below the first point, the integral is henry_const * P
+        below = (points >= 0) & (points <= self.cumulative[0])
+        result[below] = points[below] / self.henry_const if self.henry_const else 0
+
+        # Inside the data, in the segment after the previous point
+        inside = numpy.flatnonzero((points > self.cumulative[0]) & (points <= self.cumulative[-1]))
+        prev = numpy.searchsorted(self.cumulative, points[inside], side='left') - 1
+        lower = numpy.log(self.pressure[prev])
+        upper = numpy.log(self.pressure[prev + 1])
+        slope = self.slope[prev]
+        intercept = self.intercept[prev]
+        target = points[inside]
+
+        def func(log_p, index):
+            pressure = numpy.exp(log_p)
+            value = self._area(pressure, prev[index], slope[index], intercept[index]) - target[index]
+            return value, slope[index] * pressure + intercept[index]
+
+        # start from a linear interpolation of the spreading pressure in the segment
+        fraction = (target - self.cumulative[prev]) / (self.cumulative[prev + 1] - self.cumulative[prev])
+        log_p = safe_newton(func, lower + fraction * (upper - lower), lower, upper)
+        result[inside] = numpy.exp(log_p)
+
+        if spreading_pressure.ndim == 0:
+            return result[0]
+        return result
+
+    def _area(self, pressure, prev, slope, intercept):
+        """Cumulative area up to point `prev` plus the segment up to `pressure`."""
+        return self.cumulative[prev] + slope * (pressure - self.pressure[prev]) + \
+            intercept * numpy.log(pressure / self.pressure[prev])
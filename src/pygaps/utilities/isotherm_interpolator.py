@@ -1,6 +1,17 @@
 """A class used for isotherm interpolation."""
 
+import numpy
+from scipy.interpolate import PchipInterpolator
 from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
+
+#: Spline orders for each kind of interpolation, as in scipy.interpolate.interp1d.
+_SPLINE_ORDERS = {
+    'zero': 0,
+    'slinear': 1,
+    'quadratic': 2,
+    'cubic': 3,
+}
 
 
 class IsothermInterpolator():
@@ -9,7 +20,12 @@ class IsothermInterpolator():
 
     Call directly to use.
 
-    It is mainly a wrapper around scipy.interpolate.interp1d.
+    Linear interpolation (the default) is done with ``numpy.interp``.
+    Spline interpolation (`zero`, `slinear`, `quadratic`, `cubic`)
+    uses ``scipy.interpolate.make_interp_spline`` and `pchip` a monotonic
+    ``scipy.interpolate.PchipInterpolator``. Other kinds
+    (`nearest`, `previous`, `next`) are passed on to
+    ``scipy.interpolate.interp1d``.
 
     Parameters
     ----------
@@ -25,9 +41,10 @@ class IsothermInterpolator():
     interp_kind : str, optional
         Determine which kind of interpolation is done between the
         datapoints.
-    interp_fill : str, optional
-        The parameter passed to the scipy.interpolate.interp1d function
-        to determine what to do outside data bounds.
+    interp_fill : array-like or (array-like, array_like) or “extrapolate”, optional
+        What to do outside data bounds, as the ``fill_value`` of
+        scipy.interpolate.interp1d. If not given, a ValueError is
+        raised for points outside the data.
 
     """
     def __init__(
@@ -51,24 +68,88 @@ class IsothermInterpolator():
         if known_data is None:
             return
 
-        # Create the interpolator
-        if interp_fill is None:
-            self.interp_fun = interp1d(
-                known_data,
-                interp_data,
-                kind=interp_kind,
+        # Data is sorted by the input variable
+        known_data = numpy.asarray(known_data, dtype=float)
+        interp_data = numpy.asarray(interp_data, dtype=float)
+        order = numpy.argsort(known_data, kind='mergesort')
+        self.known_data = known_data[order]
+        self.interp_data = interp_data[order]
+
+        extrapolate = isinstance(interp_fill, str) and interp_fill == 'extrapolate'
+
+        if interp_kind == 'linear':
+            self.interp_fun = self._linear
+        elif interp_kind in _SPLINE_ORDERS:
+            self.interp_fun = make_interp_spline(
+                self.known_data,
+                self.interp_data,
+                k=_SPLINE_ORDERS[interp_kind],
+                check_finite=False,
+            )
+            self.interp_fun.extrapolate = extrapolate
+        elif interp_kind == 'pchip':
+            self.interp_fun = PchipInterpolator(
+                self.known_data,
+                self.interp_data,
+                extrapolate=extrapolate,
             )
-        # If we want to extrapolate, we need to use a different
-        # interpolator.
         else:
             self.interp_fun = interp1d(
-                known_data,
-                interp_data,
+                self.known_data,
+                self.interp_data,
                 kind=interp_kind,
-                fill_value=interp_fill,
-                bounds_error=False
+                fill_value=interp_fill if extrapolate else numpy.nan,
+                bounds_error=False,
+                assume_sorted=True,
             )
 
+        # Values to use below and above the data range
+        self._extrapolate = extrapolate
+        self._fill = None
+        if interp_fill is not None and not extrapolate:
+            if numpy.ndim(interp_fill) and len(interp_fill) == 2:
+                self._fill = (interp_fill[0], interp_fill[1])
+            else:
+                self._fill = (interp_fill, interp_fill)
+
+    def _linear(self, data):
+        """Linear interpolation, extrapolating the first and last segments if requested."""
+        result = numpy.interp(data, self.known_data, self.interp_data)
+        if self._extrapolate and self.known_data.size > 1:
+            x, y = self.known_data, self.interp_data
+            below = data < x[0]
+            above = data > x[-1]
+            if numpy.any(below):
+                slope = (y[1] - y[0]) / (x[1] - x[0])
+                result = numpy.where(below, y[0] + slope * (data - x[0]), result)
+            if numpy.any(above):
+                slope = (y[-1] - y[-2]) / (x[-1] - x[-2])
+                result = numpy.where(above, y[-1] + slope * (data - x[-1]), result)
+        return result
+
     def __call__(self, data):
         """Override direct call to return interpolated data."""
-        return self.interp_fun(data)
+        data = numpy.asarray(data, dtype=float)
+        result = numpy.asarray(self.interp_fun(data), dtype=float)
+        if self._extrapolate:
+            return result
+
+        below = data < self.known_data[0]
+        above = data > self.known_data[-1]
+        if self._fill is None:
+            if numpy.any(below):
+                raise ValueError(
+                    f"A value ({data[below].min()}) in x_new is below "
+                    f"the interpolation range's minimum value ({self.known_data[0]})."
+                )
+            if numpy.any(above):
+                raise ValueError(
+                    f"A value ({data[above].max()}) in x_new is above "
+                    f"the interpolation range's maximum value ({self.known_data[-1]})."
+                )
+            return result
+
+        if numpy.any(below) or numpy.any(above):
+            result = numpy.where(below, self._fill[0], result)
+            result = numpy.where(above, self._fill[1], result)
+        return result
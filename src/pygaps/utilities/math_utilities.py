@@ -183,3 +183,98 @@ def same_orders_of_maximum(vals):
     if abs(orders[0] - orders[1]) > 1:
         return True
     return False
+
+
+def safe_newton(func, x0, lower, upper, rtol=1e-12, max_iter=100):
+    """
+    Find the roots of an increasing element-wise function, each known to be
+    inside a bracket. Newton steps are taken while they stay inside the
+    bracket, otherwise the bracket is bisected.
+
+    Parameters
+    ----------
+    func : callable
+        Function ``func(x, index)`` returning the value and derivative of the
+        function at `x`, for the elements with indices `index`.
+    x0 : array
+        Starting points.
+    lower, upper : array
+        Limits of the bracket for each element, with ``func(lower) <= 0 <= func(upper)``.
+    rtol : float, optional
+        Tolerance on the Newton step, relative to the magnitude of x
+        (or absolute if it is smaller than one).
+    max_iter : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    array
+        The roots of the function.
+    """
+    x = numpy.array(x0, dtype=float)
+    lower = numpy.array(lower, dtype=float)
+    upper = numpy.array(upper, dtype=float)
+    active = numpy.flatnonzero(numpy.isfinite(x))
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+            value, derivative = func(x[active], active)
+
+            above = value > 0
+            upper[active[above]] = x[active[above]]
+            lower[active[~above]] = x[active[~above]]
+
+            step = value / derivative
+            new = x[active] - step
+            bisect = ~numpy.isfinite(new) | (new < lower[active]) | (new > upper[active])
+            new[bisect] = (lower[active][bisect] + upper[active][bisect]) / 2
+            step[bisect] = upper[active][bisect] - lower[active][bisect]
+            x[active] = new
+
+            done = (value == 0) | (numpy.abs(step) <= rtol * numpy.maximum(1, numpy.abs(new)))
+            active = active[~done]
+
+    return x
+
+
+def isotonic_regression(ydata, weights=None):
+    """
+    Fit a non-decreasing sequence to data using the pool-adjacent-violators
+    algorithm, in O(N).
+
+    Parameters
+    ----------
+    ydata : array
+        Data to fit, in order.
+    weights : array, optional
+        Weights of each point, defaults to equal weights.
+
+    Returns
+    -------
+    values : array
+        The fitted value of each block of pooled points, strictly increasing.
+    sizes : array
+        The number of consecutive points in each block.
+    """
+    ydata = numpy.asarray(ydata, dtype=float)
+    if weights is None:
+        weights = numpy.ones_like(ydata)
+    else:
+        weights = numpy.asarray(weights, dtype=float)
+
+    values, totals, sizes = [], [], []
+    for y, w in zip(ydata, weights):
+        value, total, size = y, w, 1
+        # Merge with previous blocks while they violate monotonicity
+        while values and values[-1] >= value:
+            value = (values[-1] * totals[-1] + value * total) / (totals[-1] + total)
+            total += totals.pop()
+            size += sizes.pop()
+            values.pop()
+        values.append(value)
+        totals.append(total)
+        sizes.append(size)
+
+    return numpy.array(values), numpy.array(sizes, dtype=int)
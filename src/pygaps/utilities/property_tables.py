@@ -0,0 +1,467 @@
+"""Precomputed tables of adsorbate saturation properties."""
+
+import json
+from pathlib import Path
+
+import numpy
+
+from pygaps import logger
+from pygaps.data import PROPERTY_TABLES
+from pygaps.utilities.coolprop_utilities import calculate_property
+from pygaps.utilities.coolprop_utilities import coolprop
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+
+#: Version of the table format, increased whenever tables must be regenerated.
+TABLE_VERSION = 1
+
+#: Saturation properties which are tabulated, as the Adsorbate methods.
+TABLE_PROPERTIES = [
+    'saturation_pressure',
+    'surface_tension',
+    'liquid_density',
+    'liquid_molar_density',
+    'gas_density',
+    'gas_molar_density',
+    'enthalpy_liquefaction',
+]
+
+# Reduced distance to the critical point left out of tables, as properties
+# are singular there.
+_CRITICAL_MARGIN = 1e-4
+
+# Tables already loaded, per fluid.
+_LOADED = {}
+
+
+def _reduced(temp, t_critical):
+    """
+    Temperature variable in which saturation properties are smooth up to
+    the critical point, as they scale with (1 - T/Tc) to a power close to 1/3.
+    """
+    return numpy.cbrt(1 - numpy.asarray(temp, dtype=float) / t_critical)
+
+
+class PropertyTable():
+    """
+    Saturation properties of a fluid, interpolated in a precomputed table.
+
+    Call with a property name and a temperature or pressure to use.
+
+    Properties are stored on a grid of the reduced variable
+    :math:`x = (1 - T/T_c)^{1/3}`, between the triple point and just below
+    the critical point, and interpolated with cubic splines. The saturation
+    pressure is interpolated as a logarithm, and properties at a given
+    pressure are calculated at the corresponding saturation temperature.
+
+    Parameters
+    ----------
+    backend_name : str
+        The CoolProp name of the fluid.
+    t_critical : float
+        Critical temperature of the fluid, in K.
+    reduced : array
+        The reduced temperature grid, increasing.
+    values : dict[str, array]
+        The values of each property on the grid, in pyGAPS units.
+    errors : dict[str, float], optional
+        Maximum relative error of each property, as checked against the
+        equation of state between grid points.
+    metadata : dict, optional
+        Information on how the table was generated.
+
+    """
+    def __init__(
+        self,
+        backend_name: str,
+        t_critical: float,
+        reduced,
+        values: dict,
+        errors: dict = None,
+        metadata: dict = None,
+    ):
+        """Store the table and prepare the interpolation."""
+        # Imported here to keep importing pyGAPS fast
+        from scipy.interpolate import make_interp_spline
+
+        self.backend_name = backend_name
+        self.t_critical = t_critical
+        self.reduced = numpy.asarray(reduced, dtype=float)
+        self.values = {prop: numpy.asarray(val, dtype=float) for prop, val in values.items()}
+        self.errors = errors or {}
+        self.metadata = metadata or {}
+
+        self._splines = {
+            prop: make_interp_spline(self.reduced, self._stored(prop, val), k=3)
+            for prop, val in self.values.items()
+        }
+        # Reduced temperature as a function of the saturation pressure
+        if 'saturation_pressure' in self.values:
+            self._splines['reduced'] = make_interp_spline(
+                numpy.log(self.values['saturation_pressure'][::-1]),
+                self.reduced[::-1],
+                k=3,
+            )
+
+    @staticmethod
+    def _stored(prop, values):
+        """Saturation pressures are interpolated as logarithms."""
+        if prop == 'saturation_pressure':
+            return numpy.log(values)
+        return values
+
+    @property
+    def t_min(self) -> float:
+        """Lowest temperature in the table, in K."""
+        return self.t_critical * (1 - self.reduced[-1]**3)
+
+    @property
+    def t_max(self) -> float:
+        """Highest temperature in the table, in K."""
+        return self.t_critical * (1 - self.reduced[0]**3)
+
+    def __call__(self, prop: str, temp=None, pressure=None):
+        """
+        Interpolate a property at a temperature or a saturation pressure.
+
+        Parameters
+        ----------
+        prop : str
+            Name of the property.
+        temp : float or array, optional
+            Temperature in K.
+        pressure : float or array, optional
+            Pressure in Pa, used if the temperature is not given.
+
+        Returns
+        -------
+        float or array
+            The value of the property, in pyGAPS units.
+        """
+        if prop not in self.values:
+            raise CalculationError(
+                f"Property '{prop}' is not tabulated for '{self.backend_name}'."
+            )
+        if temp is not None:
+            reduced = _reduced(temp, self.t_critical)
+        elif pressure is not None:
+            reduced = self._reduced_at(pressure)
+        else:
+            raise CalculationError("Neither pressure nor temperature specified.")
+
+        # Allow for rounding at the ends of the table
+        lower, upper = self.reduced[0] * (1 - 1e-9), self.reduced[-1] * (1 + 1e-9)
+        if numpy.any((reduced < lower) | (reduced > upper)):
+            raise CalculationError(
+                f"Temperature outside of the '{self.backend_name}' table range "
+                f"({self.t_min:.3f} K to {self.t_max:.3f} K)."
+            )
+
+        value = self._splines[prop](reduced)
+        if prop == 'saturation_pressure':
+            value = numpy.exp(value)
+        if not numpy.ndim(value):
+            return float(value)
+        return value
+
+    def saturation_temperature(self, pressure):
+        """
+        Interpolate the saturation temperature at a pressure.
+
+        Parameters
+        ----------
+        pressure : float or array
+            Pressure in Pa.
+
+        Returns
+        -------
+        float or array
+            Temperature in K.
+        """
+        temp = self.t_critical * (1 - self._reduced_at(pressure)**3)
+        if not numpy.ndim(temp):
+            return float(temp)
+        return temp
+
+    def _reduced_at(self, pressure):
+        """Reduced saturation temperature at a pressure."""
+        if 'reduced' not in self._splines:
+            raise CalculationError(
+                f"Saturation pressure is not tabulated for '{self.backend_name}'."
+            )
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            log_p = numpy.log(numpy.asarray(pressure, dtype=float))
+        log_p_sat = self._stored('saturation_pressure', self.values['saturation_pressure'])
+        if numpy.any((log_p < log_p_sat[-1]) | (log_p > log_p_sat[0])):
+            raise CalculationError(
+                f"Pressure outside of the '{self.backend_name}' table range."
+            )
+        return self._splines['reduced'](log_p)
+
+    @classmethod
+    def generate(
+        cls,
+        backend_name: str,
+        backend: str = 'HEOS',
+        rtol: float = 1e-6,
+        points: int = 33,
+        max_points: int = 4097,
+    ):
+        """
+        Generate a table of saturation properties through CoolProp.
+
+        The grid is refined until interpolated values at the midpoints of
+        the grid are within the tolerance of the equation of state, for all
+        properties available for the fluid.
+
+        Parameters
+        ----------
+        backend_name : str
+            The CoolProp name of the fluid.
+        backend : str, optional
+            The CoolProp backend to calculate properties with, defaults to HEOS.
+        rtol : float, optional
+            Maximum relative error of the interpolated properties.
+        points : int, optional
+            Number of points of the initial grid.
+        max_points : int, optional
+            Maximum number of points of the grid.
+
+        Returns
+        -------
+        PropertyTable
+            The generated table.
+        """
+        CP = coolprop()
+        if CP is None:
+            raise ParameterError("CoolProp is required to generate property tables.")
+        state = CP.AbstractState(backend, backend_name)
+        t_critical = state.T_critical()
+
+        reduced = numpy.linspace(
+            numpy.cbrt(_CRITICAL_MARGIN),
+            _reduced(state.Ttriple(), t_critical),
+            points,
+        )
+        values = _sample(state, t_critical * (1 - reduced**3))
+
+        while True:
+            table = cls(backend_name, t_critical, reduced, values)
+
+            # Compare against the equation of state between grid points
+            midpoints = (reduced[1:] + reduced[:-1]) / 2
+            temps = t_critical * (1 - midpoints**3)
+            mid_values = _sample(state, temps, values)
+            errors = {
+                prop: float(numpy.max(numpy.abs(table(prop, temps) / val - 1)))
+                for prop, val in mid_values.items()
+            }
+            if 'saturation_pressure' in mid_values:
+                errors['saturation_temperature'] = float(
+                    numpy.max(
+                        numpy.abs(
+                            table.saturation_temperature(mid_values['saturation_pressure']) / temps -
+                            1
+                        )
+                    )
+                )
+
+            if max(errors.values()) <= rtol:
+                break
+            if 2 * reduced.size - 1 > max_points:
+                logger.warning(
+                    f"Property table for '{backend_name}' has a maximum relative error "
+                    f"of {max(errors.values()):.2e}, above the requested {rtol:.2e}."
+                )
+                break
+
+            # Refine by adding the midpoints to the grid
+            reduced = _interleave(reduced, midpoints)
+            values = {prop: _interleave(values[prop], mid_values[prop]) for prop in values}
+
+        metadata = {
+            'backend': backend,
+            'coolprop_version': CP.__version__,
+            'rtol': rtol,
+        }
+        return cls(backend_name, t_critical, reduced, values, errors, metadata)
+
+    def to_file(self, path):
+        """
+        Save the table as a compressed numpy archive.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the file to write.
+        """
+        numpy.savez_compressed(
+            path,
+            version=TABLE_VERSION,
+            backend_name=self.backend_name,
+            t_critical=self.t_critical,
+            reduced=self.reduced,
+            errors=json.dumps(self.errors),
+            metadata=json.dumps(self.metadata),
+            **{f"value_{prop}": val for prop, val in self.values.items()},
+        )
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a table saved with ``to_file``.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the file to read.
+
+        Returns
+        -------
+        PropertyTable
+            The stored table.
+        """
+        with numpy.load(path, allow_pickle=False) as data:
+            if int(data['version']) != TABLE_VERSION:
+                raise ParameterError(
+                    f"Property table '{path}' is version {int(data['version'])}, "
+                    f"expected version {TABLE_VERSION}."
+                )
+            return cls(
+                str(data['backend_name']),
+                float(data['t_critical']),
+                data['reduced'],
+                {
+                    key[len("value_"):]: data[key]
+                    for key in data.files if key.startswith("value_")
+                },
+                json.loads(str(data['errors'])),
+                json.loads(str(data['metadata'])),
+            )
+
+
+def _sample(state, temps, previous: dict = None):
+    """Calculate tabulated properties at each temperature, dropping those which fail."""
+    props = TABLE_PROPERTIES if previous is None else list(previous)
+    values = {}
+    for prop in props:
+        try:
+            values[prop] = numpy.array([
+                calculate_property(state, prop, temp=temp) for temp in temps
+            ])
+        except ValueError as err:
+            if previous is not None:
+                raise
+            logger.info(f"Property '{prop}' is not tabulated: {err}")
+    return values
+
+
+def _interleave(values, midpoints):
+    """Insert midpoints between consecutive values."""
+    result = numpy.empty(values.size + midpoints.size)
+    result[0::2] = values
+    result[1::2] = midpoints
+    return result
+
+
+def _table_name(backend_name: str) -> str:
+    """File name of a property table."""
+    return f"{backend_name}.v{TABLE_VERSION}.npz"
+
+
+def property_table(backend_name: str, generate: bool = True) -> PropertyTable:
+    """
+    Get the property table of a fluid.
+
+    Tables are searched in the locations of ``pygaps.data.PROPERTY_TABLES``,
+    and generated and stored in the user cache if not found.
+
+    Parameters
+    ----------
+    backend_name : str
+        The CoolProp name of the fluid.
+    generate : bool, optional
+        Whether to generate the table if it does not exist.
+
+    Returns
+    -------
+    PropertyTable
+        The property table of the fluid.
+    """
+    table = _LOADED.get(backend_name)
+    if table is not None:
+        return table
+
+    for directory in PROPERTY_TABLES:
+        path = directory / _table_name(backend_name)
+        if path.is_file():
+            table = PropertyTable.from_file(path)
+            break
+    else:
+        if not generate:
+            raise ParameterError(f"No property table exists for '{backend_name}'.")
+        logger.info(f"Generating property table for '{backend_name}'.")
+        table = PropertyTable.generate(backend_name)
+        try:
+            save_property_table(table)
+        except OSError as err:
+            logger.warning(f"Could not save property table for '{backend_name}': {err}")
+
+    _LOADED[backend_name] = table
+    return table
+
+
+def save_property_table(table: PropertyTable, directory=None):
+    """
+    Save a property table where it can be found by ``property_table``.
+
+    Parameters
+    ----------
+    table : PropertyTable
+        The table to save.
+    directory : str or Path, optional
+        Directory to save in, defaults to the user cache.
+    """
+    directory = PROPERTY_TABLES[0] if directory is None else Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    table.to_file(directory / _table_name(table.backend_name))
+
+
+def generate_property_tables(adsorbates: list = None, directory=None, **kwargs):
+    """
+    Generate and save property tables for several adsorbates, for
+    example to use on machines where CoolProp is slow or unavailable.
+
+    Parameters
+    ----------
+    adsorbates : list[Adsorbate], optional
+        Adsorbates to generate tables for, defaults to all
+        adsorbates with a thermodynamic backend.
+    directory : str or Path, optional
+        Directory to save in, defaults to the user cache.
+    kwargs
+        Passed to ``PropertyTable.generate``.
+
+    Returns
+    -------
+    list[str]
+        The fluids for which tables were generated.
+    """
+    if adsorbates is None:
+        from pygaps.data import ADSORBATE_LIST
+        adsorbates = ADSORBATE_LIST
+
+    generated = []
+    for adsorbate in adsorbates:
+        backend_name = adsorbate.properties.get('backend_name')
+        if backend_name is None or backend_name in generated:
+            continue
+        try:
+            table = PropertyTable.generate(backend_name, **kwargs)
+        except ValueError as err:
+            logger.warning(f"Could not generate property table for '{backend_name}': {err}")
+            continue
+        save_property_table(table, directory)
+        _LOADED[backend_name] = table
+        generated.append(backend_name)
+    return generated
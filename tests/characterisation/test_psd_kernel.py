@@ -21,6 +21,7 @@ import pytest
 import pygaps.characterisation.psd_kernel as psdk
 import pygaps.parsing as pgp
 import pygaps.utilities.exceptions as pgEx
+from pygaps.data import KERNELS
 
 from ..test_utils import mpl_cleanup
 from .conftest import DATA
@@ -63,6 +64,58 @@ class TestPSDKernel():
 
         assert np.isclose(principal_peak, sample['psd_micro_pore_size'], err_relative, err_absolute)
 
+    def test_psd_dft_nnls(self):
+        """Check the kernel contributions are fit as non-negative least squares."""
+        kernel_matrix = np.array([[1, 0], [1, 1], [0, 1]], dtype=float)
+
+        assert np.allclose(psdk._kernel_nnls(kernel_matrix, np.array([1, 3, 2])), [1, 2])
+        assert np.all(psdk._kernel_nnls(kernel_matrix, np.array([1, 0, -1])) >= 0)
+
+        # regularisation shrinks the contributions
+        regularised = psdk._kernel_nnls(kernel_matrix, np.array([1, 3, 2]), 1)
+        assert np.all(regularised < [1, 2])
+
+    @pytest.mark.parametrize('regularisation', [0.01, 'gcv', 'l-curve'])
+    def test_psd_dft_regularisation(self, regularisation, data_char_path):
+        """Test psd calculation with a regularised fit."""
+        sample = DATA['MCM-41']
+        filepath = data_char_path / sample['file']
+        isotherm = pgp.isotherm_from_json(filepath)
+
+        result_dict = psdk.psd_dft(isotherm, regularisation=regularisation)
+        assert np.all(np.isfinite(result_dict['pore_distribution']))
+
+    def test_psd_dft_regularisation_checks(self):
+        """Checks for invalid regularisation parameters."""
+        kernel_path = KERNELS['DFT-N2-77K-carbon-slit']
+        with pytest.raises(pgEx.ParameterError):
+            psdk.psd_dft_kernel_fit([0.1, 0.2], [1, 2], kernel_path, regularisation='unknown')
+        with pytest.raises(pgEx.ParameterError):
+            psdk.psd_dft_kernel_fit([0.1, 0.2], [1, 2], kernel_path, regularisation=-1)
+
+    def test_psd_dft_batch(self, data_char_path):
+        """Test batch psd calculation matches individual calculations."""
+        samples = [sample for sample in DATA.values() if 'psd_dft_pore_size' in sample]
+        isotherms = [pgp.isotherm_from_json(data_char_path / sample['file']) for sample in samples]
+        assert len(samples) == 3
+        isotherms.append(isotherms[0])  # same pressures are fit together
+
+        result_dict = psdk.psd_dft_batch(isotherms)
+        assert result_dict['pore_distribution'].shape == (
+            len(isotherms), len(result_dict['pore_widths'])
+        )
+
+        for isotherm, dist, loading in zip(
+            isotherms, result_dict['pore_distribution'], result_dict['kernel_loading']
+        ):
+            single = psdk.psd_dft(isotherm)
+            assert np.allclose(single['pore_widths'], result_dict['pore_widths'])
+            assert np.allclose(single['pore_distribution'], dist)
+            assert np.allclose(single['kernel_loading'], loading)
+
+        with pytest.raises(pgEx.ParameterError):
+            psdk.psd_dft_batch([])
+
     @mpl_cleanup
     def test_psd_dft_verbose(self, data_char_path):
         """Test verbosity."""
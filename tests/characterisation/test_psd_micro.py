@@ -90,6 +90,21 @@ class TestPSDMicro():
             0.001
         )
 
+        # all points are solved at once, stopping after the first unrealistic size
+        widths = pmic._solve_hk([0.5, 1, 2, 1e6, 3], lambda x: np.log(x), 0.1, 1)
+        assert np.allclose(widths, [0.5, 1, 2, 50])
+
+    def test_psd_micro_series(self):
+        """Check the cylindrical series is summed up to the pore-dependent term"""
+        a_ks, b_ks = pmic._sf_coefficients()
+        coeffs = np.stack((a_ks, b_ks), axis=1)
+        x = np.array([0.2, 0.5])
+        a_sum, b_sum = pmic._sf_series(x, [3, 10], coeffs)
+
+        for x_val, terms, a_val, b_val in zip(x, [3, 10], a_sum, b_sum):
+            assert np.isclose(a_val, sum(a_ks[k] * x_val**k for k in range(terms)))
+            assert np.isclose(b_val, sum(b_ks[k] * x_val**k for k in range(terms)))
+
     def test_psd_micro_hk(self):
         """Test H-K psd model with blank arrays"""
 
@@ -114,6 +129,40 @@ class TestPSDMicro():
 
         pmic.psd_horvath_kawazoe_ry(x, x, 77, 'slit', N2_PROPS, PROPERTIES_CARBON, use_cy=True)
 
+    def test_psd_micro_curve_cache(self, tmp_path, monkeypatch):
+        """Test pore filling curves are reused in memory and from disk"""
+        monkeypatch.setattr(pmic, "HK_CURVES", tmp_path)
+        monkeypatch.setattr(pmic, "_CURVES", {})
+
+        x = [0.001, 0.002, 0.005]
+        y = [1, 2, 3]
+        calls = []
+
+        def potential(l_pore):
+            calls.append(l_pore)
+            return np.log(l_pore)
+
+        key = pmic._curve_key('HK', 'slit', 77, N2_PROPS, PROPERTIES_CARBON)
+        assert key != pmic._curve_key('HK', 'slit', 87, N2_PROPS, PROPERTIES_CARBON)
+
+        widths = pmic._solve_hk(x, potential, 0.1, 1, key, True)
+        assert np.allclose(pmic._solve_hk(x, potential, 0.1, 1, key, True), widths)
+        assert len(calls) == 1
+        assert (tmp_path / f"{key}.npz").is_file()
+
+        # a new session reads the curve from disk
+        monkeypatch.setattr(pmic, "_CURVES", {})
+        assert np.allclose(pmic._solve_hk(x, potential, 0.1, 1, key, True), widths)
+        assert len(calls) == 1
+
+        # same results as without the cache
+        result = pmic.psd_horvath_kawazoe(x, y, 77, 'slit', N2_PROPS, PROPERTIES_CARBON)
+        cached = pmic.psd_horvath_kawazoe(
+            x, y, 77, 'slit', N2_PROPS, PROPERTIES_CARBON, cache_curve=True
+        )
+        for res, res_cached in zip(result, cached):
+            assert np.allclose(res, res_cached)
+
     @pytest.mark.parametrize('sample', DATA.values())
     def test_psd_micro(self, sample, data_char_path):
         """Test psd calculation with several model isotherms"""
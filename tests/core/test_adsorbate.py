@@ -1,7 +1,9 @@
 """Tests relating to the Adsorbate class."""
 
+import pickle
 import warnings
 
+import numpy
 import pytest
 
 import pygaps
@@ -25,6 +27,14 @@ class TestAdsorbate():
         assert 'i' + ads == 'iTest'
         assert hash(ads) == hash('Test')
 
+    def test_adsorbate_pickle(self):
+        """Check adsorbates with a thermodynamic backend can be pickled."""
+        ads = pygaps.Adsorbate.find('nitrogen')
+        ads.backend
+        new_ads = pickle.loads(pickle.dumps(ads))
+        assert new_ads == ads
+        assert new_ads.molar_mass() == ads.molar_mass()
+
     def test_adsorbate_alias(self):
         """Aliasing tests."""
         ads = pygaps.Adsorbate(name='Test', alias=['Test2'])
@@ -73,6 +83,26 @@ class TestAdsorbate():
         assert ads == 'nitrogen'
         assert ads == 'Nitrogen'
 
+    def test_adsorbate_find_index(self):
+        """Check the name index follows changes to the adsorbate list."""
+        ads = pygaps.Adsorbate('Indexed', alias=['IDX'], store=True)
+        assert pygaps.Adsorbate.find('idx') is ads
+        assert pygaps.Adsorbate.find('INDEXED') is ads
+
+        # Earlier adsorbates take precedence
+        duplicate = pygaps.Adsorbate('Duplicate', alias=['idx'])
+        pygaps.ADSORBATE_LIST.append(duplicate)
+        assert pygaps.Adsorbate.find('idx') is ads
+        assert pygaps.Adsorbate.find('duplicate') is duplicate
+
+        pygaps.ADSORBATE_LIST.remove(ads)
+        assert pygaps.Adsorbate.find('idx') is duplicate
+        with pytest.raises(ParameterError):
+            pygaps.Adsorbate.find('indexed')
+        pygaps.ADSORBATE_LIST.remove(duplicate)
+        with pytest.raises(ParameterError):
+            pygaps.Adsorbate.find('idx')
+
     def test_adsorbate_formula(self):
         """Check that formula is correctly latexed."""
         ads = pygaps.Adsorbate.find('N2')
@@ -131,6 +161,59 @@ class TestAdsorbate():
             adsorbate_data.get('enthalpy_liquefaction'), 0.001
         )
 
+    def test_adsorbate_property_cache(self):
+        """Check calculated properties are cached until the backend changes."""
+        ads = pygaps.Adsorbate.find('nitrogen')
+        ads.property_cache_clear()
+        p_sat = ads.saturation_pressure(77.355)
+        assert ads.saturation_pressure(77.355) == p_sat
+        assert ads.liquid_density(77.355) == ads.liquid_density(77.355)
+        info = ads.property_cache_info()
+        assert info['hits'] == 2
+        assert info['misses'] == 2
+        assert info['size'] == 2
+        assert info['backend'] == pygaps.thermodynamic_backend()
+
+        ads.compressibility(300, 1e5)
+        assert ads.compressibility(300, 1e5) == pytest.approx(1, 0.01)
+        assert ads.property_cache_info()['size'] == 3
+
+        ads.property_cache_clear()
+        assert ads.property_cache_info()['size'] == 0
+        assert ads.saturation_pressure(77.355) == p_sat
+
+        # changing the backend discards cached values
+        misses = ads.property_cache_info()['misses']
+        try:
+            pygaps.backend_use_coolprop(tabular='BICUBIC')
+            assert ads.saturation_pressure(77.355) == pytest.approx(p_sat, 1e-3)
+            info = ads.property_cache_info()
+            assert info['backend'] == 'BICUBIC&HEOS'
+            assert info['misses'] == misses + 1
+            assert info['size'] == 1
+        finally:
+            pygaps.backend_use_coolprop()
+        ads.saturation_pressure(77.355)
+        assert ads.property_cache_info()['backend'] == 'HEOS'
+        assert ads.property_cache_info()['misses'] == misses + 2
+
+    def test_adsorbate_array_props(self):
+        """Check properties can be calculated for arrays of state points."""
+        ads = pygaps.Adsorbate.find('nitrogen')
+        temps = [70, 75, 75, 80]
+        assert ads.saturation_pressure(temps) == pytest.approx([
+            ads.saturation_pressure(t) for t in temps
+        ])
+        assert ads.liquid_density(numpy.array(temps)).shape == (4, )
+        pressures = numpy.array([[1e4, 5e4], [1e5, numpy.nan]])
+        enthalpy = ads.enthalpy_vaporisation(press=pressures)
+        assert enthalpy.shape == (2, 2)
+        assert numpy.isnan(enthalpy[1, 1])
+        assert enthalpy[0, 1] == pytest.approx(ads.enthalpy_vaporisation(press=5e4))
+        assert ads.compressibility(300, pressures[0]) == pytest.approx([
+            ads.compressibility(300, p) for p in pressures[0]
+        ])
+
     def test_adsorbate_miss_named_props(self):
         """Test warning/error if properties cannot be calculated + are missing."""
         temp = 77.355
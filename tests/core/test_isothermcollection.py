@@ -0,0 +1,129 @@
+"""Tests relating to the IsothermCollection class."""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.utilities.exceptions as pgEx
+from pygaps.utilities.sqlite_db_creator import db_create
+
+
+@pytest.fixture(scope='function')
+def basic_collection(basic_pointisotherm):
+    """Create a collection of isotherms from basic data."""
+    second = basic_pointisotherm.to_dict()
+    second['temperature'] = 200.0
+    second['pressure_unit'] = 'kPa'
+    isotherms = [
+        basic_pointisotherm,
+        pygaps.PointIsotherm(
+            pressure=[10, 20, 30, 40],
+            loading=[0.5, 1.0, 3.0, 4.0],
+            **second,
+        ),
+    ]
+    return pygaps.IsothermCollection(isotherms)
+
+
+@pytest.mark.core
+class TestIsothermCollection():
+    """Test the IsothermCollection class."""
+    def test_collection_create(self, basic_pointisotherm, basic_collection):
+        """Check collection can be created and members recovered."""
+        assert len(basic_collection) == 2
+        assert list(basic_collection.lengths) == [8, 4]
+        assert basic_collection[0] == basic_pointisotherm
+        assert basic_collection[-1].temperature == 200.0
+        assert len(basic_collection.to_isotherms()) == 2
+
+        sub = basic_collection[[1]]
+        assert isinstance(sub, pygaps.IsothermCollection)
+        assert sub[0] == basic_collection[1]
+
+        with pytest.raises(IndexError):
+            basic_collection[2]
+        with pytest.raises(pgEx.ParameterError):
+            pygaps.IsothermCollection([basic_pointisotherm.to_dict()])
+
+    def test_collection_metadata(self, basic_collection):
+        """Check metadata table and filtering."""
+        metadata = basic_collection.metadata
+        assert list(metadata['temperature']) == [100.0, 200.0]
+        assert list(metadata['material']) == ['TEST', 'TEST']
+
+        assert len(basic_collection.filter(temperature=200.0)) == 1
+        assert len(basic_collection.filter(temperature=[100.0, 200.0])) == 2
+        assert len(basic_collection.filter(pressure_unit='Pa')) == 0
+        assert len(basic_collection.filter(not_a_param=1)) == 0
+
+    def test_collection_convert(self, basic_collection, use_adsorbate, use_material):
+        """Check bulk conversion matches converting each isotherm."""
+        isotherms = basic_collection.to_isotherms()
+        basic_collection.convert(
+            pressure_unit='Pa',
+            loading_basis='mass',
+            loading_unit='g',
+            material_basis='volume',
+            material_unit='cm3',
+        )
+        for isotherm, converted in zip(isotherms, basic_collection):
+            isotherm.convert(
+                pressure_unit='Pa',
+                loading_basis='mass',
+                loading_unit='g',
+                material_basis='volume',
+                material_unit='cm3',
+            )
+            assert isotherm.units == converted.units
+            assert numpy.allclose(isotherm.pressure(), converted.pressure())
+            assert numpy.allclose(isotherm.loading(), converted.loading())
+
+        assert set(basic_collection.metadata['pressure_unit']) == {'Pa'}
+
+    @pytest.mark.parametrize('branch', ['ads', 'des'])
+    def test_collection_interpolation(self, basic_collection, branch):
+        """Check interpolation of all isotherms matches each isotherm."""
+        points = [0.5, 1.5, 3.2, 5.5, 25, 100]
+        loading = basic_collection.loading_at(points, branch=branch)
+        pressure = basic_collection.pressure_at(points, branch=branch)
+        assert loading.shape == (2, len(points))
+
+        for row, isotherm in enumerate(basic_collection):
+            if not isotherm.has_branch(branch):
+                assert numpy.isnan(loading[row]).all()
+                continue
+            for col, point in enumerate(points):
+                for result, func in [
+                    (loading, isotherm.loading_at),
+                    (pressure, isotherm.pressure_at),
+                ]:
+                    try:
+                        expected = func(point, branch=branch)
+                    except (pgEx.CalculationError, ValueError):
+                        assert numpy.isnan(result[row, col])
+                    else:
+                        assert result[row, col] == pytest.approx(expected)
+
+        assert basic_collection.loading_at(2.5).shape == (2, )
+        assert basic_collection.loading_at([[2.5], [25]])[:, 0] == pytest.approx([2.5, 2.0])
+
+    def test_collection_json(self, basic_collection, tmp_path_factory):
+        """Check collection can be saved and read from json."""
+        path = tmp_path_factory.mktemp('json') / 'collection.json'
+        basic_collection.to_json(path)
+        new_collection = pygaps.IsothermCollection.from_json(path)
+        assert list(new_collection) == list(basic_collection)
+
+    def test_collection_db(self, basic_collection, tmp_path):
+        """Check collection can be uploaded to and read from a database."""
+        path = tmp_path / 'collection.db'
+        db_create(path)
+        basic_collection.to_db(db_path=path)
+        new_collection = pygaps.IsothermCollection.from_db(db_path=path)
+
+        assert len(new_collection) == len(basic_collection)
+        for isotherm in basic_collection:
+            new_isotherm = new_collection.filter(temperature=isotherm.temperature)[0]
+            assert new_isotherm == isotherm
+            assert new_isotherm.units == isotherm.units
+            assert numpy.allclose(new_isotherm.loading(), isotherm.loading())
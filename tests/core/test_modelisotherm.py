@@ -1,5 +1,8 @@
 """Tests relating to the ModelIsotherm class."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
 import pandas
 import pytest
 from pandas.testing import assert_series_equal
@@ -142,6 +145,25 @@ class TestModelIsotherm():
                 isotherm, model=['Henry', 'DummyModel'], verbose=True
             )
 
+    def test_isotherm_create_guess_parallel(self, data_char_path):
+        """Check parallel and stopped guesses are deterministic."""
+        isotherm = pgp.isotherm_from_json(data_char_path / DATA['MCM-41']['file'])
+        models = ['Henry', 'Langmuir', 'DSLangmuir', 'BET']
+
+        sequential = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=models)
+        parallel = pygaps.ModelIsotherm.from_pointisotherm(isotherm, model=models, n_jobs=3)
+        assert sequential.model.name == parallel.model.name
+        assert sequential.model.params == parallel.model.params
+
+        stopped = pygaps.ModelIsotherm.from_pointisotherm(
+            isotherm, model=models, n_jobs=3, rmse_threshold=numpy.inf
+        )
+        assert stopped.model.name == 'Henry'
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pooled = pgm.model_iso(isotherm, model=models, executor=executor)
+        assert pooled.model.params == sequential.model.params
+
     ##########################
 
     @pytest.mark.parametrize(
@@ -266,6 +288,19 @@ class TestModelIsotherm():
         assert basic_modelisotherm.spreading_pressure_at(inp, **parameters
                                                          ) == pytest.approx(expected, 1e-5)
 
+    def test_isotherm_pressure_at_spreading_pressure(
+        self,
+        use_adsorbate,
+        basic_modelisotherm,
+    ):
+        """Check the inverse of the ModelIsotherm spreading pressure."""
+        pressures = numpy.array([0, 0.2, 0.5, 1, 2.5, 10])
+        spreading = basic_modelisotherm.spreading_pressure_at(pressures)
+        assert basic_modelisotherm.pressure_at_spreading_pressure(spreading) == pytest.approx(pressures)
+        assert basic_modelisotherm.pressure_at_spreading_pressure(
+            spreading[3], pressure_unit='Pa'
+        ) == pytest.approx(1e5)
+
     @mpl_cleanup
     def test_isotherm_print_parameters(self, basic_modelisotherm):
         """Checks isotherm can print its own info."""
@@ -1,11 +1,14 @@
 """Tests relating to the PointIsotherm class."""
 
+import numpy
 import pandas
 import pytest
 from pandas.testing import assert_series_equal
 
 import pygaps
+import pygaps.core.pointisotherm
 import pygaps.utilities.exceptions as pgEx
+from pygaps.units.converter_mode import c_pressure
 
 from ..test_utils import mpl_cleanup
 from .conftest import LOADING_AT_PARAM
@@ -67,6 +70,68 @@ class TestPointIsotherm():
                 **isotherm_param,
             )
 
+    def test_isotherm_create_compact(
+        self,
+        use_adsorbate,
+        isotherm_data,
+        isotherm_parameters,
+        basic_pointisotherm,
+    ):
+        """Check an isotherm stored as arrays behaves as a regular one."""
+        isotherm = pygaps.PointIsotherm(
+            isotherm_data=isotherm_data,
+            loading_key='loading',
+            pressure_key='pressure',
+            compact=True,
+            **isotherm_parameters
+        )
+        assert isotherm.compact
+        assert not basic_pointisotherm.compact
+        assert isotherm == basic_pointisotherm
+        assert isotherm.data(branch='des').equals(basic_pointisotherm.data(branch='des'))
+        assert isotherm.other_keys == basic_pointisotherm.other_keys
+        assert isotherm.has_branch('des')
+
+        for iso in (isotherm, basic_pointisotherm):
+            iso.convert_pressure(mode_to='relative')
+        assert isotherm.pressure(branch='des') == pytest.approx(
+            basic_pointisotherm.pressure(branch='des')
+        )
+        assert isotherm.loading(branch='des', indexed=True).equals(
+            basic_pointisotherm.loading(branch='des', indexed=True)
+        )
+        assert isotherm.other_data('enthalpy', limits=(4.5, None), indexed=True).equals(
+            basic_pointisotherm.other_data('enthalpy', limits=(4.5, None), indexed=True)
+        )
+        assert isotherm.spreading_pressure_at(0.5) == pytest.approx(
+            basic_pointisotherm.spreading_pressure_at(0.5)
+        )
+
+    def test_isotherm_compact_data_raw(
+        self,
+        use_adsorbate,
+        isotherm_data,
+        isotherm_parameters,
+    ):
+        """Check changes to the DataFrame of a compact isotherm are stored."""
+        isotherm = pygaps.PointIsotherm(
+            isotherm_data=isotherm_data,
+            loading_key='loading',
+            pressure_key='pressure',
+            compact=True,
+            **isotherm_parameters
+        )
+        pressure = isotherm.pressure()
+        loading = isotherm.loading()
+
+        isotherm.data_raw['pressure'] *= 2
+        assert isotherm.pressure() == pytest.approx(pressure * 2)
+        assert isotherm.loading() == pytest.approx(loading)
+
+        isotherm.data_raw['extra'] = 1
+        assert 'extra' in isotherm.other_keys
+        assert isotherm.compact
+
     def test_isotherm_id(self, basic_pointisotherm):
         """Check isotherm id works as intended."""
 
@@ -289,6 +354,69 @@ class TestPointIsotherm():
         """Check that the loading functions of a pointIsotherm return their specified parameter."""
         assert basic_pointisotherm.loading(**parameters)[0] == pytest.approx(expected, 1e-5)
 
+    def test_isotherm_ret_cached(
+        self,
+        use_adsorbate,
+        use_material,
+        basic_pointisotherm,
+        monkeypatch,
+    ):
+        """Check that converted data is reused and discarded when data changes."""
+        conversions = []
+
+        def counted_c_pressure(*args, **kwargs):
+            conversions.append(args)
+            return c_pressure(*args, **kwargs)
+
+        monkeypatch.setattr(pygaps.core.pointisotherm, "c_pressure", counted_c_pressure)
+
+        first = basic_pointisotherm.pressure(pressure_mode='relative')
+        assert basic_pointisotherm.pressure(pressure_mode='relative') == pytest.approx(first)
+        assert len(conversions) == 1
+        monkeypatch.undo()
+
+        # Conversion of the isotherm discards cached values
+        basic_pointisotherm.convert_pressure(unit_to='Pa')
+        assert basic_pointisotherm.pressure(pressure_mode='relative'
+                                            ) == pytest.approx(first, 1e-5)
+        assert basic_pointisotherm.pressure(branch='ads')[0] == pytest.approx(1e5)
+        basic_pointisotherm.convert_loading(unit_to='mol')
+        assert basic_pointisotherm.loading(branch='ads')[0] == pytest.approx(1e-3)
+
+        # As does replacing the data
+        basic_pointisotherm.data_raw = basic_pointisotherm.data_raw[:2]
+        assert len(basic_pointisotherm.pressure(branch='ads')) == 2
+
+    def test_isotherm_ret_cached_copy(self, basic_pointisotherm):
+        """Check that changing returned data does not change the cached views."""
+        pressure = basic_pointisotherm.pressure(pressure_unit='Pa')
+        pressure *= 2
+        assert basic_pointisotherm.pressure(pressure_unit='Pa') == pytest.approx(pressure / 2)
+
+        loading = basic_pointisotherm.loading(indexed=True)
+        loading[:] = -1
+        assert (basic_pointisotherm.loading(indexed=True) >= 0).all()
+
+    def test_isotherm_ret_cached_temperature(
+        self,
+        use_adsorbate,
+        use_material,
+        basic_pointisotherm,
+    ):
+        """Check that relative pressures follow changes in temperature or adsorbate."""
+        first = basic_pointisotherm.pressure(pressure_mode='relative')
+
+        basic_pointisotherm.temperature = basic_pointisotherm.temperature + 10
+        expected = [
+            p / basic_pointisotherm.adsorbate.saturation_pressure(
+                basic_pointisotherm.temperature,
+                unit=basic_pointisotherm.pressure_unit,
+            ) for p in basic_pointisotherm.pressure()
+        ]
+        changed = basic_pointisotherm.pressure(pressure_mode='relative')
+        assert changed == pytest.approx(expected, 1e-5)
+        assert changed[-1] < first[-1]
+
     def test_isotherm_ret_loading_indexed(
         self,
         basic_pointisotherm,
@@ -379,6 +507,73 @@ class TestPointIsotherm():
             **parameters,
         ) == pytest.approx(expected, 1e-5)
 
+    @pytest.mark.parametrize('kind', ['linear', 'nearest', 'zero', 'slinear', 'quadratic', 'cubic'])
+    @pytest.mark.parametrize('fill', [None, 4.0, (0, 20), 'extrapolate'])
+    def test_isotherm_interpolation_kinds(self, basic_pointisotherm, kind, fill):
+        """Check interpolation matches scipy interp1d and interpolators are reused."""
+        from scipy.interpolate import interp1d
+        pressure = basic_pointisotherm.pressure(branch='ads')
+        loading = basic_pointisotherm.loading(branch='ads')
+        points = numpy.linspace(pressure.min(), pressure.max(), 17)
+        if fill is not None:
+            points = numpy.concatenate([[0.5 * pressure.min()], points, [2 * pressure.max()]])
+        expected = interp1d(
+            pressure,
+            loading,
+            kind=kind,
+            fill_value=fill,
+            bounds_error=fill is None,
+        )(points)
+
+        result = basic_pointisotherm.loading_at(points, interpolation_type=kind, interp_fill=fill)
+        assert result == pytest.approx(expected)
+        interpolator = basic_pointisotherm.l_interpolator
+
+        # Alternating queries reuse the same interpolators
+        basic_pointisotherm.loading_at(points, interpolation_type='pchip', interp_fill=fill)
+        basic_pointisotherm.loading_at(points, interpolation_type=kind, interp_fill=fill)
+        assert basic_pointisotherm.l_interpolator is interpolator
+
+        if fill is None:
+            with pytest.raises(ValueError):
+                basic_pointisotherm.loading_at(2 * pressure.max(), interpolation_type=kind)
+
+        # Interpolators are rebuilt on conversion
+        basic_pointisotherm.convert_pressure(unit_to='Pa')
+        assert basic_pointisotherm.loading_at(
+            points * 1e5, interpolation_type=kind, interp_fill=fill
+        ) == pytest.approx(expected)
+        assert basic_pointisotherm.l_interpolator is not interpolator
+
+    def test_isotherm_interpolation_pchip(self, basic_pointisotherm):
+        """Check monotonic interpolation reproduces the data."""
+        points = numpy.linspace(1, 6, 21)
+        assert basic_pointisotherm.loading_at(points, interpolation_type='pchip') == pytest.approx(points)
+        assert basic_pointisotherm.pressure_at(points, interpolation_type='pchip') == pytest.approx(points)
+        assert basic_pointisotherm.loading_at(
+            [0, 10], interpolation_type='pchip', interp_fill='extrapolate'
+        ) == pytest.approx([0, 10])
+
+    def test_isotherm_pressure_at_monotonic(self, use_adsorbate, isotherm_parameters):
+        """Check pressure can be inverted on noisy, non-monotonic loading."""
+        isotherm = pygaps.PointIsotherm(
+            pressure=[1, 2, 3, 4, 5, 6],
+            loading=[1, 2, 1.8, 4, 5, 6],
+            **isotherm_parameters,
+        )
+        # The two violating points are pooled at their mean
+        assert isotherm.pressure_at(
+            [1, 1.9, 4], monotonic=True
+        ) == pytest.approx([1, 2.5, 4])
+        assert isotherm.pressure_at(3, monotonic=True) == pytest.approx(2.5 + 1.5 * 1.1 / 2.1)
+        assert isotherm.pressure_at(
+            [1.9, 5], monotonic=True, interpolation_type='pchip'
+        ) == pytest.approx([2.5, 5])
+        interpolator = isotherm.p_interpolator
+        isotherm.pressure_at(5)
+        isotherm.pressure_at(5, monotonic=True, interpolation_type='pchip')
+        assert isotherm.p_interpolator is interpolator
+
     @pytest.mark.parametrize(
         'inp, expected, parameters', [
             (1, 1, dict()),
@@ -399,6 +594,45 @@ class TestPointIsotherm():
         assert basic_pointisotherm.spreading_pressure_at(inp, **parameters
                                                          ) == pytest.approx(expected, 1e-5)
 
+    def test_isotherm_spreading_pressure_at_array(
+        self,
+        use_adsorbate,
+        basic_pointisotherm,
+    ):
+        """Check the spreading pressure is vectorized and reset on conversion."""
+        pressures = [0.5, 1, 2.5, 4, 6]
+        expected = [basic_pointisotherm.spreading_pressure_at(p) for p in pressures]
+        assert basic_pointisotherm.spreading_pressure_at(pressures) == pytest.approx(expected)
+
+        # Extrapolation must be explicit
+        with pytest.raises(pgEx.CalculationError):
+            basic_pointisotherm.spreading_pressure_at([1, 10])
+        assert basic_pointisotherm.spreading_pressure_at(
+            10, interp_fill=(0, 6)
+        ) == pytest.approx(expected[-1] + 6 * numpy.log(10 / 6))
+
+        # Integrator is rebuilt after conversion
+        basic_pointisotherm.convert_pressure(unit_to='Pa')
+        assert basic_pointisotherm.spreading_pressure_at([1e5, 4e5]
+                                                         ) == pytest.approx(expected[1:4:2])
+
+    def test_isotherm_pressure_at_spreading_pressure(
+        self,
+        use_adsorbate,
+        basic_pointisotherm,
+    ):
+        """Check the inverse of the spreading pressure."""
+        pressures = numpy.array([0, 0.2, 0.5, 1, 2.5, 4, 6])
+        spreading = basic_pointisotherm.spreading_pressure_at(pressures)
+        assert basic_pointisotherm.pressure_at_spreading_pressure(spreading) == pytest.approx(pressures)
+        assert basic_pointisotherm.pressure_at_spreading_pressure(spreading[2]) == pytest.approx(0.5)
+        assert basic_pointisotherm.pressure_at_spreading_pressure(
+            spreading[3], pressure_unit='Pa'
+        ) == pytest.approx(1e5)
+
+        with pytest.raises(pgEx.CalculationError):
+            basic_pointisotherm.pressure_at_spreading_pressure(spreading[-1] * 2)
+
     ##########################
 
     @pytest.mark.parametrize(
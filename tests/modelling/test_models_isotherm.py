@@ -15,6 +15,7 @@ tests/calculations/isotherm_model_data/*.txt folder.
 
 import numpy
 import pytest
+from scipy import integrate
 
 import pygaps.modelling as models
 import pygaps.utilities.exceptions as pgEx
@@ -103,6 +104,51 @@ class TestIsothermModels():
                 model.spreading_pressure(p), test_values['spreading_pressure'][i], 0.001
             )
 
+    @pytest.mark.parametrize("m_name", ["Toth", "DR", "DA", "JensenSeaton", "DSToth", "ChemiPhysisorption"])
+    def test_models_s_pressure_array(self, m_name):
+        """Test spreading pressure of numerically integrated models on arrays."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = dict(MODEL_DATA[m_name]['test_parameters'])
+        pressure = numpy.array([0, 1e-3, 0.1, 0.5, 0.9])
+
+        def integral():
+            return [0] + [integrate.quad(lambda x: model.loading(x) / x, 0, p)[0] for p in pressure[1:]]
+
+        s_pressure = model.spreading_pressure(pressure)
+        assert s_pressure.shape == pressure.shape
+        assert numpy.allclose(s_pressure, integral(), rtol=1e-6)
+        assert numpy.isclose(model.spreading_pressure(pressure[2]), s_pressure[2])
+
+        # cached values must not be used after a parameter change
+        param = model.param_names[0]
+        model.params[param] = model.params[param] * 2
+        assert numpy.allclose(model.spreading_pressure(pressure), integral(), rtol=1e-6)
+
+        # or after a change of temperature
+        if m_name in ["DR", "DA", "ChemiPhysisorption"]:
+            model.__init_parameters__({'temperature': 150})
+            assert numpy.allclose(model.spreading_pressure(pressure), integral(), rtol=1e-6)
+
+    @pytest.mark.parametrize("m_name", [key for key in MODEL_DATA if models.is_model_iast(key)])
+    def test_models_s_pressure_inverse(self, m_name):
+        """Test the inverse of the spreading pressure of each model."""
+
+        model = models.get_isotherm_model(m_name)
+        model.params = dict(MODEL_DATA[m_name]['test_parameters'])
+        pressure = numpy.array([0, 1e-3, 0.1, 0.5, 0.9])
+
+        s_pressure = model.spreading_pressure(pressure)
+        assert numpy.allclose(model.spreading_pressure_inverse(s_pressure), pressure, rtol=1e-10)
+        assert model.spreading_pressure_inverse(s_pressure[2]) == pytest.approx(pressure[2], rel=1e-10)
+        assert numpy.isnan(model.spreading_pressure_inverse(-1))
+
+        # cached values must not be used after a parameter change
+        param = model.param_names[0]
+        model.params[param] = model.params[param] * 2
+        s_pressure = model.spreading_pressure(pressure)
+        assert numpy.allclose(model.spreading_pressure_inverse(s_pressure), pressure, rtol=1e-10)
+
     @pytest.mark.parametrize("m_name", [key for key in MODEL_DATA])
     def test_models_fit_function(self, m_name):
         """Test each model's spreading fitting function."""
@@ -124,3 +170,124 @@ class TestIsothermModels():
         )
         # for param in param_real:
         #     assert numpy.isclose(model.params[param], param_real[param], 0.01)
+
+    @pytest.mark.parametrize("m_name", [key for key in MODEL_DATA])
+    def test_models_inverse(self, m_name):
+        """Test each model's inverse function on many points at once."""
+
+        model = models.get_isotherm_model(m_name)
+        model.__init_parameters__({'temperature': 77})
+        model.params = MODEL_DATA[m_name]['test_parameters']
+        test_values = MODEL_DATA[m_name]['test_values']
+
+        pressure = numpy.linspace(min(test_values['pressure']), max(test_values['pressure']), 500)
+        loading = model.loading(pressure)
+        assert numpy.allclose(model.pressure(loading), pressure, rtol=1e-6)
+        assert numpy.isclose(model.pressure(loading[100]), pressure[100], rtol=1e-6)
+
+    def test_bracketed_root(self):
+        """Test the element-wise root finding function."""
+        target = numpy.array([[0, 0.5], [2, 1e5]])
+        assert numpy.allclose(models.base_model.bracketed_root(numpy.sqrt, target), target**2)
+        assert models.base_model.bracketed_root(lambda x: x / (1 - x), 1, upper=1) == pytest.approx(0.5)
+        with pytest.raises(pgEx.CalculationError):
+            models.base_model.bracketed_root(lambda x: x / (1 + x), [0.5, 2])
+
+    @pytest.mark.parametrize("m_name", [key for key in MODEL_DATA])
+    def test_models_jacobian(self, m_name):
+        """Test each model's parameter derivatives against finite differences."""
+
+        model = models.get_isotherm_model(m_name)
+        model.__init_parameters__({'temperature': 77})
+        model.params = dict(MODEL_DATA[m_name]['test_parameters'])
+        test_values = MODEL_DATA[m_name]['test_values']
+
+        if model.calculates == 'loading':
+            func = model.loading
+            values = numpy.array(test_values['pressure'])
+            jacobian = model.loading_jacobian(values)
+        else:
+            func = model.pressure
+            values = numpy.array(test_values['loading'])
+            jacobian = model.pressure_jacobian(values)
+
+        assert jacobian.shape == (len(values), len(model.param_names))
+        for index, param in enumerate(model.param_names):
+            value = model.params[param]
+            step = 1e-6 * max(abs(value), 1e-3)
+            model.params[param] = value + step
+            upper = func(values)
+            model.params[param] = value - step
+            lower = func(values)
+            model.params[param] = value
+            assert numpy.allclose(jacobian[:, index], (upper - lower) / (2 * step), rtol=1e-4)
+
+    def test_models_fit_jacobian(self):
+        """Test fitting with analytical derivatives needs fewer model evaluations."""
+
+        pressure = numpy.linspace(0.01, 10, 30)
+        loading = 3 * 2 * pressure / (1 + 2 * pressure) + 1 * 0.05 * pressure / (1 + 0.05 * pressure)
+
+        evaluations = {}
+        for jac in [None, '2-point']:
+            model = models.get_isotherm_model(
+                'DSLangmuir',
+                pressure_range=(pressure.min(), pressure.max()),
+                loading_range=(loading.min(), loading.max()),
+            )
+            counter = []
+            model_loading = model.loading
+            model.loading = lambda p: counter.append(1) or model_loading(p)
+            model.fit(
+                pressure,
+                loading,
+                model.initial_guess(pressure, loading),
+                optimization_params={'jac': jac} if jac else None,
+            )
+            evaluations[jac] = len(counter)
+            assert model.rmse < 1e-6
+
+        assert evaluations[None] < evaluations['2-point']
+
+    def test_models_fit_batch(self):
+        """Test fitting a model to many isotherms at once."""
+        pressure = numpy.linspace(0.1, 10, 20)
+        loadings = [n * 2 * pressure / (1 + 2 * pressure) for n in [1, 2, 3, 4, 5]]
+        pressures = [pressure] * len(loadings)
+
+        table = models.fit_batch(pressures, loadings, 'Langmuir', chunk_size=2)
+        assert list(table.columns) == ['K', 'n_m', 'rmse']
+        assert numpy.allclose(table['n_m'], [1, 2, 3, 4, 5])
+        assert numpy.allclose(table['K'], 2)
+
+        parallel = models.fit_batch(
+            pressures,
+            loadings,
+            'Langmuir',
+            chunk_size=2,
+            n_jobs=2,
+        )
+        assert table.equals(parallel)
+
+        # a warm start worse than the previous fit is checked against a cold start
+        noisy = loadings[:2]
+        noisy[1] = noisy[1] + numpy.where(numpy.arange(20) % 2, 0.2, -0.2)
+        warm = models.fit_batch(pressures[:2], noisy, 'Langmuir')
+        cold = models.fit_batch(pressures[:2], noisy, 'Langmuir', warm_start=False)
+        assert warm.loc[1, 'rmse'] <= cold.loc[1, 'rmse'] * (1 + 1e-8)
+
+        table, isotherms = models.fit_batch(
+            pressures[:1],
+            loadings[:1],
+            'Langmuir',
+            isotherm_parameters={
+                'material': 'carbon',
+                'adsorbate': 'nitrogen',
+                'temperature': 77,
+            },
+            return_isotherms=True,
+        )
+        assert isotherms[0].model.params == table.loc[0, ['K', 'n_m']].to_dict()
+
+        with pytest.raises(pgEx.ParameterError):
+            models.fit_batch(pressures, loadings[:1], 'Langmuir')
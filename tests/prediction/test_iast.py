@@ -100,6 +100,117 @@ class TestIAST():
         pgi.iast_point_fraction(load_iast, [0.5, 0.5], 1, verbose=True)
 
 
+@pytest.mark.prediction
+class TestIASTGrid():
+    """Test vectorised IAST calculations."""
+    def test_iast_grid_checks(self, load_iast):
+        """Checks for built-in safeguards."""
+
+        ch4, c2h6 = load_iast
+
+        # Raises "not enough components error"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_grid([ch4], [[1]], 1)
+
+        # Raises "different dimensions of arrays"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_grid([ch4, c2h6], [[0.1, 0.2, 0.7]], 1)
+
+        # Raises "fractions do not add up to 1"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_grid([ch4, c2h6], [[0.1, 0.4]], 1)
+
+    @pytest.mark.parametrize('models', [False, True])
+    def test_iast_grid(self, load_iast, load_iast_models, models):
+        """Test grid results are the same as single point calculations."""
+
+        isotherms = load_iast_models if models else load_iast
+        fractions = numpy.array([[0.1, 0.9], [0.5, 0.5], [0.9, 0.1]])
+        pressures = numpy.array([0.5, 1, 2])
+
+        result = pgi.iast_grid(isotherms, fractions[:, None, :], pressures)
+        assert result['loading'].shape == (3, 3, 2)
+        assert result['converged'].all()
+
+        for i, fraction in enumerate(fractions):
+            for j, pressure in enumerate(pressures):
+                loading = pgi.iast_point_fraction(isotherms, fraction, pressure)
+                assert numpy.allclose(result['loading'][i, j], loading, rtol=1e-6)
+
+        fractions = result['adsorbed_mole_fraction']
+        assert numpy.allclose(fractions.sum(axis=-1), 1)
+        assert numpy.allclose(fractions[..., 0], result['loading'][..., 0] / result['loading'].sum(axis=-1))
+
+    def test_iast_grid_pure(self, load_iast_models):
+        """Test components which are not present in the gas phase."""
+
+        ch4, c2h6 = load_iast_models
+        result = pgi.iast_grid(load_iast_models, [[1, 0], [0, 1]], 2)
+        assert result['converged'].all()
+        assert numpy.allclose(result['loading'][0], [ch4.loading_at(2), 0])
+        assert numpy.allclose(result['loading'][1], [0, c2h6.loading_at(2)])
+
+    def test_iast_grid_failed(self, load_iast, caplog):
+        """Test points which require extrapolation are marked as failed."""
+
+        with caplog.at_level(logging.WARNING):
+            result = pgi.iast_grid(load_iast, [0.5, 0.5], [1, 1000])
+        assert caplog.records
+        assert list(result['converged']) == [True, False]
+        assert numpy.isnan(result['loading'][1]).all()
+
+
+@pytest.mark.prediction
+class TestIASTScreen():
+    """Test IAST screening of many materials."""
+    def test_iast_screen_checks(self, load_iast):
+        """Checks for built-in safeguards."""
+
+        ch4, c2h6 = load_iast
+
+        # Raises "different number of isotherms"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_screen([[ch4, c2h6], [ch4]], [0.5, 0.5], 1)
+
+        # Raises "different dimensions of arrays"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_screen([[ch4, c2h6]], [0.2, 0.3, 0.5], 1)
+
+        # Raises "different number of conditions"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.iast_screen([[ch4, c2h6]], [[0.5, 0.5], [0.2, 0.8]], [1, 2, 3])
+
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_iast_screen(self, load_iast, load_iast_models, n_jobs):
+        """Test screening gives the same results as each material."""
+
+        ch4, c2h6 = load_iast
+        virial = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Virial')
+        materials = {
+            'points': load_iast,
+            'models': load_iast_models,
+            'virial': [virial, c2h6],
+        }
+        fractions = [[0.2, 0.8], [0.5, 0.5]]
+        pressures = [1, 2]
+
+        table = pgi.iast_screen(materials, fractions, pressures, chunk_size=1, n_jobs=n_jobs)
+        assert len(table) == 6
+        assert list(table['material'].unique()) == list(materials)
+
+        for row in table.itertuples():
+            if row.material == 'virial':
+                assert not row.converged
+                assert 'Virial' in row.error
+                continue
+            loading = pgi.iast_point_fraction(
+                materials[row.material], fractions[row.condition], pressures[row.condition]
+            )
+            assert row.converged
+            assert numpy.allclose([row.loading0, row.loading1], loading)
+            assert row.selectivity == pytest.approx((row.x0 / row.y0) / (row.x1 / row.y1))
+
+
 @pytest.mark.modelling
 class TestReverseIAST():
     """Test reverse IAST calculations."""
@@ -124,6 +235,12 @@ class TestReverseIAST():
         ch4_m = pygaps.ModelIsotherm.from_pointisotherm(ch4, model='Virial')
         with pytest.raises(pgEx.ParameterError):
             pgi.reverse_iast([ch4_m, c2h6], [0.6, 0.4], 1)
+        with pytest.raises(pgEx.ParameterError):
+            pgi.reverse_iast_path([ch4_m, c2h6], [0.6, 0.4], 1)
+
+        # Raises "different number of points"
+        with pytest.raises(pgEx.ParameterError):
+            pgi.reverse_iast_path([ch4, c2h6], [[0.5, 0.5], [0.6, 0.4]], [1, 2, 3])
 
         # Warning "extrapolate outside range"
         with caplog.at_level(logging.WARNING):
@@ -156,6 +273,43 @@ class TestReverseIAST():
         assert numpy.isclose(ideal_gas_fraction[0], gas_fraction[0], atol=0.1)
         assert numpy.isclose(ideal_ads_fraction[0], actual_ads_fraction[0], atol=0.05)
 
+    @pytest.mark.parametrize('models', [False, True])
+    def test_reverse_iast_path(self, load_iast, load_iast_models, models):
+        """Test path results are the same as single point calculations."""
+
+        isotherms = load_iast_models if models else load_iast
+        fraction = numpy.linspace(0.1, 0.9, 9)
+        fractions = numpy.column_stack([fraction, 1 - fraction])
+        pressures = numpy.linspace(1, 0.2, 9)
+
+        result = pgi.reverse_iast_path(isotherms, fractions, pressures)
+        assert result['converged'].all()
+        assert (result['residual'] <= 1e-10).all()
+
+        for i, (fraction, pressure) in enumerate(zip(fractions, pressures)):
+            gas_fraction, loading = pgi.reverse_iast(isotherms, fraction, pressure)
+            assert numpy.allclose(result['gas_mole_fraction'][i], gas_fraction, atol=1e-6)
+            assert numpy.allclose(result['loading'][i], loading, rtol=1e-6)
+
+    def test_reverse_iast_path_continuation(self, load_iast_models):
+        """Test points which fail from the guess are traced from their neighbours."""
+
+        fraction = numpy.linspace(0.01, 0.99, 50)
+        fractions = numpy.column_stack([fraction, 1 - fraction])
+        result = pgi.reverse_iast_path(
+            load_iast_models,
+            fractions,
+            1,
+            gas_mole_fraction_guess=[0.001, 0.999],
+            max_iter=3,
+            warningoff=True,
+        )
+        assert result['converged'].all()
+        continued = result['iterations'] > result['iterations'].min()
+        assert continued.any()
+        gas_fraction, _ = pgi.reverse_iast(load_iast_models, fractions[continued][0], 1)
+        assert numpy.allclose(result['gas_mole_fraction'][continued][0], gas_fraction)
+
     @mpl_cleanup
     def test_reverse_iast_verbose(self, load_iast):
         """Test verbosity."""
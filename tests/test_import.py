@@ -0,0 +1,53 @@
+"""Tests the time and side effects of importing pyGAPS."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Maximum time to import pyGAPS, in seconds, only checked if set
+# as timings depend on the machine
+IMPORT_BUDGET = os.environ.get("PYGAPS_IMPORT_BUDGET")
+
+
+def _run(code, *args):
+    """Run code in a new interpreter."""
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.core
+def test_import_lazy():
+    """Check importing does not load the database or heavy dependencies."""
+    result = _run(
+        "import sys, pygaps; "
+        "print(pygaps.ADSORBATE_LIST.loaded, pygaps.MATERIAL_LIST.loaded, "
+        "'pandas' in sys.modules, 'scipy' in sys.modules, 'CoolProp' in sys.modules)"
+    )
+    assert result.stdout.split() == ['False', 'False', 'False', 'False', 'False']
+
+    result = _run(
+        "import pygaps; "
+        "print(len(pygaps.ADSORBATE_LIST) > 0, pygaps.PointIsotherm.__name__)"
+    )
+    assert result.stdout.split() == ['True', 'PointIsotherm']
+
+
+@pytest.mark.core
+@pytest.mark.skipif(IMPORT_BUDGET is None, reason="PYGAPS_IMPORT_BUDGET is not set")
+def test_import_time():
+    """Check importing stays within the time budget."""
+    result = _run("import pygaps", "-X", "importtime")
+    # Lines are "import time: self [us] | cumulative | imported package"
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "pygaps":
+            cumulative = int(fields[1])
+    assert cumulative is not None
+    assert cumulative / 1e6 < float(IMPORT_BUDGET)
@@ -17,6 +17,15 @@ class TestCoolProp():
         pygaps.backend_use_coolprop()
         assert previous_backend == pygaps.thermodynamic_backend()
 
+    def test_backend_tabular(self):
+        """Test if a tabular CoolProp backend can be selected."""
+        pygaps.backend_use_coolprop(tabular='bicubic')
+        assert pygaps.thermodynamic_backend() == 'BICUBIC&HEOS'
+        pygaps.backend_use_coolprop()
+        assert pygaps.thermodynamic_backend() == 'HEOS'
+        with pytest.raises(pgEx.ParameterError):
+            pygaps.backend_use_coolprop(tabular='unknown')
+
     def test_backend_names_coolprop(self):
         """Test if CoolProp can be called for database adsorbates."""
         for adsorbate in pygaps.ADSORBATE_LIST:
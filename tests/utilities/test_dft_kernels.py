@@ -0,0 +1,86 @@
+"""Tests DFT kernel storage and lookup."""
+
+import numpy
+import pandas
+import pytest
+from scipy import interpolate
+
+import pygaps.utilities.dft_kernels as dk
+import pygaps.utilities.exceptions as pgEx
+from pygaps.data import KERNELS
+
+KERNEL = 'DFT-N2-77K-carbon-slit'
+
+
+@pytest.fixture()
+def kernel_dir(tmp_path, monkeypatch):
+    """Look for user kernels in a temporary directory."""
+    monkeypatch.setattr(dk, "KERNEL_DIRECTORIES", [tmp_path])
+    monkeypatch.setattr(dk, "_LOADED", {})
+    return tmp_path
+
+
+@pytest.mark.utilities
+class TestDFTKernels():
+    """Test DFT kernels."""
+    def test_kernel_interpolation(self):
+        """Check all isotherms are interpolated as individual cubic splines."""
+        kernel = dk.DFTKernel.from_csv(KERNELS[KERNEL])
+        raw = pandas.read_csv(KERNELS[KERNEL], index_col=0)
+        pressure = numpy.geomspace(1e-5, 0.9, 20)
+
+        matrix = kernel(pressure)
+        assert matrix.shape == (20, len(raw.columns))
+        for column, size in enumerate(raw.columns[::20]):
+            pore = interpolate.interp1d(
+                numpy.concatenate(([0], raw.index)),
+                numpy.concatenate(([0], raw[size])),
+                kind='cubic',
+            )
+            assert numpy.allclose(matrix[:, column * 20], pore(pressure))
+
+        with pytest.raises(ValueError):
+            kernel([2])
+
+    def test_kernel_convert(self, kernel_dir):
+        """Check kernels converted to binary are identical and can be found."""
+        path = dk.convert_kernel(KERNELS[KERNEL], kernel_dir / "converted.npz")
+        kernel = dk.DFTKernel.from_csv(KERNELS[KERNEL])
+        converted = dk.get_kernel("converted")
+
+        assert dk.kernel_path("converted") == path
+        assert numpy.array_equal(converted.pore_widths, kernel.pore_widths)
+        assert numpy.array_equal(converted(kernel.pressure), kernel(kernel.pressure))
+        assert dk.get_kernel(str(path)) is converted
+
+        with pytest.raises(pgEx.ParameterError):
+            dk.get_kernel("missing")
+
+    def test_kernel_registry_size(self, kernel_dir, monkeypatch):
+        """Check only recently used kernels are kept in memory."""
+        monkeypatch.setattr(dk, "_KERNEL_CACHE_SIZE", 2)
+        for name in ["first", "second", "third"]:
+            dk.convert_kernel(KERNELS[KERNEL], kernel_dir / f"{name}.npz")
+
+        first = dk.get_kernel("first")
+        dk.get_kernel("second")
+        assert dk.get_kernel("first") is first
+        dk.get_kernel("third")
+        assert len(dk._LOADED) == 2
+        assert dk.get_kernel("first") is first
+        assert kernel_dir / "second.npz" not in dk._LOADED
+
+    def test_kernel_projection(self):
+        """Check kernel matrices and their factorisation are cached by pressure."""
+        kernel = dk.DFTKernel.from_csv(KERNELS[KERNEL])
+        pressure = numpy.geomspace(1e-5, 0.9, 50)
+
+        projection = kernel.projection(pressure)
+        assert numpy.allclose(projection.matrix, kernel(pressure))
+        assert numpy.allclose(projection.q @ projection.r, projection.matrix)
+        assert numpy.allclose(
+            projection.singular, numpy.linalg.svd(projection.matrix, compute_uv=False)
+        )
+
+        assert kernel.projection(pressure.copy()) is projection
+        assert kernel.projection(pressure[:-1]) is not projection
@@ -0,0 +1,72 @@
+"""Tests precomputed thermodynamic property tables."""
+
+import numpy
+import pytest
+
+import pygaps
+import pygaps.utilities.exceptions as pgEx
+import pygaps.utilities.property_tables as pt
+
+
+@pytest.fixture()
+def table_dir(tmp_path, monkeypatch):
+    """Keep generated tables in a temporary directory."""
+    monkeypatch.setattr(pt, "PROPERTY_TABLES", [tmp_path])
+    monkeypatch.setattr(pt, "_LOADED", {})
+    return tmp_path
+
+
+@pytest.mark.utilities
+class TestPropertyTables():
+    """Test property tables."""
+    def test_table_generate(self, table_dir):
+        """Check tables are within tolerance of the equation of state."""
+        ads = pygaps.Adsorbate.find('nitrogen')
+        table = pt.PropertyTable.generate(ads.backend_name, rtol=1e-5)
+        assert max(table.errors.values()) <= 1e-5
+
+        temps = numpy.linspace(table.t_min + 0.1, table.t_max - 0.1, 7)
+        for prop in ['saturation_pressure', 'liquid_density', 'surface_tension']:
+            expected = [getattr(ads, prop)(temp) for temp in temps]
+            assert table(prop, temps) == pytest.approx(expected, 1e-5)
+        p_sat = ads.saturation_pressure(77.355)
+        assert table.saturation_temperature(p_sat) == pytest.approx(77.355, 1e-5)
+        assert table('enthalpy_liquefaction', pressure=p_sat) == pytest.approx(
+            ads.enthalpy_liquefaction(77.355), 1e-5
+        )
+
+        with pytest.raises(pgEx.CalculationError):
+            table('saturation_pressure', table.t_critical + 1)
+        with pytest.raises(pgEx.CalculationError):
+            table('compressibility', 77)
+
+    def test_table_file(self, table_dir):
+        """Check tables can be saved, found and checked for version."""
+        table = pt.PropertyTable.generate('Argon', rtol=1e-4)
+        pt.save_property_table(table)
+        loaded = pt.property_table('Argon', generate=False)
+        assert loaded.errors == table.errors
+        assert loaded('saturation_pressure', 87) == pytest.approx(table('saturation_pressure', 87))
+
+        with pytest.raises(pgEx.ParameterError):
+            pt.property_table('Krypton', generate=False)
+
+        path = table_dir / pt._table_name('Argon')
+        data = dict(numpy.load(path))
+        data['version'] = pt.TABLE_VERSION + 1
+        numpy.savez(path, **data)
+        with pytest.raises(pgEx.ParameterError):
+            pt.PropertyTable.from_file(path)
+
+    def test_table_backend(self, table_dir):
+        """Check adsorbates use tables when selected as the backend."""
+        ads = pygaps.Adsorbate.find('nitrogen')
+        pt.generate_property_tables([ads], rtol=1e-5)
+        expected = ads.saturation_pressure([70, 77, 90])
+        pygaps.backend_use_tables()
+        try:
+            assert ads.saturation_pressure([70, 77, 90]) == pytest.approx(expected, 1e-5)
+            assert ads.molar_mass() == pytest.approx(28.013, 1e-3)
+            assert ads.compressibility(300, 1e5) == pytest.approx(1, 0.01)
+        finally:
+            pygaps.backend_use_coolprop()